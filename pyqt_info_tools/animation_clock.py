@@ -0,0 +1,132 @@
+from PyQt5.QtCore import QObject, QTimer, QElapsedTimer, Qt
+
+
+class AnimationClock(QObject):
+    """
+    One timer for all animations (waiting spinners). Each tick calls the animations which are due; animations whose
+    window is hidden, minimized or not exposed are skipped. The timer runs only while animations are registered.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super(AnimationClock, self).__init__(parent)
+        self._animations = {}           # id(widget) -> [widget, tick_fcn, interval_ms, next_tick_ms, connection]
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.CoarseTimer)
+        self._timer.timeout.connect(self.tick)
+
+        self.ticks = 0                  # timer callbacks
+        self.animation_ticks = 0        # animations called
+        self.skipped = 0                # animations skipped because their window was not exposed
+        self.exposed = 0                # animations exposed at the last tick
+
+    @property
+    def active(self):
+        return self._animations.__len__()
+
+    def register(self, widget, tick_fcn, interval_ms):
+        """
+        Calls tick_fcn every interval_ms while widget is exposed, until unregister is called or widget is destroyed.
+
+        :param widget: the animated widget
+        :param tick_fcn: function called on every animation step
+        :param interval_ms: time between two animation steps
+        :return:
+        """
+        entry = self._animations.get(id(widget), None)
+        if entry is not None:
+            entry[1], entry[2] = tick_fcn, interval_ms
+        else:
+            connection = widget.destroyed.connect(lambda *args, widget_id=id(widget): self.unregister_id(widget_id))
+            self._animations[id(widget)] = [widget, tick_fcn, interval_ms, self._clock.elapsed() + interval_ms,
+                                            connection]
+        self.update_interval()
+
+    def unregister(self, widget):
+        entry = self._animations.get(id(widget), None)
+        if entry is None:
+            return
+        try:
+            widget.destroyed.disconnect(entry[4])
+        except (TypeError, RuntimeError):
+            pass
+        self.unregister_id(id(widget))
+
+    def unregister_id(self, widget_id):
+        if self._animations.pop(widget_id, None) is not None:
+            try:
+                self.update_interval()
+            except RuntimeError:
+                # the timer was deleted on application shutdown
+                pass
+
+    def update_interval(self):
+        if not self._animations:
+            self._timer.stop()
+            self.exposed = 0
+            return
+        self._timer.setInterval(min(entry[2] for entry in self._animations.values()))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def tick(self):
+        self.ticks += 1
+        now = self._clock.elapsed()
+        exposed = 0
+        for entry in list(self._animations.values()):
+            widget, tick_fcn, interval_ms, next_tick_ms = entry[:4]
+            if not is_exposed(widget):
+                self.skipped += 1
+                continue
+            exposed += 1
+            if now + self._timer.interval() // 2 < next_tick_ms:
+                # the timer may fire a little early
+                continue
+            # skipped steps are not caught up
+            entry[3] = max(next_tick_ms + interval_ms, now)
+            self.animation_ticks += 1
+            tick_fcn()
+        self.exposed = exposed
+
+    def reset_stats(self):
+        self.ticks = 0
+        self.animation_ticks = 0
+        self.skipped = 0
+
+    def stats(self):
+        return {'active': self.active,
+                'exposed': self.exposed,
+                'ticks': self.ticks,
+                'animation_ticks': self.animation_ticks,
+                'skipped': self.skipped}
+
+
+def is_exposed(widget):
+    """
+    Returns True if widget is visible and its window and the windows of its parents are exposed (not hidden,
+    minimized or covered).
+    """
+    try:
+        if not widget.isVisible():
+            return False
+        while widget is not None:
+            window = widget.window()
+            if (not window.isVisible()) or window.isMinimized():
+                return False
+            handle = window.windowHandle()
+            if (handle is not None) and (not handle.isExposed()):
+                return False
+            widget = window.parentWidget()
+        return True
+    except RuntimeError:
+        # the widget was deleted
+        return False
@@ -0,0 +1,113 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+import logging
+
+from . import executor
+
+
+placeholder_text = 'loading...'     # shown by widgets while their async source is loading
+
+stats = {'requests': 0,             # source functions started
+         'applied': 0,              # results delivered to the callback
+         'dropped': 0,              # results or queued requests superseded by a newer request
+         'errors': 0}               # source functions which raised
+
+
+class SourceRunnable(QRunnable):
+
+    def __init__(self, relay, generation, fcn, args, kwargs):
+        super(SourceRunnable, self).__init__()
+        self.relay = relay
+        self.generation = generation
+        self.fcn = fcn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        result, error = None, None
+        try:
+            result = self.fcn(*self.args, **self.kwargs)
+        except Exception as e:
+            error = e
+        try:
+            self.relay.finished.emit(self.generation, result, error)
+        except RuntimeError:
+            # the AsyncSource was deleted
+            pass
+
+
+class AsyncSource(QObject):
+    """
+    Runs source functions in the executor (interactive priority) and delivers their results to callback on the GUI
+    thread (queued signal). Every request supersedes the previous ones: a request which did not start yet is taken
+    back from the executor and results of older requests are dropped, so only the result of the latest request is
+    applied.
+
+    The source functions run in a worker thread and must not touch widgets.
+    """
+
+    finished = pyqtSignal(int, object, object)
+
+    def __init__(self, callback, parent=None):
+        """
+
+        :param callback: function callback(result, error) called on the GUI thread with the result of the latest
+                         request; error is the exception raised by the source function or None
+        :param parent: parent QObject
+        """
+        super(AsyncSource, self).__init__(parent)
+        self.callback = callback
+        self.generation = 0
+        self._delivered = 0
+        self._runnable = None
+        self.finished.connect(self._deliver)
+
+    @property
+    def pending(self):
+        return self._delivered != self.generation
+
+    def request(self, fcn, *args, **kwargs):
+        """
+        Runs fcn(*args, **kwargs) in the executor; supersedes the pending request.
+
+        :return: the generation of the request
+        """
+        self._take_queued()
+        self.generation += 1
+        stats['requests'] += 1
+        self._runnable = SourceRunnable(self, self.generation, fcn, args, kwargs)
+        self._runnable.setAutoDelete(False)
+        executor.submit(self._runnable, executor.interactive_priority)
+        return self.generation
+
+    def cancel(self):
+        """
+        Drops the pending request.
+        """
+        self._take_queued()
+        self.generation += 1
+        self._delivered = self.generation
+
+    def _take_queued(self):
+        if (self._runnable is not None) and self.pending:
+            if executor.try_take(self._runnable):
+                stats['dropped'] += 1
+        self._runnable = None
+
+    def _deliver(self, generation, result, error):
+        if generation != self.generation:
+            stats['dropped'] += 1
+            return
+        self._delivered = generation
+        self._runnable = None
+        if error is not None:
+            stats['errors'] += 1
+            logging.error(f'Error in async source: {error}')
+        else:
+            stats['applied'] += 1
+        self.callback(result, error)
+
+
+def reset_stats():
+    for key in stats.keys():
+        stats[key] = 0
@@ -0,0 +1,235 @@
+from PyQt5 import QtWidgets
+from PyQt5.QtGui import QIntValidator, QDoubleValidator
+
+from collections import OrderedDict
+import logging
+
+
+max_binding_plans = 256             # number of binding plans kept in the cache
+
+_binding_plans = OrderedDict()      # (info_cls, ui_info, id(editable_attributes)) -> BindingPlan
+
+commit_policies = ['keystroke', 'debounce', 'finished']
+default_debounce_ms = 250
+
+
+class AttributeBinding(object):
+    """
+    Resolved binding of one editable attribute to its gui edit element. Holds everything which can be derived
+    from the editable_attributes entry and the ui_info class alone, so it can be reused for every dialog.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+
+        :param args:
+        :param kwargs:
+        :key key: the attribute of the instance
+        :key spec: the editable_attributes entry of the attribute
+        :key attr_type: the type of the attribute (int, float, str, bool, 'text', 'static', 'object', ...)
+        :key widget_name: name of the gui edit element in the ui
+        :key kind: kind of the gui edit element ('line_edit', 'text_edit', 'radio_button', 'label', 'object_single',
+                   'object_multiple', 'choice', 'list_choice' or None)
+        :key validator_type: QIntValidator, QDoubleValidator or None
+        :key bottom: bottom of the validator
+        :key top: top of the validator
+        :key edit_button_name: name of the edit button of an object attribute (None if not in the ui)
+        :key new_button_name: name of the add new button of an object attribute (None if not in the ui)
+        :key commit: commit policy of edits: 'keystroke', 'debounce' or 'finished'
+        :key debounce_ms: debounce time in ms for commit policy 'debounce'
+        :key backend: backend of multiple object attributes: 'widget' (QListWidget) or 'model' (QListView with
+                      ObjectListModel)
+        """
+        self.key = kwargs.get('key')
+        self.spec = kwargs.get('spec')
+        self.attr_type = kwargs.get('attr_type')
+        self.widget_name = kwargs.get('widget_name')
+        self.kind = kwargs.get('kind', None)
+        self.validator_type = kwargs.get('validator_type', None)
+        self.bottom = kwargs.get('bottom', None)
+        self.top = kwargs.get('top', None)
+        self.edit_button_name = kwargs.get('edit_button_name', None)
+        self.new_button_name = kwargs.get('new_button_name', None)
+        self.commit = kwargs.get('commit', 'keystroke')
+        self.debounce_ms = kwargs.get('debounce_ms', default_debounce_ms)
+        self.backend = kwargs.get('backend', 'widget')
+
+    @property
+    def observed(self):
+        return self.kind not in [None, 'choice', 'list_choice']
+
+    def create_validator(self, parent=None):
+        if self.validator_type is None:
+            return None
+        validator = self.validator_type(parent)
+        if self.bottom is not None:
+            validator.setBottom(self.bottom)
+        if self.top is not None:
+            validator.setTop(self.top)
+        return validator
+
+
+class BindingPlan(object):
+    """
+    Binding plan of an InfoBaseClass subclass and an ui_info class. Compiled once by get_binding_plan and
+    replayed for every new dialog.
+    """
+
+    def __init__(self, bindings, editable_attributes=None):
+        self.bindings = bindings
+        self.editable_attributes = editable_attributes      # keeps the compiled dict (and its id) alive
+        self.by_key = {binding.key: binding for binding in bindings}
+
+    def __iter__(self):
+        return iter(self.bindings)
+
+    def __len__(self):
+        return self.bindings.__len__()
+
+    @property
+    def observed_keys(self):
+        return [binding.key for binding in self.bindings if binding.observed]
+
+
+def get_binding_plan(info_cls, ui_info, ui, editable_attributes=None):
+    """
+    Returns the cached binding plan for (info_cls, ui_info, editable_attributes). The plan is compiled on first use.
+    Infos which set editable_attributes per instance get the plan of their own dict; the plan is shared by all
+    infos using the same dict object.
+
+    :param info_cls: the InfoBaseClass subclass
+    :param ui_info: the ui class
+    :param ui: a set up instance of ui_info which is used to resolve the gui edit elements
+    :param editable_attributes: the editable_attributes of the info; default: info_cls.editable_attributes
+    :return: BindingPlan
+    """
+    if editable_attributes is None:
+        editable_attributes = info_cls.editable_attributes
+    plan_key = (info_cls, ui_info, id(editable_attributes))
+    plan = _binding_plans.get(plan_key, None)
+    if plan is None:
+        plan = compile_binding_plan(editable_attributes, ui)
+        _binding_plans[plan_key] = plan
+        while _binding_plans.__len__() > max_binding_plans:
+            _binding_plans.popitem(last=False)
+    else:
+        _binding_plans.move_to_end(plan_key)
+    return plan
+
+
+def clear_binding_plans():
+    _binding_plans.clear()
+
+
+def compile_binding_plan(editable_attributes, ui):
+    bindings = []
+    for key, value in editable_attributes.items():
+        binding = compile_attribute_binding(key, value, ui)
+        if binding is not None:
+            bindings.append(binding)
+    return BindingPlan(bindings, editable_attributes)
+
+
+def compile_attribute_binding(key, value, ui):
+
+    if isinstance(value, dict):
+        attr_type = value['type']
+    else:
+        attr_type = value
+
+    if attr_type not in [int, float, str, bool, 'text', 'static', 'object', 'choice', 'list_choice']:
+        return None
+
+    gui_edit_element_name = None
+    if attr_type in [int, float, str]:
+        gui_edit_element_name = f'{key}_lineEdit'
+    elif attr_type in [bool]:
+        gui_edit_element_name = f'{key}_radioButton'
+    elif attr_type == 'text':
+        gui_edit_element_name = f'{key}_textEdit'
+    elif attr_type == 'static':
+        gui_edit_element_name = f'{key}_label'
+    elif attr_type == 'object':
+        if value['select']['type'] == 'single':
+            gui_edit_element_name = f'{key}_label'
+        elif value['select']['type'] == 'multiple':
+            if value['select'].get('backend', 'widget') == 'model':
+                gui_edit_element_name = f'{key}_listView'
+            else:
+                gui_edit_element_name = f'{key}_listWidget'
+    elif attr_type == 'choice':
+        gui_edit_element_name = f'{key}_comboBox'
+    elif attr_type == 'list_choice':
+        if 'key' in value.keys():
+            gui_edit_element_name = f"{value['key']}_listView"
+        else:
+            gui_edit_element_name = f'{key}_listView'
+
+    if gui_edit_element_name is None:
+        print(f'attr_type {attr_type} not supported')
+        logging.error(f'attr_type {attr_type} not supported')
+        return None
+
+    if not hasattr(ui, gui_edit_element_name):
+        print(f'Gui edit element for {key} not found')
+        logging.error(f'Gui edit element for {key} not found')
+        return None
+
+    gui_edit_element = getattr(ui, gui_edit_element_name)
+
+    binding = AttributeBinding(key=key,
+                               spec=value,
+                               attr_type=attr_type,
+                               widget_name=gui_edit_element_name)
+
+    if attr_type in [int, float, str, bool, 'text', 'static']:
+        if isinstance(gui_edit_element, QtWidgets.QLineEdit):
+            binding.kind = 'line_edit'
+        elif isinstance(gui_edit_element, QtWidgets.QTextEdit):
+            binding.kind = 'text_edit'
+        elif isinstance(gui_edit_element, QtWidgets.QRadioButton):
+            binding.kind = 'radio_button'
+        elif isinstance(gui_edit_element, QtWidgets.QLabel):
+            binding.kind = 'label'
+
+        if attr_type is int:
+            binding.validator_type = QIntValidator
+        elif attr_type is float:
+            binding.validator_type = QDoubleValidator
+
+        if isinstance(value, dict):
+            binding.bottom = value.get('bottom', None)
+            binding.top = value.get('top', None)
+
+            if binding.kind in ['line_edit', 'text_edit']:
+                commit = value.get('commit', 'keystroke')
+                if commit not in commit_policies:
+                    print(f'commit policy {commit} for {key} not supported')
+                    logging.error(f'commit policy {commit} for {key} not supported')
+                    commit = 'keystroke'
+                binding.commit = commit
+                binding.debounce_ms = value.get('debounce_ms', default_debounce_ms)
+
+    elif attr_type == 'object':
+        binding.kind = f"object_{value['select']['type']}"
+        if binding.kind == 'object_multiple':
+            binding.backend = value['select'].get('backend', 'widget')
+
+        edit_button_name = f'{key}_edit_pushButton'
+        if not hasattr(ui, edit_button_name):
+            print(f'Gui edit button for {key} not found')
+            logging.error(f'Gui edit button for {key} not found')
+        else:
+            binding.edit_button_name = edit_button_name
+
+        new_button_name = f'{key}_new_pushButton'
+        if not hasattr(ui, new_button_name):
+            print(f'No Gui add new button for {key} found')
+            logging.error(f'No Gui add new button for {key} found')
+        else:
+            binding.new_button_name = new_button_name
+
+    else:
+        binding.kind = attr_type
+
+    return binding
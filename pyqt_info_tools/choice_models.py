@@ -0,0 +1,320 @@
+from PyQt5 import QtWidgets, QtCore, sip
+
+import weakref
+import logging
+
+from .models import ObjectListModel
+from .names import resolve_names
+from .streaming import is_streaming_source
+from .subscriptions import subscribe
+from .async_sources import AsyncSource, placeholder_text
+
+
+_choice_models = {}         # (id(source_instance), source_attr, name_source_fcn, value_source_fcn, async_source)
+                            # -> ChoiceModel
+_attached = {}              # id(widget) -> ChoiceModel
+
+stats = {'hits': 0,         # refreshes answered from the memoized choices
+         'misses': 0}       # refreshes which computed the choices
+
+
+def compute_choices(instance, source_instance, source_attr, name_source_fcn=None, value_source_fcn=None):
+    """
+    Returns the names and values of the choices of a ChoiceList. choice_values is returned as is if it is a
+    streaming source (iterator, paged callable, PagedSource).
+
+    :param instance: the instance having the chosen attribute (source if source_instance is None)
+    :param source_instance: the instance having the values
+    :param source_attr: the attribute of the source instance having the values
+    :param name_source_fcn: the function which returns the names of the choices as list
+    :param value_source_fcn: the function which returns the values of the choices as list
+    :return: choice_names, choice_values
+    """
+    if name_source_fcn is not None:
+        if name_source_fcn is value_source_fcn:
+            if source_instance is None:
+                source_instance = instance
+            return value_source_fcn(source_instance)
+        else:
+            return name_source_fcn(), value_source_fcn()
+
+    else:
+        if value_source_fcn is None:
+            choice_values = getattr(source_instance, source_attr)
+            if is_streaming_source(choice_values):
+                # the names are computed by the model for the loaded rows
+                return [], choice_values
+
+        if name_source_fcn is not None:
+            choice_names = name_source_fcn(source_instance)
+        else:
+            choice_names = resolve_names(getattr(source_instance, source_attr))
+
+        if value_source_fcn is not None:
+            choice_values = value_source_fcn(source_instance)
+        else:
+            choice_values = getattr(source_instance, source_attr)
+            if isinstance(choice_values, dict):
+                choice_values = list(choice_values.values())
+            elif not isinstance(choice_values, list):
+                choice_values = list(choice_values)
+            else:
+                choice_values = choice_values
+
+        return choice_names, choice_values
+
+
+class ChoiceModel(ObjectListModel):
+    """
+    Choice model shared by all widgets showing the choices of (source_instance, source_attr, name_source_fcn,
+    value_source_fcn). The model observes the source and updates itself once for all widgets; it is released when
+    the last widget is detached or destroyed.
+
+    The computed choices are memoized: they are computed again only after a change notification of source_attr or
+    if the __version__ of the source changed. Sources which are not observable and choices computed by
+    name_source_fcn / value_source_fcn without source_attr can opt in by incrementing a __version__ attribute of the
+    source on every change; otherwise their choices are computed on every refresh.
+
+    With async_source the choices are computed in the thread pool; the comboboxes show a placeholder until the
+    first choices arrive and choices_loaded is emitted when the choices were applied.
+    """
+
+    choices_loaded = QtCore.pyqtSignal()
+
+    def __init__(self, key, source_instance, source_attr, name_source_fcn=None, value_source_fcn=None,
+                 page_size=None, async_source=False):
+        super(ChoiceModel, self).__init__(page_size=page_size)
+        self.key = key
+        self.source_attr = source_attr
+        self.name_source_fcn = name_source_fcn
+        self.value_source_fcn = value_source_fcn
+        self.widgets = {}               # id(widget) -> (widget, address of the widget)
+        self.hits = 0
+        self.misses = 0
+        self._stale = True
+        self._version = None
+        self._async = AsyncSource(self.apply_result) if async_source else None
+
+        try:
+            self._source_ref = weakref.ref(source_instance)
+        except TypeError:
+            # source does not support weak references
+            self._source_ref = lambda: source_instance
+
+        self._subscription = None
+        if (source_instance is not None) and (source_attr is not None) and hasattr(source_instance, 'add_observer'):
+            self._subscription = subscribe(source_instance, self.source_changed, attr_dependent=[source_attr])
+
+        self.refresh()
+
+    @property
+    def source_instance(self):
+        return self._source_ref()
+
+    @property
+    def observed(self):
+        return self._subscription is not None
+
+    @property
+    def ref_count(self):
+        return self.widgets.__len__()
+
+    @property
+    def loading(self):
+        return (self._async is not None) and self._async.pending
+
+    @property
+    def choice_values(self):
+        return self._objects
+
+    @property
+    def choice_names(self):
+        if self._display_names is not None:
+            return self._display_names
+        return [self.data(self.index(row)) for row in range(self.rowCount())]
+
+    def value_at(self, row):
+        return self.instance_at(row)
+
+    def source_changed(self, *args, **kwargs):
+        self._stale = True
+        self.refresh()
+
+    def refresh(self, force=False):
+        """
+        Recomputes the choices if the source changed. The attached comboboxes keep their current value and do not
+        emit currentIndexChanged.
+
+        :param force: if True the choices are computed even if the source did not change
+        :return: True if the choices were computed
+        """
+        version = getattr(self.source_instance, '__version__', None)
+        if (not force) and (not self._stale) and (version == self._version) and \
+                (self.observed or (version is not None)):
+            self.hits += 1
+            stats['hits'] += 1
+            return False
+
+        self.misses += 1
+        stats['misses'] += 1
+        self._stale = False
+        self._version = version
+        if self._async is not None:
+            # the current choices are shown until the result arrives
+            self._async.request(compute_choices,
+                                self.source_instance,
+                                self.source_instance,
+                                self.source_attr,
+                                self.name_source_fcn,
+                                self.value_source_fcn)
+            self.update_placeholders()
+            return True
+
+        try:
+            choice_names, choice_values = compute_choices(self.source_instance,
+                                                          self.source_instance,
+                                                          self.source_attr,
+                                                          self.name_source_fcn,
+                                                          self.value_source_fcn)
+        except Exception as e:
+            logging.error(f'Error computing choices of {self.source_instance}.{self.source_attr}: {e}')
+            choice_names, choice_values = [], []
+        self.set_choices(choice_names, choice_values)
+        return True
+
+    def apply_result(self, result, error):
+        if error is not None:
+            logging.error(f'Error computing choices of {self.source_instance}.{self.source_attr}: {error}')
+            result = ([], [])
+        self.set_choices(*result)
+        self.update_placeholders()
+        self.choices_loaded.emit()
+
+    def set_choices(self, choice_names, choice_values):
+        """
+        Shows the choices. The attached comboboxes keep their current value and do not emit currentIndexChanged.
+        """
+        selections = []
+        for widget, _ in self.widgets.values():
+            if isinstance(widget, QtWidgets.QComboBox):
+                selections.append((widget, self.instance_at(widget.currentIndex()), widget.blockSignals(True)))
+        try:
+            if is_streaming_source(choice_values):
+                self.set_objects(choice_values)
+            else:
+                self.set_objects(choice_values, choice_names)
+        finally:
+            for widget, value, blocked in selections:
+                # diffed rows keep the current index; only a reset needs the reverse index
+                if (value is None) or (self.instance_at(widget.currentIndex()) is not value):
+                    widget.setCurrentIndex(self.row_of(value) if value is not None else -1)
+                widget.blockSignals(blocked)
+
+    def update_placeholders(self):
+        text = placeholder_text if self.loading else ''
+        for widget, _ in self.widgets.values():
+            if isinstance(widget, QtWidgets.QComboBox):
+                widget.setPlaceholderText(text)
+
+    def attach(self, widget):
+        if id(widget) in self.widgets:
+            return
+        # a slot of the model needs no slot proxy, so the connection is gone as soon as the widget is detached
+        widget.destroyed.connect(self.widget_destroyed, QtCore.Qt.DirectConnection)
+        self.widgets[id(widget)] = (widget, sip.unwrapinstance(widget))
+        _attached[id(widget)] = self
+        if isinstance(widget, QtWidgets.QComboBox):
+            blocked = widget.blockSignals(True)
+            widget.setModel(self)
+            widget.blockSignals(blocked)
+            if self.loading:
+                widget.setPlaceholderText(placeholder_text)
+
+    def detach(self, widget):
+        entry = self.widgets.get(id(widget), None)
+        if entry is None:
+            return
+        if not sip.isdeleted(self):
+            # a deleted model was disconnected by Qt (application shutdown)
+            try:
+                widget.destroyed.disconnect(self.widget_destroyed)
+            except (TypeError, RuntimeError):
+                pass
+        self.detach_id(id(widget))
+
+    @QtCore.pyqtSlot(QtCore.QObject)
+    def widget_destroyed(self, widget=None):
+        address = sip.unwrapinstance(self.sender())
+        for widget_id, (_, widget_address) in list(self.widgets.items()):
+            if widget_address == address:
+                self.detach_id(widget_id)
+
+    def detach_id(self, widget_id):
+        if self.widgets.pop(widget_id, None) is None:
+            return
+        if _attached.get(widget_id, None) is self:
+            del _attached[widget_id]
+        if not self.widgets:
+            self.close()
+
+    def close(self):
+        if self._async is not None:
+            self._async.cancel()
+        if self._subscription is not None:
+            self._subscription.cancel()
+            self._subscription = None
+        if _choice_models.get(self.key, None) is self:
+            del _choice_models[self.key]
+
+
+def attach_choice_model(widget, source_instance, source_attr, name_source_fcn=None, value_source_fcn=None,
+                        page_size=None, async_source=False):
+    """
+    Attaches widget to the shared choice model of the source and returns the model. Comboboxes show the model
+    (setModel); other widgets only hold a reference. The widget is detached from its previous choice model.
+
+    :param widget: QWidget
+    :param source_instance: the instance having the values
+    :param source_attr: the attribute of the source instance having the values
+    :param name_source_fcn: the function which returns the names of the choices (must be hashable)
+    :param value_source_fcn: the function which returns the values of the choices (must be hashable)
+    :param page_size: page size of streaming sources if the model is created
+    :param async_source: if True the choices are computed in the thread pool
+    :return: ChoiceModel
+    """
+    key = (id(source_instance), source_attr, name_source_fcn, value_source_fcn, bool(async_source))
+    model = _choice_models.get(key, None)
+    if (model is not None) and (model.source_instance is not source_instance):
+        # the id of a collected source was reused
+        model.close()
+        model = None
+    if model is None:
+        model = ChoiceModel(key, source_instance, source_attr, name_source_fcn, value_source_fcn,
+                            page_size=page_size, async_source=async_source)
+        _choice_models[key] = model
+
+    previous = _attached.get(id(widget), None)
+    if previous is model:
+        return model
+    if previous is not None:
+        previous.detach(widget)
+    model.attach(widget)
+    return model
+
+
+def detach_choice_model(widget):
+    model = _attached.get(id(widget), None)
+    if model is not None:
+        model.detach(widget)
+
+
+def reset_stats():
+    for key in stats.keys():
+        stats[key] = 0
+
+
+def choice_model_counts():
+    """
+    Returns the number of attached widgets per shared choice model as list of (model, count) tuples.
+    """
+    return [(model, model.ref_count) for model in _choice_models.values()]
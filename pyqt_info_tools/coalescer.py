@@ -0,0 +1,86 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+import threading
+
+
+class RefreshCoalescer(QObject):
+    """
+    Coalesces observer notifications: notifications only mark keys dirty, one flush per event loop iteration
+    (or per frame budget) refreshes every dirty key once.
+    """
+
+    _flush_requested = pyqtSignal()
+
+    def __init__(self, refresh_fcn, frame_budget_ms=0, parent=None):
+        """
+
+        :param refresh_fcn: function which is called with the dirty key on flush
+        :param frame_budget_ms: time in ms the notifications are collected before the flush
+        :param parent: parent QObject
+        """
+        super(RefreshCoalescer, self).__init__(parent)
+        self.refresh_fcn = refresh_fcn
+
+        self._dirty = {}
+        self._lock = threading.Lock()       # guards _dirty and notifications, mark_dirty is called from any thread
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(frame_budget_ms)
+        self._timer.timeout.connect(self.flush)
+        self._flush_requested.connect(self._schedule_flush)
+
+        self.notifications = 0
+        self.refreshes = 0
+
+    @property
+    def frame_budget_ms(self):
+        return self._timer.interval()
+
+    @frame_budget_ms.setter
+    def frame_budget_ms(self, value):
+        self._timer.setInterval(value)
+
+    @property
+    def pending(self):
+        with self._lock:
+            return list(self._dirty.keys())
+
+    def mark_dirty(self, key=None):
+        """
+        Marks key dirty and schedules a flush. Can be called from any thread.
+
+        :param key: the dirty key
+        :return:
+        """
+        with self._lock:
+            self.notifications += 1
+            self._dirty[key] = None
+        self._flush_requested.emit()
+
+    def flush(self):
+        self._timer.stop()
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = {}
+        for key in dirty:
+            self.refreshes += 1
+            self.refresh_fcn(key)
+
+    def discard(self):
+        self._timer.stop()
+        with self._lock:
+            self._dirty = {}
+
+    def reset_stats(self):
+        self.notifications = 0
+        self.refreshes = 0
+
+    def stats(self):
+        with self._lock:
+            return {'notifications': self.notifications,
+                    'refreshes': self.refreshes,
+                    'pending': self._dirty.__len__()}
+
+    def _schedule_flush(self):
+        if not self._timer.isActive():
+            self._timer.start()
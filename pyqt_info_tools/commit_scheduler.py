@@ -0,0 +1,109 @@
+from PyQt5.QtCore import QObject, QTimer, QEvent
+
+import time
+
+
+class CommitScheduler(QObject):
+    """
+    Schedules the commit of edited gui edit elements to the instance. One timer is shared by all debounced elements
+    of a dialog; elements with commit policy 'finished' are committed on editingFinished / focus out.
+    """
+
+    def __init__(self, commit_fcn, parent=None):
+        """
+
+        :param commit_fcn: function which is called with the gui edit element to commit
+        :param parent: parent QObject
+        """
+        super(CommitScheduler, self).__init__(parent)
+        self.commit_fcn = commit_fcn
+
+        self._pending = {}              # key -> (deadline or None, gui edit element)
+        self._watched = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._commit_due)
+
+        self.scheduled = 0
+        self.commits = 0
+
+    @property
+    def pending(self):
+        return list(self._pending.keys())
+
+    def schedule(self, key, gui_edit_element, delay_ms=None):
+        """
+        Schedules the commit of gui_edit_element.
+
+        :param key: the edited attribute
+        :param gui_edit_element: the gui edit element
+        :param delay_ms: debounce time in ms; if None the element is committed by flush only
+        :return:
+        """
+        self.scheduled += 1
+        deadline = None
+        if delay_ms is not None:
+            deadline = time.monotonic() + delay_ms / 1000
+        self._pending[key] = (deadline, gui_edit_element)
+        if deadline is not None:
+            self._restart_timer()
+
+    def flush(self, key=None):
+        """
+        Commits the pending element of key or all pending elements.
+
+        :param key: the edited attribute; None flushes all
+        :return:
+        """
+        if key is None:
+            keys = list(self._pending.keys())
+        elif key in self._pending:
+            keys = [key]
+        else:
+            return
+
+        for key in keys:
+            _, gui_edit_element = self._pending.pop(key)
+            self.commits += 1
+            self.commit_fcn(gui_edit_element)
+        self._restart_timer()
+
+    def discard(self):
+        self._timer.stop()
+        self._pending = {}
+
+    def watch_focus_out(self, gui_edit_element):
+        gui_edit_element.installEventFilter(self)
+        self._watched.append(gui_edit_element)
+
+    def unwatch_all(self):
+        for gui_edit_element in self._watched:
+            try:
+                gui_edit_element.removeEventFilter(self)
+            except RuntimeError:
+                # the gui edit element is already deleted
+                pass
+        self._watched = []
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.FocusOut:
+            key = getattr(watched, 'instance_attr', None)
+            if key is not None:
+                self.flush(key)
+        return False
+
+    def _commit_due(self):
+        now = time.monotonic()
+        due = [key for key, (deadline, _) in self._pending.items() if (deadline is not None) and (deadline <= now)]
+        for key in due:
+            _, gui_edit_element = self._pending.pop(key)
+            self.commits += 1
+            self.commit_fcn(gui_edit_element)
+        self._restart_timer()
+
+    def _restart_timer(self):
+        deadlines = [deadline for deadline, _ in self._pending.values() if deadline is not None]
+        if not deadlines:
+            self._timer.stop()
+            return
+        self._timer.start(max(int((min(deadlines) - time.monotonic()) * 1000), 0))
@@ -0,0 +1,114 @@
+from PyQt5.QtCore import QTimer
+
+from collections import OrderedDict
+import logging
+
+
+class DialogPool(object):
+    """
+    Bounded pool of already set up dialogs. Dialogs are pooled per (ui_info class, parent) and evicted in LRU order.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+
+        :param args:
+        :param kwargs:
+        :key build_fcn: function (ui_info, parent) which returns a new set up dialog
+        :key max_per_class: maximum number of idle dialogs per ui_info class
+        :key max_size: maximum number of idle dialogs in the pool
+        """
+        self.build_fcn = kwargs.get('build_fcn', None)
+        self.max_per_class = kwargs.get('max_per_class', 4)
+        self.max_size = kwargs.get('max_size', 32)
+
+        self._idle = OrderedDict()          # id(dialog) -> (pool_key, dialog); least recently used first
+        self._prewarm_queue = []
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return self._idle.__len__()
+
+    def idle_count(self, ui_info, parent=None):
+        pool_key = (ui_info, parent)
+        return sum(1 for key, _ in self._idle.values() if key == pool_key)
+
+    def acquire(self, ui_info, parent=None):
+        """
+        Returns an idle dialog for ui_info or builds a new one.
+
+        :param ui_info: the ui class
+        :param parent: parent of the dialog
+        :return: dialog, True if the dialog was taken from the pool
+        """
+        pool_key = (ui_info, parent)
+        for dialog_id in reversed(self._idle):
+            key, dialog = self._idle[dialog_id]
+            if key == pool_key:
+                del self._idle[dialog_id]
+                self.hits += 1
+                return dialog, True
+
+        self.misses += 1
+        return self.build_fcn(ui_info, parent), False
+
+    def release(self, dialog, ui_info, parent=None):
+        """
+        Hides the dialog and keeps it for reuse.
+
+        :param dialog: the dialog
+        :param ui_info: the ui class the dialog was set up with
+        :param parent: parent of the dialog
+        :return:
+        """
+        pool_key = (ui_info, parent)
+        dialog.hide()
+        self._idle.pop(id(dialog), None)
+        self._idle[id(dialog)] = (pool_key, dialog)
+
+        class_ids = [dialog_id for dialog_id, (key, _) in self._idle.items() if key == pool_key]
+        for dialog_id in class_ids[:max(class_ids.__len__() - self.max_per_class, 0)]:
+            self._evict(dialog_id)
+
+        while self._idle.__len__() > self.max_size:
+            self._evict(next(iter(self._idle)))
+
+    def prewarm(self, ui_info, count=1, parent=None):
+        """
+        Builds dialogs for ui_info while the event loop is idle, one dialog per event loop iteration.
+
+        :param ui_info: the ui class
+        :param count: number of idle dialogs which should be available
+        :param parent: parent of the dialogs
+        :return:
+        """
+        # dialogs of earlier calls which are still queued count as available
+        queued = self._prewarm_queue.count((ui_info, parent))
+        missing = min(count, self.max_per_class) - self.idle_count(ui_info, parent) - queued
+        for _ in range(missing):
+            self._prewarm_queue.append((ui_info, parent))
+        if missing > 0:
+            QTimer.singleShot(0, self._prewarm_next)
+
+    def clear(self):
+        for dialog_id in list(self._idle.keys()):
+            self._evict(dialog_id)
+        self._prewarm_queue = []
+
+    def _prewarm_next(self):
+        if not self._prewarm_queue:
+            return
+        ui_info, parent = self._prewarm_queue.pop(0)
+        try:
+            dialog = self.build_fcn(ui_info, parent)
+            self.release(dialog, ui_info, parent)
+        except Exception as e:
+            logging.error(f'Error prewarming dialog for {ui_info}: {e}')
+        if self._prewarm_queue:
+            QTimer.singleShot(0, self._prewarm_next)
+
+    def _evict(self, dialog_id):
+        _, dialog = self._idle.pop(dialog_id)
+        dialog.deleteLater()
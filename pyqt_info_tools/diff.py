@@ -0,0 +1,73 @@
+def keyed_diff(old_keys, new_keys, max_operations=None):
+    """
+    Returns the operations which transform the sequence old_keys into new_keys. The keys must be hashable and unique
+    (see occurrence_keys). The operations have to be applied in the returned order:
+
+        ('remove', row)             remove the row
+        ('insert', row)             insert new_keys[row] at row
+        ('move', from_row, row)     move the row from_row to row
+
+    Unchanged rows produce no operation, so appending or removing one key produces one operation.
+
+    :param old_keys: keys of the current rows
+    :param new_keys: keys of the wanted rows
+    :param max_operations: if more operations are needed, the diff is stopped and None is returned
+    :return: list of operations or None
+    """
+    # the unchanged head and tail produce no operations
+    start = 0
+    end = min(old_keys.__len__(), new_keys.__len__())
+    while (start < end) and (old_keys[start] == new_keys[start]):
+        start += 1
+    old_end, new_end = old_keys.__len__(), new_keys.__len__()
+    while (old_end > start) and (new_end > start) and (old_keys[old_end - 1] == new_keys[new_end - 1]):
+        old_end -= 1
+        new_end -= 1
+    old_keys = old_keys[start:old_end]
+    new_keys = new_keys[start:new_end]
+
+    new_set = set(new_keys)
+    operations = []
+
+    for row in range(old_keys.__len__() - 1, -1, -1):
+        if old_keys[row] not in new_set:
+            operations.append(('remove', start + row))
+    if (max_operations is not None) and (operations.__len__() > max_operations):
+        return None
+    if operations:
+        current = [key for key in old_keys if key in new_set]
+    else:
+        current = list(old_keys)
+    current_set = set(current)
+
+    for row, key in enumerate(new_keys):
+        if (row < current.__len__()) and (current[row] == key):
+            continue
+        if key in current_set:
+            from_row = current.index(key, row)
+            current.insert(row, current.pop(from_row))
+            operations.append(('move', start + from_row, start + row))
+        else:
+            current.insert(row, key)
+            current_set.add(key)
+            operations.append(('insert', start + row))
+        if (max_operations is not None) and (operations.__len__() > max_operations):
+            return None
+
+    return operations
+
+
+def occurrence_keys(keys):
+    """
+    Makes keys unique by pairing repeated keys with the number of their previous occurrences, so a sequence which
+    contains the same object more than once can be diffed. The first occurrence keeps its key.
+    """
+    if set(keys).__len__() == keys.__len__():
+        return list(keys)
+    counts = {}
+    unique_keys = []
+    for key in keys:
+        count = counts.get(key, 0)
+        counts[key] = count + 1
+        unique_keys.append(key if count == 0 else (key, count))
+    return unique_keys
@@ -0,0 +1,205 @@
+from PyQt5.QtCore import QCoreApplication, QRunnable, QThreadPool
+from PyQt5 import sip
+
+import threading
+import logging
+
+
+interactive_priority = 1            # work a user waits for (async sources, icons); runs before bulk work
+bulk_priority = 0                   # heavy background work (dialog tasks)
+
+max_thread_count = None             # threads of the executor; None: QThread.idealThreadCount()
+expiry_timeout_ms = 30000           # idle threads are stopped after this time
+shutdown_timeout_ms = 5000          # time the running work may take on application exit
+
+_executor = None
+
+
+class MeteredRunnable(QRunnable):
+
+    def __init__(self, executor, runnable):
+        super(MeteredRunnable, self).__init__()
+        self.executor = executor
+        self.runnable = runnable
+        self.is_running = False
+
+    def run(self):
+        self.executor.started(self)
+        try:
+            self.runnable.run()
+        finally:
+            self.executor.finished(self)
+
+
+class Executor(object):
+    """
+    Thread pool owned by pyqt_info_tools, so the background work of the dialogs neither starves nor is starved by
+    other users of QThreadPool.globalInstance(). Work is started with a priority (interactive before bulk); the
+    queue depth and the number of running and completed runnables are counted.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+
+        :key max_thread_count: maximum number of threads; default: QThread.idealThreadCount()
+        :key expiry_timeout_ms: idle threads are stopped after this time
+        """
+        self.pool = QThreadPool()
+        if kwargs.get('max_thread_count', None) is not None:
+            self.pool.setMaxThreadCount(kwargs.get('max_thread_count'))
+        self.pool.setExpiryTimeout(kwargs.get('expiry_timeout_ms', expiry_timeout_ms))
+
+        self._lock = threading.Lock()
+        self._runnables = {}                # id(runnable) -> MeteredRunnable; keeps the runnables alive
+        self.is_shut_down = False
+
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.peak_queued = 0
+        self.submitted = {interactive_priority: 0, bulk_priority: 0}
+
+    @property
+    def max_thread_count(self):
+        return self.pool.maxThreadCount()
+
+    @max_thread_count.setter
+    def max_thread_count(self, value):
+        self.pool.setMaxThreadCount(value)
+
+    def start(self, runnable, priority=bulk_priority):
+        """
+        Queues runnable.
+
+        :param runnable: QRunnable
+        :param priority: interactive_priority or bulk_priority
+        :return: True if the runnable was queued
+        """
+        if self.is_shut_down:
+            logging.debug(f'executor is shut down, {runnable} is not started')
+            return False
+        metered = MeteredRunnable(self, runnable)
+        with self._lock:
+            self._runnables[id(runnable)] = metered
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+            self.submitted[priority] = self.submitted.get(priority, 0) + 1
+        # the pool deletes the runnable after it ran; a Python owned runnable could be deleted by finished() while
+        # its run() has not returned yet
+        sip.transferto(metered, None)
+        self.pool.start(metered, priority)
+        return True
+
+    def try_take(self, runnable):
+        """
+        Removes runnable from the queue if it did not start yet.
+
+        :return: True if the runnable was removed
+        """
+        with self._lock:
+            metered = self._runnables.get(id(runnable), None)
+        if (metered is None) or (not self.pool.tryTake(metered)):
+            return False
+        sip.transferback(metered)
+        with self._lock:
+            self._runnables.pop(id(runnable), None)
+            self.queued -= 1
+        return True
+
+    def started(self, metered):
+        with self._lock:
+            metered.is_running = True
+            self.queued -= 1
+            self.running += 1
+
+    def finished(self, metered):
+        with self._lock:
+            self._runnables.pop(id(metered.runnable), None)
+            self.running -= 1
+            self.completed += 1
+
+    def shutdown(self, timeout_ms=None):
+        """
+        Removes the queued runnables and waits for the running ones. Runnables started later are not executed.
+        Removed runnables with an on_cancelled() method are told that they will not run.
+
+        :param timeout_ms: maximum time to wait for the running runnables
+        :return: True if all running runnables finished
+        """
+        self.is_shut_down = True
+        with self._lock:
+            queued = [metered for metered in self._runnables.values() if not metered.is_running]
+        for metered in queued:
+            if not self.pool.tryTake(metered):
+                # started in the meantime
+                continue
+            sip.transferback(metered)
+            with self._lock:
+                self._runnables.pop(id(metered.runnable), None)
+            on_cancelled = getattr(metered.runnable, 'on_cancelled', None)
+            if on_cancelled is not None:
+                try:
+                    on_cancelled()
+                except Exception as e:
+                    logging.error(f'Error cancelling {metered.runnable}: {e}')
+        self.pool.clear()
+        with self._lock:
+            # the queued runnables were removed by clear
+            self._runnables = {key: metered for key, metered in self._runnables.items() if metered.is_running}
+            self.queued = 0
+        return self.pool.waitForDone(timeout_ms if timeout_ms is not None else shutdown_timeout_ms)
+
+    def stats(self):
+        with self._lock:
+            return {'queued': self.queued,
+                    'running': self.running,
+                    'completed': self.completed,
+                    'peak_queued': self.peak_queued,
+                    'interactive': self.submitted.get(interactive_priority, 0),
+                    'bulk': self.submitted.get(bulk_priority, 0),
+                    'max_thread_count': self.pool.maxThreadCount()}
+
+    def reset_stats(self):
+        with self._lock:
+            self.completed = 0
+            self.peak_queued = self.queued
+            self.submitted = {interactive_priority: 0, bulk_priority: 0}
+
+
+def get_executor():
+    """
+    Returns the executor of pyqt_info_tools; it is created on first use and shut down when the application quits.
+    """
+    global _executor
+    if _executor is None:
+        _executor = Executor(max_thread_count=max_thread_count, expiry_timeout_ms=expiry_timeout_ms)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(_executor.shutdown)
+    return _executor
+
+
+def configure(**kwargs):
+    """
+    Configures the executor.
+
+    :key max_thread_count: maximum number of threads
+    :key expiry_timeout_ms: idle threads are stopped after this time
+    :key shutdown_timeout_ms: time the running work may take on application exit
+    """
+    global max_thread_count, expiry_timeout_ms, shutdown_timeout_ms
+    max_thread_count = kwargs.get('max_thread_count', max_thread_count)
+    expiry_timeout_ms = kwargs.get('expiry_timeout_ms', expiry_timeout_ms)
+    shutdown_timeout_ms = kwargs.get('shutdown_timeout_ms', shutdown_timeout_ms)
+    if _executor is not None:
+        if max_thread_count is not None:
+            _executor.pool.setMaxThreadCount(max_thread_count)
+        _executor.pool.setExpiryTimeout(expiry_timeout_ms)
+
+
+def submit(runnable, priority=bulk_priority):
+    return get_executor().start(runnable, priority)
+
+
+def try_take(runnable):
+    return get_executor().try_take(runnable)
@@ -0,0 +1,129 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from PyQt5.QtGui import QIcon, QImage, QImageReader, QPixmap
+
+from collections import OrderedDict
+import logging
+
+from . import executor
+
+
+max_icons = 256                 # number of icons kept in the cache
+
+_icons = OrderedDict()          # ClassIcon -> QIcon, least recently used first
+_pending = {}                   # ClassIcon -> {callback: None} called when the icon is decoded
+_loader = None
+
+stats = {'hits': 0,             # icons returned from the cache
+         'misses': 0,           # icons which had to be decoded
+         'evictions': 0,        # icons removed from the full cache
+         'errors': 0}           # images which could not be decoded
+
+
+class DecodeRunnable(QRunnable):
+
+    def __init__(self, loader, path):
+        super(DecodeRunnable, self).__init__()
+        self.loader = loader
+        self.path = path
+
+    def run(self):
+        reader = QImageReader(self.path)
+        image = reader.read()
+        if image.isNull():
+            logging.error(f'Could not decode icon {self.path}: {reader.errorString()}')
+        try:
+            self.loader.decoded.emit(self.path, image)
+        except RuntimeError:
+            # the loader was deleted
+            pass
+
+
+class IconLoader(QObject):
+    """
+    Decodes images with QImageReader in the executor; the QIcon is created on the GUI thread when the decoded
+    image arrives (queued signal).
+    """
+
+    decoded = pyqtSignal(str, QImage)
+
+    def __init__(self, parent=None):
+        super(IconLoader, self).__init__(parent)
+        self.decoded.connect(self.icon_decoded)
+
+    def load(self, path):
+        executor.submit(DecodeRunnable(self, path), executor.interactive_priority)
+
+    def icon_decoded(self, path, image):
+        if image.isNull():
+            stats['errors'] += 1
+            icon = QIcon(path)
+        else:
+            icon = QIcon(QPixmap.fromImage(image))
+        store(path, icon)
+        for callback in _pending.pop(path, {}):
+            try:
+                callback(path, icon)
+            except RuntimeError:
+                # the widget of the callback was deleted
+                pass
+
+
+def get_loader():
+    global _loader
+    if _loader is None:
+        _loader = IconLoader()
+    return _loader
+
+
+def store(path, icon):
+    _icons[path] = icon
+    _icons.move_to_end(path)
+    while _icons.__len__() > max_icons:
+        _icons.popitem(last=False)
+        stats['evictions'] += 1
+
+
+def icon(class_icon, callback=None):
+    """
+    Returns the QIcon of class_icon from the cache. If the icon is not cached, its image is decoded in the thread
+    pool, None is returned and callback(class_icon, icon) is called on the GUI thread as soon as the icon is ready.
+    Equal callbacks (e.g. the same bound method) are called once per decoded icon.
+
+    :param class_icon: path or resource of the icon (ClassIcon) or QIcon
+    :param callback: function which is called with class_icon and the QIcon when the icon was decoded
+    :return: QIcon or None
+    """
+    if not isinstance(class_icon, str):
+        # already an icon or pixmap
+        return QIcon(class_icon)
+
+    cached = _icons.get(class_icon, None)
+    if cached is not None:
+        stats['hits'] += 1
+        _icons.move_to_end(class_icon)
+        return cached
+
+    stats['misses'] += 1
+    callbacks = _pending.get(class_icon, None)
+    if callbacks is None:
+        callbacks = _pending[class_icon] = {}
+        get_loader().load(class_icon)
+    if callback is not None:
+        callbacks[callback] = None
+    return None
+
+
+def hit_rate():
+    requests = stats['hits'] + stats['misses']
+    if requests == 0:
+        return 0.0
+    return stats['hits'] / requests
+
+
+def clear():
+    _icons.clear()
+
+
+def reset_stats():
+    for key in stats.keys():
+        stats[key] = 0
@@ -1,14 +1,26 @@
-from PyQt5 import QtWidgets, QtCore, QtGui
-from PyQt5.QtGui import QIntValidator, QDoubleValidator
+from PyQt5 import QtWidgets, QtCore, QtGui, sip
 from PyQt5.QtWidgets import QListWidgetItem
-from PyQt5.QtGui import QIcon
 
 from copy import copy, deepcopy
 import traceback
 import sys
 import logging
 from PyQt5.QtWidgets import QInputDialog
-from .waiting_spinner import QtWaitingSpinner, StartRunnable, StopRunnable
+from .waiting_spinner import QtWaitingSpinner
+from .tasks import TaskHandle
+from . import executor
+from .binding_plan import get_binding_plan
+from .dialog_pool import DialogPool
+from .coalescer import RefreshCoalescer
+from .commit_scheduler import CommitScheduler
+from .subscriptions import subscribe, subscribe_once, set_subscriptions, unsubscribe
+from .diff import keyed_diff, occurrence_keys
+from .models import ObjectListModel, FetchingItemModel, ValueIndex, values_equal, max_row_operations
+from .names import resolve, resolve_names
+from .streaming import is_streaming_source, as_paged_source
+from .choice_models import compute_choices, attach_choice_model, detach_choice_model
+from .async_sources import AsyncSource, placeholder_text
+from . import icon_cache
 from .config import config
 
 import threading
@@ -56,7 +68,86 @@ class CustomDropdown(QtWidgets.QWidget):
         #     self.instance.add_observer(self.choice_list.update_element, attr_dependent=[self.attr])
 
 
+class ChoiceDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Item delegate of ListViewChoice. Paints the name of the list item and its current choice as combobox; a QComboBox
+    editor is created only for the edited row. All editors use the shared choice model of the ListViewChoice.
+    """
+
+    def __init__(self, list_view_choice, parent=None):
+        super(ChoiceDelegate, self).__init__(parent)
+        self.list_view_choice = list_view_choice
+        self.choice_width = 150             # maximum width of the choice combobox
+        self._combobox_height = None
+
+    def choice_rect(self, rect):
+        width = min(self.choice_width, rect.width() // 2)
+        return QtCore.QRect(rect.right() - width + 1, rect.top(), width, rect.height())
+
+    def paint(self, painter, option, index):
+        super(ChoiceDelegate, self).paint(painter, option, index)
+        if self.list_view_choice.instance_at(index.row()) is None:
+            # placeholder row
+            return
+
+        combobox_option = QtWidgets.QStyleOptionComboBox()
+        combobox_option.rect = self.choice_rect(option.rect)
+        combobox_option.state = option.state | QtWidgets.QStyle.State_Enabled
+        combobox_option.currentText = self.list_view_choice.current_choice_name(index.row())
+        combobox_option.frame = True
+
+        widget = option.widget
+        style = widget.style() if widget is not None else QtWidgets.QApplication.style()
+        style.drawComplexControl(QtWidgets.QStyle.CC_ComboBox, combobox_option, painter, widget)
+        style.drawControl(QtWidgets.QStyle.CE_ComboBoxLabel, combobox_option, painter, widget)
+
+    def sizeHint(self, option, index):
+        size = super(ChoiceDelegate, self).sizeHint(option, index)
+        if self._combobox_height is None:
+            self._combobox_height = QtWidgets.QComboBox().sizeHint().height()
+        size.setHeight(max(size.height(), self._combobox_height))
+        return size
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QtCore.QEvent.MouseButtonPress) and \
+                self.choice_rect(option.rect).contains(event.pos()) and (option.widget is not None) and \
+                (self.list_view_choice.instance_at(index.row()) is not None):
+            option.widget.setCurrentIndex(index)
+            option.widget.edit(index)
+            return True
+        return super(ChoiceDelegate, self).editorEvent(event, model, option, index)
+
+    def createEditor(self, parent, option, index):
+        editor = QtWidgets.QComboBox(parent)
+        editor.setModel(self.list_view_choice.choice_model)
+        editor.activated.connect(lambda *args: self.commit_and_close(editor))
+        QtCore.QTimer.singleShot(0, editor.showPopup)
+        return editor
+
+    def commit_and_close(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentIndex(self.list_view_choice.current_choice_index(index.row()))
+
+    def setModelData(self, editor, model, index):
+        self.list_view_choice.set_choice(index.row(), editor.currentIndex())
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(self.choice_rect(option.rect))
+
+
 class ListViewChoice(object):
+    """
+    Shows a list of instances with a choice of the attribute edit_attr per instance. The choices are painted by a
+    ChoiceDelegate; all rows share one choice model.
+
+    With async_source the list items and the choices are computed in the thread pool; a placeholder row is shown
+    until the first list items arrive.
+
+    update_fcn is called as update_fcn(index, instance=list_item, attribute=edit_attr) after a choice was set.
+    """
 
     def __init__(self, *args, **kwargs):
 
@@ -81,18 +172,31 @@ class ListViewChoice(object):
         self._choice_value_source_fcn = kwargs.get('choice_value_source_fcn', None)  # fcn which returns choice_values
         self._choice_value_updated_fcn = kwargs.get('choice_value_updated_fcn', None)  # fcn which is executed when the attribute of the instance is changed and updates the gui element
 
-        self._list_view_widget = kwargs.get('list_view_widget', None)
-        self.model = None
-        if self._list_view_widget is not None:
-            self.model = QtGui.QStandardItemModel(self.list_view_widget)
-            self._list_view_widget.setModel(self.model)
+        self.page_size = kwargs.get('page_size', None)      # page size of streaming sources
+        self._stream = None
+        self.async_source = kwargs.get('async_source', False)   # compute items and choices in the thread pool
+        self._items_async = AsyncSource(self.items_loaded) if self.async_source else None
 
         self.list_items_attr = kwargs.get('items_attr')     # attribute of the instance which has the list with the items
         self.list_items = []
         self.item_names = []
+        self._item_rows = {}                                # id(list item) -> row
+
+        self.choice_model = None                            # ChoiceModel shared by all rows
+
+        self._list_view_widget = None
+        self.model = None
+        self.delegate = None
+        if kwargs.get('list_view_widget', None) is not None:
+            self.list_view_widget = kwargs.get('list_view_widget')
 
         self.update_fcn = kwargs.get('update_fcn', None)
 
+        self.refresh_coalescer = None
+        if kwargs.get('coalesce_updates', False):
+            self.refresh_coalescer = RefreshCoalescer(lambda key: self.update_element(),
+                                                      frame_budget_ms=kwargs.get('frame_budget_ms', 0))
+
     @property
     def list_source_instance(self):
         return self._list_source_instance
@@ -100,8 +204,7 @@ class ListViewChoice(object):
     @list_source_instance.setter
     def list_source_instance(self, value):
         self._list_source_instance = value
-        if self._list_source_instance is not None:
-            self.observe()
+        self.observe()
 
     @property
     def list_source_attr(self):
@@ -110,8 +213,7 @@ class ListViewChoice(object):
     @list_source_attr.setter
     def list_source_attr(self, value):
         self._list_source_attr = value
-        if self._list_source_attr is not None:
-            self.observe()
+        self.observe()
         self.update_element()
 
     @property
@@ -153,42 +255,242 @@ class ListViewChoice(object):
 
     @list_view_widget.setter
     def list_view_widget(self, value):
-        model = QtGui.QStandardItemModel(self.list_view_widget)
+        if value is self._list_view_widget:
+            return
+        if self.delegate is not None:
+            unsubscribe(self.delegate)
+        if self.choice_model is not None:
+            detach_choice_model(self._list_view_widget)
+            self.choice_model = None
+        model = self.create_model(value)
         value.setModel(model)
         self._list_view_widget = value
         self.model = model
+        self.delegate = ChoiceDelegate(self, value)
+        self._list_view_widget.setItemDelegate(self.delegate)
         self._list_view_widget.setSpacing(5)
+        self._list_view_widget.setUniformItemSizes(True)
+        self.observe()
+
+    def create_model(self, parent):
+        model = FetchingItemModel(parent)
+        model.can_fetch_more_fcn = self.can_fetch_more
+        model.fetch_more_fcn = self.fetch_more
+        return model
+
+    def element_changed(self, *args, **kwargs):
+        if self.refresh_coalescer is not None:
+            self.refresh_coalescer.mark_dirty()
+        else:
+            self.update_element()
 
     def update_element(self, *args, **kwargs):
         if self.list_view_widget is None:
             return
 
+        self.update_choices()
+        if self._items_async is not None:
+            # the current rows are shown until the result arrives
+            if self.model.rowCount() == 0:
+                self.show_placeholder()
+            self._items_async.request(self.load_items)
+            return
         self.generate_items()
         self.generate_item_names()
-        self.list_view_widget.blockSignals(True)
-        self.model.clear()
-        for i, list_item in enumerate(self.list_items):
-            item = QtGui.QStandardItem(self.item_names[i])
-            item.instance = list_item
-            self.model.appendRow(item)
-            self.list_view_widget.setIndexWidget(item.index(),
-                                                 CustomDropdown(instance=list_item,
-                                                                attr=self.edit_attr,
-                                                                source_instance=self.choice_source_instance,
-                                                                source_attr=self.choice_source_attr,
-                                                                name_source_fcn=self._choice_name_source_fcn,
-                                                                value_source=self._choice_value_source_fcn,
-                                                                update_fcn=self.update_fcn,
-                                                                choice_value_updated_fcn=self._choice_value_updated_fcn
-                                                                ))
-
-    def generate_items(self):
+        self.show_items()
 
+    def load_items(self):
+        """
+        Returns the list items and their names (None if they are generated from the items). Runs in the thread
+        pool if async_source is set.
+        """
         if self._list_value_source_fcn is not None:
-            self.list_items = self._list_value_source_fcn(self.instance)
+            list_items = self._list_value_source_fcn(self.instance)
         else:
             list_items = getattr(self.list_source_instance, self.list_items_attr)
+        item_names = None
+        if (self._list_name_source_fcn is not None) and (not is_streaming_source(list_items)):
+            item_names = self._list_name_source_fcn(self.instance)
+        return list_items, item_names
+
+    def items_loaded(self, result, error):
+        if self.list_view_widget is None:
+            return
+        if error is not None:
+            result = ([], None)
+        list_items, item_names = result
+        self.generate_items(list_items)
+        self.generate_item_names(list_items, item_names)
+        self.show_items()
+
+    def show_placeholder(self):
+        self.list_view_widget.blockSignals(True)
+        self.model.clear()
+        self._item_rows = {}
+        self.list_items = []
+        self._stream = None
+        item = QtGui.QStandardItem(placeholder_text)
+        item.setFlags(QtCore.Qt.ItemIsEnabled)
+        self.model.appendRow(item)
+        self.list_view_widget.blockSignals(False)
+
+    def show_items(self):
+        self.list_view_widget.blockSignals(True)
+        self.model.clear()
+        self._item_rows = {}
+        if self._stream is not None:
+            # show the first page, the next pages are appended by fetch_more
+            self._stream.ensure(self._stream.page_size)
+            self.append_rows(min(self._stream.__len__(), self._stream.page_size))
+        else:
+            self.append_rows(self.list_items.__len__())
+        self.list_view_widget.blockSignals(False)
+
+    @property
+    def choice_names(self):
+        if self.choice_model is None:
+            return []
+        return self.choice_model.choice_names
+
+    @property
+    def choice_values(self):
+        if self.choice_model is None:
+            return []
+        return self.choice_model.choice_values
+
+    def update_choices(self):
+        """
+        Attaches the list view to the ChoiceModel shared by all rows (and all other widgets of the choice source).
+        """
+        source_instance = self.choice_source_instance if self.choice_source_instance is not None else self.instance
+        previous = self.choice_model
+        self.choice_model = attach_choice_model(self.list_view_widget,
+                                                source_instance,
+                                                self.choice_source_attr,
+                                                self._choice_name_source_fcn,
+                                                self._choice_value_source_fcn,
+                                                page_size=self.page_size,
+                                                async_source=self.async_source)
+        if previous is not self.choice_model:
+            if previous is not None:
+                previous.modelReset.disconnect(self.choices_changed)
+                previous.dataChanged.disconnect(self.choices_changed)
+            self.choice_model.modelReset.connect(self.choices_changed)
+            self.choice_model.dataChanged.connect(self.choices_changed)
+        else:
+            # memoized: computes the choices only if the source changed
+            self.choice_model.refresh()
+
+    def choices_changed(self, *args, **kwargs):
+        if self.list_view_widget is not None:
+            self.list_view_widget.viewport().update()
 
+    def instance_at(self, row):
+        if (row < 0) or (row >= self.model.rowCount()) or (row >= self.list_items.__len__()):
+            return None
+        return self.list_items[row]
+
+    def current_choice_index(self, row):
+        """
+        Returns the index of the current choice of the list item in row or -1.
+        """
+        list_item = self.instance_at(row)
+        if list_item is None:
+            return -1
+        if self.choice_model is None:
+            return -1
+        return self.choice_model.row_of(getattr(list_item, self.edit_attr, None))
+
+    def current_choice_name(self, row):
+        index = self.current_choice_index(row)
+        if index < 0:
+            return ''
+        return str(self.choice_model.data(self.choice_model.index(index)))
+
+    def set_choice(self, row, index):
+        """
+        Sets the choice index of the list item in row.
+        """
+        list_item = self.instance_at(row)
+        if (list_item is None) or (self.choice_model is None):
+            return
+        value = self.choice_model.value_at(index)
+        if value is None:
+            return
+        if getattr(list_item, self.edit_attr, None) is value:
+            return
+        setattr(list_item, self.edit_attr, value)
+        self.item_changed(instance=list_item)
+        if self.update_fcn is not None:
+            self.update_fcn(index, instance=list_item, attribute=self.edit_attr)
+
+    def item_changed(self, *args, **kwargs):
+        row = self._item_rows.get(id(kwargs.get('instance', None)), None)
+        if row is None:
+            return
+        index = self.model.index(row, 0)
+        self.model.dataChanged.emit(index, index)
+
+    def can_fetch_more(self):
+        if self._stream is None:
+            return False
+        return (self.model.rowCount() < self._stream.__len__()) or (not self._stream.exhausted)
+
+    def fetch_more(self):
+        if self._stream is None:
+            return
+        row_count = self.model.rowCount() + self._stream.page_size
+        self._stream.ensure(row_count)
+        self.append_rows(min(self._stream.__len__(), row_count))
+
+    def append_rows(self, stop):
+        """
+        Appends the rows of the list items up to stop to the model.
+        """
+        start = self.model.rowCount()
+        for i in range(start, stop):
+            list_item = self.list_items[i]
+            if self._stream is not None:
+                name = resolve(list_item)
+            else:
+                name = self.item_names[i]
+            self.model.appendRow(QtGui.QStandardItem(name))
+            self._item_rows[id(list_item)] = i
+        self.observe_items(start, stop)
+
+    def observe_items(self, start=0, stop=None):
+        """
+        Observes edit_attr of the list items in the rows [start, stop); a change repaints the row. start 0 means
+        the rows were reset: the subscriptions are diffed with the rows. Otherwise the rows were appended by
+        fetch_more and only the appended rows are subscribed.
+        """
+        if (self.delegate is None) or (self.edit_attr is None):
+            return
+        list_items = [list_item for list_item in self.list_items[start:stop] if hasattr(list_item, 'add_observer')]
+        if start == 0:
+            sources = [(list_item, self.edit_attr) for list_item in list_items]
+            set_subscriptions(self.delegate, self.item_changed, sources, owner=self.list_view_widget)
+            return
+        for list_item in list_items:
+            subscribe_once(self.delegate, list_item, self.item_changed, self.edit_attr, owner=self.list_view_widget)
+
+    def generate_items(self, list_items=None):
+
+        if list_items is None:
+            if self._list_value_source_fcn is not None:
+                list_items = self._list_value_source_fcn(self.instance)
+            else:
+                list_items = getattr(self.list_source_instance, self.list_items_attr)
+
+        if is_streaming_source(list_items):
+            self._stream = as_paged_source(list_items, self._stream, page_size=self.page_size)
+            self.list_items = self._stream.loaded
+            return
+        self._stream = None
+
+        if self._list_value_source_fcn is not None:
+            self.list_items = list_items
+        else:
             if isinstance(list_items, list):
                 self.list_items = list_items
             elif isinstance(list_items, dict):
@@ -196,47 +498,33 @@ class ListViewChoice(object):
             else:
                 self.list_items = list(list_items)
 
-    def generate_item_names(self):
+    def generate_item_names(self, list_items=None, item_names=None):
 
-        if self._list_name_source_fcn is not None:
+        if self._stream is not None:
+            # the names are generated for the appended rows
+            self.item_names = []
+        elif item_names is not None:
+            self.item_names = item_names
+        elif self._list_name_source_fcn is not None:
             self.item_names = self._list_name_source_fcn(self.instance)
         else:
-            list_items = getattr(self.list_source_instance, self.list_items_attr)
-            self.item_names = ['unnamed'] * self.list_items.__len__()
-
-            if isinstance(list_items, list):
-                for i, list_item in enumerate(list_items):
-                    if hasattr(list_item, 'name'):
-                        self.item_names[i] = list_item.name
-                    elif hasattr(list_item, 'id'):
-                        self.item_names[i] = str(list_item.id)
-                    else:
-                        self.item_names[i] = str(list_item)
-
-            elif isinstance(list_items, dict):
-                for i, (key, list_item) in enumerate(list_items.items()):
-                    if isinstance(list_item, type):
-                        if hasattr(list_item, 'visible_class_name'):
-                            self.item_names[i] = list_item.visible_class_name
-                        else:
-                            self.item_names[i] = list_item.__name__
-                    else:
-                        if hasattr(list_item, 'name'):
-                            self.item_names[i] = list_item.name
-                        elif hasattr(list_item, 'id'):
-                            self.item_names[i] = str(list_item.id)
-                        else:
-                            self.item_names[i] = str(key)
+            if list_items is None:
+                list_items = getattr(self.list_source_instance, self.list_items_attr)
+            if isinstance(list_items, (list, dict)):
+                self.item_names = resolve_names(list_items)
+            else:
+                self.item_names = ['unnamed'] * self.list_items.__len__()
 
     def observe(self):
+        sources = []
         if (self.list_source_instance is not None) and (self.list_source_attr is not None):
-            if isinstance(self.list_source_instance, type):
-                self.list_source_instance.add_cls_observer(self.update_element, attr_dependent=[self.list_source_attr])
-                logging.debug(
-                    f'added observer self.update_element to db_handler, attr_dependent={[self.list_source_attr]}')
-            else:
-                self.list_source_instance.add_observer(self.update_element, attr_dependent=[self.list_source_attr])
-                logging.debug(f'added observer self.update_element to db_handler, attr_dependent={[self.list_source_attr]}')
+            sources.append((self.list_source_instance, self.list_source_attr))
+        set_subscriptions(self, self.element_changed, sources, owner=self.list_view_widget)
+
+    def unobserve(self):
+        unsubscribe(self)
+        if self.delegate is not None:
+            unsubscribe(self.delegate)
 
 
 class ChoiceList(object):
@@ -258,11 +546,25 @@ class ChoiceList(object):
         :key value_source_fcn: the function which returns the values of the choices as list
         :key choice_names: list of the choices names
         :key choice_values: list of the choices values
+        :key coalesce_updates: if True, observer notifications are coalesced to one update per event loop iteration
+        :key frame_budget_ms: time in ms notifications are coalesced
+        :key page_size: number of choices loaded per page from streaming sources (iterators, paged
+            callables, PagedSource)
+        :key async_source: if True the choices are computed in the thread pool; the combobox shows a placeholder
+            until they arrive
+
+        If the choices come from a source (source_attr or value_source_fcn), the combobox shows the ChoiceModel
+        shared by all comboboxes of this source.
         """
 
         self._gui_element = kwargs.get('gui_element', None)
+        self.page_size = kwargs.get('page_size', None)                  # page size of streaming sources
+        self.async_source = kwargs.get('async_source', False)           # compute the choices in the thread pool
+        self.choice_model = None                                        # shared ChoiceModel of the source
+        self._static_model = None                                       # ObjectListModel of the static choices
+        self._value_index = None                                        # ValueIndex of the static choice values
 
-        self.attr = kwargs.get('attr', None)                            # the attribute of the instance
+        self._attr = kwargs.get('attr', None)                           # the attribute of the instance
         self._instance = kwargs.get('instance', None)
         self.gui_element = kwargs.get('gui_element', None)
 
@@ -271,6 +573,11 @@ class ChoiceList(object):
         self._name_source_fcn = kwargs.get('name_source_fcn', None)               # fcn which returns choice_names
         self._value_source_fcn = kwargs.get('value_source', None)                 # fcn which returns choice_values
 
+        self.refresh_coalescer = None
+        if kwargs.get('coalesce_updates', False):
+            self.refresh_coalescer = RefreshCoalescer(lambda key: self.update_element(),
+                                                      frame_budget_ms=kwargs.get('frame_budget_ms', 0))
+
         self.observe()
 
         self._choice_names = kwargs.get('choice_names', [])
@@ -284,38 +591,59 @@ class ChoiceList(object):
 
     @property
     def choice_names(self):
+        if self.choice_model is not None:
+            return self.choice_model.choice_names
         return self._choice_names
 
     @choice_names.setter
     def choice_names(self, value):
-        if value == self._choice_names:
+        if (value is self._choice_names) or (value == self._choice_names):
             return
         self._choice_names = value
         self.update_gui_element_choices()
 
     @property
     def choice_values(self):
+        if self.choice_model is not None:
+            return self.choice_model.choice_values
         return self._choice_values
 
     @choice_values.setter
     def choice_values(self, value):
-        if value == self._choice_values:
+        if (value is self._choice_values) or (value == self._choice_values):
             return
         self._choice_values = value
+        self._value_index = None
         self.update_gui_element_choices()
 
+    @property
+    def attr(self):
+        return self._attr
+
+    @attr.setter
+    def attr(self, value):
+        if value == self._attr:
+            return
+        self._attr = value
+        self.observe()
+
     @property
     def gui_element(self):
+        if (self._gui_element is not None) and sip.isdeleted(self._gui_element):
+            # the combobox was deleted with its dialog
+            self._gui_element = None
         return self._gui_element
 
     @gui_element.setter
     def gui_element(self, value):
         if value == self._gui_element:
             return
+        self.release_choice_model()
         self._gui_element = value
         self._gui_element.choice_names = self.choice_names
         self._gui_element.choice_values = self.choice_values
 
+        self.observe()
         self.update_element()
 
     @property
@@ -340,8 +668,6 @@ class ChoiceList(object):
     def source_instance(self, value):
         if value == self._source_instance:
             return
-        if self.source_instance is not None:
-            self.source_instance.remove_observer(self.update_element)
         self._source_instance = value
         self.observe()
         self.update_element()
@@ -380,38 +706,75 @@ class ChoiceList(object):
         self._value_source_fcn = value
         self.observe()
 
+    @property
+    def shares_choice_model(self):
+        if self.value_source_fcn is not None:
+            return True
+        return (self.source_attr is not None) and \
+            ((self.source_instance is not None) or (self.instance is not None))
+
     def observe(self):
-        if self.source_instance is not None:
-            if isinstance(self.source_instance, type):
-                self.source_instance.add_cls_observer(self.update_element, attr_dependent=[self.list_source_attr])
-                logging.debug(
-                    f'added observer self.update_element to db_handler, attr_dependent={[self.list_source_attr]}')
-            else:
-                self.source_instance.add_observer(self.update_element, attr_dependent=[self.source_attr])
-                logging.debug(f'added observer self.update_element to db_handler, attr_dependent={[self.source_attr]}')
+        """
+        Observes source_attr of source_instance and attr of instance. Observing again replaces the subscriptions:
+        subscriptions to an old source or attribute are cancelled, unchanged ones are kept. A shared choice model
+        observes the source itself.
+        """
+        sources = []
+        if (self.source_instance is not None) and (not self.shares_choice_model):
+            sources.append((self.source_instance, self.source_attr))
+        if (self.instance is not None) and (self.attr is not None):
+            sources.append((self.instance, self.attr))
+        set_subscriptions(self, self.element_changed, sources, owner=self.gui_element)
+
+    def unobserve(self, source=None):
+        """
+        Cancels the subscriptions to source (or all subscriptions).
+        """
+        unsubscribe(self, source)
 
-        if self.instance is not None:
-            if isinstance(self.instance, type):
-                self.instance.add_cls_observer(self.update_element, attr_dependent=[self.attr])
-            else:
-                self.instance.add_observer(self.update_element, attr_dependent=[self.attr])
+    def element_changed(self, *args, **kwargs):
+        if self.refresh_coalescer is not None:
+            self.refresh_coalescer.mark_dirty()
+        else:
+            self.update_element()
+
+    @property
+    def has_choice_source(self):
+        return (self.source_attr is not None) or (self.name_source_fcn is not None) or \
+            (self.value_source_fcn is not None)
+
+    def static_choice_model(self):
+        """
+        Returns the ObjectListModel showing the static choices in the combobox; it is created and set on first use.
+        """
+        if (self._static_model is None) or (self.gui_element.model() is not self._static_model):
+            self._static_model = ObjectListModel(parent=self.gui_element)
+            blocked = self.gui_element.blockSignals(True)
+            self.gui_element.setModel(self._static_model)
+            self.gui_element.blockSignals(blocked)
+        return self._static_model
 
     def update_gui_element_choices(self):
+        """
+        Shows choice_names and choice_values in the combobox. Like in a shared ChoiceModel the rows are diffed, so the
+        combobox keeps its current value and does not emit currentIndexChanged.
+        """
+        if (self.choice_model is not None) or (self.gui_element is None):
+            # the choices are shown by the shared choice model
+            return
 
         if self.choice_values.__len__() != self.choice_names.__len__():
             return
 
-        self.gui_element.blockSignals(True)
-        self.gui_element.clear()
-        for i, name in enumerate(self.choice_names):
-            # item = QListWidgetItem()
-            # item.setText(str(name))
-            # item.instance = self.choice_values[i]
-            if hasattr(self.choice_values[i], 'ClassIcon'):
-                icon = QIcon(self.choice_values[i].ClassIcon)
-                self.gui_element.addItem(icon, name)
-            else:
-                self.gui_element.addItem(name)
+        model = self.static_choice_model()
+        blocked = self.gui_element.blockSignals(True)
+        try:
+            value = model.instance_at(self.gui_element.currentIndex())
+            model.set_objects(self.choice_values, self.choice_names)
+            if (value is None) or (model.instance_at(self.gui_element.currentIndex()) is not value):
+                self.gui_element.setCurrentIndex(model.row_of(value) if value is not None else -1)
+        finally:
+            self.gui_element.blockSignals(blocked)
 
     def update_element(self, *args, ** kwargs):
 
@@ -420,76 +783,107 @@ class ChoiceList(object):
 
         self.update_choices()
 
+        self.select_current_value()
+
+    def select_current_value(self, *args, **kwargs):
+        if self.gui_element is None:
+            return
+
+        if self.choice_model is not None:
+            # the shared model keeps the selection on changes, setting the value is no edit
+            self.gui_element.blockSignals(True)
+
         cur_val = getattr(self.instance, self.attr)
         if cur_val is not None:
-            if cur_val in list(self.choice_values):
-                cur_index = list(self.choice_values).index(cur_val)
+            cur_index = self.choice_index(cur_val)
+            if cur_index >= 0:
                 self.gui_element.setCurrentIndex(cur_index)
         self.gui_element.blockSignals(False)
 
+    def choice_index(self, value):
+        """
+        Returns the index of value in choice_values or -1. The lookup uses a ValueIndex which is rebuilt only when
+        the choices change.
+        """
+        if self.choice_model is not None:
+            return self.choice_model.row_of(value)
+        if self._value_index is None:
+            self._value_index = ValueIndex(self._choice_values)
+        return self._value_index.index(value)
+
     def update_choices(self):
 
-        if self.name_source_fcn is not None:
-            if self.name_source_fcn is self.value_source_fcn:
-                if self.source_instance is None:
-                    source_instance = self.instance
-                else:
-                    source_instance = self.source_instance
-                self.choice_names, self.choice_values = self.value_source_fcn(source_instance)
+        if self.shares_choice_model:
+            source_instance = self.source_instance if self.source_instance is not None else self.instance
+            previous = self.choice_model
+            self.choice_model = attach_choice_model(self.gui_element,
+                                                    source_instance,
+                                                    self.source_attr,
+                                                    self.name_source_fcn,
+                                                    self.value_source_fcn,
+                                                    page_size=self.page_size,
+                                                    async_source=self.async_source)
+            if self.choice_model is previous:
+                # memoized: computes the choices only if the source changed
+                self.choice_model.refresh()
             else:
-                self.choice_names = self._name_source_fcn()
-                self.choice_values = self._value_source_fcn()
+                if previous is not None:
+                    previous.choices_loaded.disconnect(self.select_current_value)
+                self.choice_model.choices_loaded.connect(self.select_current_value)
+            self.gui_element.choice_names = self.choice_names
+            self.gui_element.choice_values = self.choice_values
+            return
 
-        else:
-            if self.name_source_fcn is not None:
-                choice_names = self.name_source_fcn(self.source_instance)
-            else:
-                choice_names = getattr(self.source_instance, self.source_attr)
-                choice_names_list = []
-                if isinstance(choice_names, dict):
-                    for key, choice_name in choice_names.items():
-                        if isinstance(choice_name, type):
-                            if hasattr(choice_name, 'visible_class_name'):
-                                choice_names_list.append(choice_name.visible_class_name)
-                            else:
-                                choice_names_list.append(choice_name.__name__)
-                        else:
-                            if hasattr(choice_name, 'name'):
-                                choice_names_list.append(choice_name.name)
-                            else:
-                                choice_names_list.append(str(key))
-                else:
-                    choice_names_list = []
-                    for choice_name in choice_names:
-                        if isinstance(choice_name, type):
-                            if hasattr(choice_name, 'visible_class_name'):
-                                choice_names_list.append(choice_name.visible_class_name)
-                            else:
-                                choice_names_list.append(choice_name.__name__)
-                        else:
-                            if hasattr(choice_name, 'name'):
-                                choice_names_list.append(choice_name.name)
-                            elif hasattr(choice_name, 'id'):
-                                choice_names_list.append(choice_name.id)
-                            else:
-                                choice_names_list.append(str(choice_name))
-                choice_names = choice_names_list
-
-            if self.value_source_fcn is not None:
-                choice_values = self.value_source_fcn(self.source_instance)
-            else:
-                choice_values = getattr(self.source_instance, self.source_attr)
-                if isinstance(choice_values, dict):
-                    choice_values = list(choice_values.values())
-                elif not isinstance(choice_values, list):
-                    choice_values = list(choice_values)
-                else:
-                    choice_values = choice_values
+        if self.choice_model is not None:
+            # back from a shared model: the static choices are shown by a new model
+            self.release_choice_model()
+            self._choice_names = []
+            self._choice_values = []
+            self._static_model = None
+
+        if not self.has_choice_source:
+            # static choices: the combobox is filled once, the choice_names / choice_values setters update it
+            if self.gui_element.model() is not self._static_model:
+                self.update_gui_element_choices()
+            return
 
-            self.choice_names = choice_names
-            self.choice_values = choice_values
+        self.set_choices(*compute_choices(self.instance,
+                                          self.source_instance,
+                                          self.source_attr,
+                                          self.name_source_fcn,
+                                          self.value_source_fcn))
 
+    def unbind(self):
+        """
+        Detaches the ChoiceList from its instance and gui element: cancels the subscriptions and releases the shared
+        choice model. The ChoiceList is bound again by setting instance, attr and gui_element.
+        """
+        self.unobserve()
+        self.release_choice_model()
+        self._instance = None
+        self._gui_element = None
+
+    def release_choice_model(self):
+        if self.choice_model is None:
+            return
+        self.choice_model.choices_loaded.disconnect(self.select_current_value)
+        detach_choice_model(self._gui_element)
+        self.choice_model = None
 
+    def set_choices(self, choice_names, choice_values):
+        """
+        Sets the names and values of the choices and updates the combobox once.
+        """
+        changed = False
+        if not ((choice_names is self._choice_names) or (choice_names == self._choice_names)):
+            self._choice_names = choice_names
+            changed = True
+        if not ((choice_values is self._choice_values) or (choice_values == self._choice_values)):
+            self._choice_values = choice_values
+            self._value_index = None
+            changed = True
+        if changed:
+            self.update_gui_element_choices()
 
     def generate_from_observed_instance_attr(self, attr, source_instance=None):
         """
@@ -504,7 +898,7 @@ class ChoiceList(object):
         else:
             self.source_instance = source_instance
         self.source_attr = attr
-        fcn = lambda x: get_names_and_values_list(x, self.source_attr)
+        fcn = NamesAndValues(attr)
         self.name_source_fcn = fcn
         self.value_source_fcn = fcn
         self.update_element()
@@ -514,38 +908,207 @@ class CustomDialog(QtWidgets.QDialog):
 
     def __init__(self, *args, **kwargs):
         QtWidgets.QDialog.__init__(self, *args, **kwargs)
-        self.spinner = QtWaitingSpinner(self, True, True, QtCore.Qt.ApplicationModal)
-        self.__running = False
+        self._spinner = None
+        self._running_tasks = 0             # the spinner is shown while tasks are running
+
+    @property
+    def spinner(self):
+        # most dialogs never show the spinner, it is created on first use
+        if self._spinner is None:
+            self._spinner = QtWaitingSpinner(self, True, True, QtCore.Qt.ApplicationModal)
+        return self._spinner
 
     def resizeEvent(self, event):
-        self.spinner.updateSize()
+        if (self._spinner is not None) and self._spinner.isVisible():
+            self._spinner.updateSize()
         event.accept()
 
     @QtCore.pyqtSlot()
     def finished_process(self):
-        print('stop spinner')
-        if self.__running:
-            self.spinner.stop()
-            self.__running = False
+        if self._running_tasks == 0:
+            return
+        self._running_tasks -= 1
+        if (self._running_tasks == 0) and (self._spinner is not None):
+            self._spinner.stop()
 
     @QtCore.pyqtSlot()
     def start_process(self):
-        print('start spinner')
-        if not self.__running:
+        self._running_tasks += 1
+        if self._running_tasks == 1:
             self.spinner.start()
-            self.__running = True
+
+    def run_task(self, fcn, args=(), kwargs=None, priority=executor.bulk_priority):
+        """
+        Runs fcn(*args, **kwargs) in the executor and shows the spinner until it finished. The spinner is
+        reference counted: it is shown until the last running task finished.
+
+        :param priority: executor.bulk_priority or executor.interactive_priority
+        :return: TaskHandle; its done callbacks are called on the GUI thread
+        """
+        handle = TaskHandle(fcn, args, kwargs, priority=priority)
+        # posted like start_waiting, so the spinner is started before the queued done callback stops it
+        QtCore.QMetaObject.invokeMethod(self, "start_process", QtCore.Qt.QueuedConnection)
+        handle.add_done_callback(lambda *args: self.finished_process())
+        return handle.start()
 
     def start_waiting(self, fcn=None, args=(), kwargs={}):
-        # QtCore.QThreadPool.globalInstance().start(StartRunnable(dialog=self))
-        start_runnable = StartRunnable(dialog=self, fcn=fcn, args=args, kwargs=kwargs)
-        # config.app.threadpool.start(start_runnable)
-        QtCore.QThreadPool.globalInstance().start(start_runnable)
+        if fcn is None:
+            # posted to the GUI thread, can be called from any thread
+            QtCore.QMetaObject.invokeMethod(self, "start_process", QtCore.Qt.QueuedConnection)
+            return None
+        return self.run_task(fcn, args, kwargs)
 
     def stop_waiting(self):
-        # QtCore.QThreadPool.globalInstance().start(StopRunnable(dialog=self))
-        stop_runnable = StopRunnable(dialog=self)
-        # config.app.threadpool.start(stop_runnable)
-        QtCore.QThreadPool.globalInstance().start(stop_runnable)
+        QtCore.QMetaObject.invokeMethod(self, "finished_process", QtCore.Qt.QueuedConnection)
+
+
+def create_dialog(ui_info, parent=None):
+    """
+    Creates a new CustomDialog and sets up the ui_info on it.
+
+    :param ui_info: the ui class
+    :param parent: parent of the dialog
+    :return: CustomDialog
+    """
+    if parent is None:
+        dialog = CustomDialog()
+    else:
+        dialog = CustomDialog(parent)
+    dialog.setWindowFlag(QtCore.Qt.WindowMinimizeButtonHint, True)
+    dialog.setWindowFlag(QtCore.Qt.WindowMaximizeButtonHint, True)
+    dialog.ui = ui_info()
+    dialog.ui.setupUi(dialog)
+    return dialog
+
+
+dialog_pool = DialogPool(build_fcn=create_dialog)
+
+
+def object_list_item_text(key, instance):
+    return resolve(instance, key)
+
+
+def create_object_list_item(key, instance, text=None):
+    item = QListWidgetItem()
+    item.setText(text if text is not None else object_list_item_text(key, instance))
+    item.instance = instance
+    class_icon = getattr(instance, 'ClassIcon', None)
+    if class_icon is not None:
+        icon = icon_cache.icon(class_icon, callback=lambda class_icon, icon: item.setIcon(icon))
+        if icon is not None:
+            item.setIcon(icon)
+    return item
+
+
+def update_object_list_widget(list_widget, value):
+    """
+    Updates the items of list_widget to the objects of value (sequence or dict). The rows are diffed by object
+    identity: only inserted, removed and moved objects change items, so the selection and the scroll position of
+    unchanged rows are kept. If more than max_row_operations rows change, the items are rebuilt and the selection
+    and the scroll position are restored.
+
+    The keys and texts of the rows are kept in list_widget.item_keys and list_widget.item_texts, so only items whose
+    name changed are touched.
+
+    :param list_widget: QListWidget
+    :param value: sequence or dict of the objects
+    :return:
+    """
+    if value is None:
+        keys, objects = [], []
+    elif isinstance(value, dict):
+        keys, objects = list(value.keys()), list(value.values())
+    else:
+        objects = list(value)
+        keys = objects
+    texts = resolve_names(objects, keys)
+
+    new_keys = occurrence_keys(list(map(id, objects)))
+    old_keys = getattr(list_widget, 'item_keys', None)
+    old_texts = getattr(list_widget, 'item_texts', None)
+    if (old_keys is None) or (old_keys.__len__() != list_widget.count()) or (old_texts is None):
+        old_keys = []
+        list_widget.clear()
+
+    operations = None
+    if old_keys:
+        operations = keyed_diff(old_keys, new_keys, max_operations=max_row_operations)
+    if operations is None:
+        # rebuilding is cheaper than many single row changes
+        rebuild_object_list_widget(list_widget, keys, objects, texts, old_keys, new_keys)
+        return
+
+    current_texts = list(old_texts)
+    blocked = list_widget.blockSignals(True)
+    try:
+        for operation in operations:
+            if operation[0] == 'remove':
+                row = operation[1]
+                list_widget.takeItem(row)
+                del current_texts[row]
+            elif operation[0] == 'insert':
+                row = operation[1]
+                list_widget.insertItem(row, create_object_list_item(keys[row], objects[row], texts[row]))
+                current_texts.insert(row, texts[row])
+            elif operation[0] == 'move':
+                from_row, row = operation[1:]
+                # taken items are not selected
+                selected = list_widget.item(from_row).isSelected()
+                item = list_widget.takeItem(from_row)
+                list_widget.insertItem(row, item)
+                item.setSelected(selected)
+                current_texts.insert(row, current_texts.pop(from_row))
+
+        # names of unchanged objects may have changed
+        if current_texts != texts:
+            for row, text in enumerate(texts):
+                if current_texts[row] != text:
+                    list_widget.item(row).setText(text)
+    finally:
+        list_widget.blockSignals(blocked)
+
+    list_widget.item_keys = new_keys
+    list_widget.item_texts = texts
+
+
+def rebuild_object_list_widget(list_widget, keys, objects, texts, old_keys, new_keys):
+    selected_keys = {old_keys[index.row()] for index in list_widget.selectionModel().selectedIndexes()}
+    scroll_position = list_widget.verticalScrollBar().value()
+
+    blocked = list_widget.blockSignals(True)
+    try:
+        list_widget.clear()
+        for row, instance in enumerate(objects):
+            list_widget.addItem(create_object_list_item(keys[row], instance, texts[row]))
+        if selected_keys:
+            for row, key in enumerate(new_keys):
+                if key in selected_keys:
+                    list_widget.item(row).setSelected(True)
+    finally:
+        list_widget.blockSignals(blocked)
+
+    list_widget.verticalScrollBar().setValue(scroll_position)
+    list_widget.item_keys = new_keys
+    list_widget.item_texts = texts
+
+
+class NamesAndValues(object):
+    """
+    Hashable name and value source fcn of an observed instance attribute, so ChoiceLists generated for the same
+    attribute share their ChoiceModel.
+    """
+
+    def __init__(self, attr):
+        self.attr = attr
+
+    def __call__(self, obj):
+        return get_names_and_values_list(obj, self.attr)
+
+    def __eq__(self, other):
+        return isinstance(other, NamesAndValues) and (other.attr == self.attr)
+
+    def __hash__(self):
+        return hash((NamesAndValues, self.attr))
 
 
 def get_names_and_values_list(obj, attr):
@@ -558,27 +1121,17 @@ def get_names_and_values_list(obj, attr):
     if x is None:
         return [], []
 
-    names = [''] * x.__len__()
-    values = [None] * x.__len__()
+    if is_streaming_source(x):
+        # the names are computed by the model for the loaded rows
+        return [], x
 
     if isinstance(x, dict):
-        for i, (key, value) in enumerate(x.items()):
-            if hasattr(value, 'name'):
-                names[i] = value.name
-            else:
-                names[i] = str(key)
-            values[i] = value
+        return resolve_names(x), list(x.values())
     elif isinstance(x, list) or isinstance(x, set):
-        for i, value in enumerate(x):
-            if hasattr(value, 'name'):
-                names[i] = value.name
-            elif hasattr(value, 'id'):
-                names[i] = str(value.id)
-            else:
-                names[i] = str(value)
-            values[i] = value
+        values = list(x)
+        return resolve_names(values), values
 
-    return names, values
+    return [''] * x.__len__(), [None] * x.__len__()
 
 
 class InfoBaseClass(object):
@@ -593,6 +1146,7 @@ class InfoBaseClass(object):
     ['static']:                 label                   {key}_label
     ['object']                  label                   {key}_label                 (single element)
     ['object']                  listWidget              {key}_listWidget            (multiple elements)
+    ['object']                  listView                {key}_listView              (multiple elements, backend 'model')
     ['choice']                  comboBox                {key}_comboBox
 
 
@@ -627,6 +1181,16 @@ class InfoBaseClass(object):
                                                }
                             'direct_edit': True},
 
+    - '<many_objects': {'type': 'object',
+                        'select': {'type': 'multiple',
+                                   'backend': 'model',
+                                   'selectable_objects': [<selectable_obj_gui_cls1>]
+                                   }
+                        'direct_edit': True},
+
+      The objects are shown in a QListView through an ObjectListModel: names and icons are computed for the
+      shown rows only.
+
     - '<attr_choice>' = {'type': 'choice', 'choices': {'choice_name1': choice1,
                                                        'choice_name2': choice2
                                                        }
@@ -635,6 +1199,24 @@ class InfoBaseClass(object):
     - '<attr_choice>' = {'type': 'choice', 'choices': ChoicesList()}
 
 
+    commit policy:
+    --------------
+    For line edits and text edits the policy when edits are written to the instance can be set:
+
+    - '<attr>': {'type': str, 'commit': 'keystroke'}                       on every keystroke (default)
+    - '<attr>': {'type': str, 'commit': 'debounce', 'debounce_ms': 250}    debounce_ms after the last keystroke
+    - '<attr>': {'type': str, 'commit': 'finished'}                        on editingFinished / focus out
+
+    Pending edits are written before the dialog is accepted or closed.
+
+
+    accept:
+    -------
+    On accept only the attributes whose value differs from the initial value are written to the instance. If the
+    instance has the methods begin_transaction() and end_transaction(), all writes are done between them, so the
+    instance can send one aggregated notification (observers are called with the keyword 'attributes').
+
+
     edit and new:
     -------------
     For objects
@@ -667,9 +1249,13 @@ class InfoBaseClass(object):
                            'pid': static_str,
                            }
 
+    use_dialog_pool = False
+    coalesce_updates = False
+    frame_budget_ms = 0
+
     def __init__(self, *args, **kwargs):
 
-        ui_info = kwargs.get('ui_info', None)
+        self.ui_info = kwargs.get('ui_info', None)
 
         self._new_cls = kwargs.get('cls', None)
         self.create_new = kwargs.get('create_new', False)
@@ -684,30 +1270,34 @@ class InfoBaseClass(object):
         self.main_window = kwargs.get('main_window', None)
 
         self.key_gui_lookup_dict = {}
+        self.binding_plan = None
 
         self.values = {}
         for key in self.editable_attributes.keys():
             self.values[key] = getattr(self.instance, key)
         self.initial_values = copy(self.values)
 
-        if self.main_window is None:
-            if config.app is not None:
-                if hasattr(config.app, 'MainWindow'):
-                    self.dialog = CustomDialog(config.app.MainWindow)
-                else:
-                    self.dialog = CustomDialog()
-            else:
-                self.dialog = CustomDialog()
-        else:
-            self.dialog = CustomDialog(self.main_window)
+        self.use_dialog_pool = kwargs.get('use_dialog_pool', self.use_dialog_pool)
+        self._connections = []
+
+        self._subscription = None
+        self._echo_attr = None              # attribute which is currently written from the gui
+        self.echo_suppressed = 0
 
-        self.waiting_dialog = self.dialog.spinner
+        self.commit_scheduler = CommitScheduler(self.commit_gui_element)
+
+        self.refresh_coalescer = None
+        if kwargs.get('coalesce_updates', self.coalesce_updates):
+            self.refresh_coalescer = RefreshCoalescer(self.refresh_gui_element,
+                                                      frame_budget_ms=kwargs.get('frame_budget_ms',
+                                                                                 self.frame_budget_ms))
+
+        if self.use_dialog_pool:
+            self.dialog, _ = dialog_pool.acquire(self.ui_info, self.dialog_parent)
+        else:
+            self.dialog = create_dialog(self.ui_info, self.dialog_parent)
 
         self.set_style()
-        self.dialog.setWindowFlag(QtCore.Qt.WindowMinimizeButtonHint, True)
-        self.dialog.setWindowFlag(QtCore.Qt.WindowMaximizeButtonHint, True)
-        self.dialog.ui = ui_info()
-        self.dialog.ui.setupUi(self.dialog)
 
         self.connect_to_gui_editor()
 
@@ -727,8 +1317,8 @@ class InfoBaseClass(object):
         self.update_fields()
         self.add_connections()
 
-        self.dialog.ui.buttonBox.accepted.connect(self.accept_event)
-        self.dialog.ui.buttonBox.rejected.connect(self.close_event)
+        self.connect_signal(self.dialog.ui.buttonBox.accepted, self.accept_event)
+        self.connect_signal(self.dialog.ui.buttonBox.rejected, self.close_event)
 
         self._edited_attr = None
 
@@ -736,6 +1326,30 @@ class InfoBaseClass(object):
 
         # self.waiting_dialog.start()
 
+    @property
+    def dialog_parent(self):
+        if self.main_window is not None:
+            return self.main_window
+        if config.app is not None:
+            if hasattr(config.app, 'MainWindow'):
+                return config.app.MainWindow
+        return None
+
+    @classmethod
+    def prewarm_dialogs(cls, ui_info, count=1, main_window=None):
+        """
+        Builds dialogs for ui_info in the dialog pool while the event loop is idle.
+
+        :param ui_info: the ui class
+        :param count: number of idle dialogs which should be available
+        :param main_window: parent of the dialogs
+        :return:
+        """
+        if main_window is None:
+            if (config.app is not None) and hasattr(config.app, 'MainWindow'):
+                main_window = config.app.MainWindow
+        dialog_pool.prewarm(ui_info, count=count, parent=main_window)
+
     @property
     def selection_handler(self):
         if self._selection_handler is None:
@@ -753,223 +1367,247 @@ class InfoBaseClass(object):
 
     def connect_to_gui_editor(self):
 
-        for key, value in self.editable_attributes.items():
-            # find the gui edit element:
-            if isinstance(value, dict):
-                attr_type = value['type']
-            else:
-                attr_type = value
-
-            if attr_type in [int, float, str, bool, 'text', 'static', 'object', 'choice', 'list_choice']:
-
-                gui_edit_element_name = None
-                if attr_type in [int, float, str]:
-                    gui_edit_element_name = f'{key}_lineEdit'
-                elif attr_type in [bool]:
-                    gui_edit_element_name = f'{key}_radioButton'
-                elif attr_type == 'text':
-                    gui_edit_element_name = f'{key}_textEdit'
-                elif attr_type == 'static':
-                    gui_edit_element_name = f'{key}_label'
-                elif attr_type == 'object':
-                    if value['select']['type'] == 'single':
-                        gui_edit_element_name = f'{key}_label'
-                    elif value['select']['type'] == 'multiple':
-                        gui_edit_element_name = f'{key}_listWidget'
-                elif attr_type == 'choice':
-                    gui_edit_element_name = f'{key}_comboBox'
-                elif attr_type == 'list_choice':
-                    if 'key' in self.editable_attributes[key].keys():
-                        this_key = self.editable_attributes[key]['key']
-                        gui_edit_element_name = f'{this_key}_listView'
-                    else:
-                        gui_edit_element_name = f'{key}_listView'
-
-                if gui_edit_element_name is None:
-                    print(f'attr_type {attr_type} not supported')
-                    logging.error(f'attr_type {attr_type} not supported')
-                    continue
-
-                if not hasattr(self.dialog.ui, gui_edit_element_name):
-                    print(f'Gui edit element for {key} not found')
-                    logging.error(f'Gui edit element for {key} not found')
-                    continue
-
-                if attr_type in [int, float, str, bool, 'text', 'static']:
-                    gui_edit_element = getattr(self.dialog.ui, gui_edit_element_name)
-                    self.key_gui_lookup_dict[key] = gui_edit_element
-                    print(gui_edit_element)
-
-                    gui_edit_element.instance_attr = deepcopy(key)
-                    gui_edit_element.instance = self.instance
-
-                    validator = None
-                    # add validator:
-                    if isinstance(value, dict):
-                        if value['type'] is int:
-                            validator = QIntValidator()
-                        elif value['type'] is float:
-                            validator = QDoubleValidator()
-                    else:
-                        if value is int:
-                            validator = QIntValidator()
-                        elif value is float:
-                            validator = QDoubleValidator()
-
-                    if 'bottom' in value.keys():
-                        if value['bottom'] is not None:
-                            validator.setBottom(value['bottom'])
-                    if 'top' in value.keys():
-                        if value['top'] is not None:
-                            validator.setBottom(value['top'])
-
-                    if validator is not None:
-                        gui_edit_element.setValidator(validator)
-
-                    if isinstance(gui_edit_element, QtWidgets.QLineEdit) or isinstance(gui_edit_element,
-                                                                                       QtWidgets.QTextEdit):
-                        cur_val = getattr(self.instance, key)
-                        if cur_val is not None:
-                            gui_edit_element.setText(str(cur_val))
-                        else:
-                            gui_edit_element.setText('')
-                        gui_edit_element.textChanged.connect(self.update_instance)
-                        self.instance.add_observer(self.update_gui_element, attr_dependent=[key])
-                    elif isinstance(gui_edit_element, QtWidgets.QRadioButton):
-                        cur_val = getattr(self.instance, key)
-                        if cur_val is not None:
-                            gui_edit_element.setChecked(cur_val)
-                        else:
-                            gui_edit_element.setChecked(False)
-                        gui_edit_element.toggled.connect(self.update_instance)
-                        self.instance.add_observer(self.update_gui_element, attr_dependent=[key])
-                    elif isinstance(gui_edit_element, QtWidgets.QLabel):
-                        cur_val = getattr(self.instance, key)
-                        if cur_val is not None:
-                            gui_edit_element.setText(str(cur_val))
-                        else:
-                            gui_edit_element.setText('')
-                        self.instance.add_observer(self.update_gui_element, attr_dependent=[key])
-
-                elif attr_type == 'object':
-                    cur_val = getattr(self.instance, key)
-                    self.instance.add_observer(self.update_gui_element, attr_dependent=[key])
-
-                    if value['select']['type'] == 'single':
-
-                        gui_edit_element_name = f'{key}_label'
-                        gui_edit_element = getattr(self.dialog.ui, gui_edit_element_name)
-                        self.key_gui_lookup_dict[key] = gui_edit_element
-                        if cur_val is not None:
-                            gui_edit_element.setText(str(cur_val.name))
-                        else:
-                            gui_edit_element.setText(str(''))
-                        # add click event to show instance info when clicked:
-                        gui_edit_element.instance = cur_val
-                        print('to implement')
-                        gui_edit_element.clicked.connect(self.object_label_clicked)
-
-                    elif value['select']['type'] == 'multiple':
-                        gui_edit_element_name = f'{key}_listWidget'
-                        gui_edit_element = getattr(self.dialog.ui, gui_edit_element_name)
-                        self.key_gui_lookup_dict[key] = gui_edit_element
-                        gui_edit_element.itemDoubleClicked.connect(handle_double_click)
-                        gui_edit_element.clear()
-                        if cur_val is not None:
-                            if isinstance(cur_val, list):
-                                for instance in cur_val:
-                                    item = QListWidgetItem()
-                                    if hasattr(instance, 'name'):
-                                        item.setText(instance.name)
-                                    else:
-                                        item.setText(str(instance))
-                                    item.instance = instance
-                                    if hasattr(item, 'ClassIcon'):
-                                        item.setIcon(QIcon(item.ClassIcon))
-                                    gui_edit_element.addItem(item)
-
-                            elif isinstance(cur_val, dict):
-                                for key, instance in cur_val.items():
-                                    item = QListWidgetItem()
-                                    if hasattr(instance, 'name'):
-                                        item.setText(instance.name)
-                                    else:
-                                        item.setText(str(key))
-                                    item.instance = instance
-                                    if hasattr(item, 'ClassIcon'):
-                                        item.setIcon(QIcon(item.ClassIcon))
-                                    gui_edit_element.addItem(item)
-
-                    edit_button_gui_edit_element_name = f'{key}_edit_pushButton'
-                    if not hasattr(self.dialog.ui, edit_button_gui_edit_element_name):
-                        print(f'Gui edit button for {key} not found')
-                        logging.error(f'Gui edit button for {key} not found')
-                    else:
-                        edit_button = getattr(self.dialog.ui, edit_button_gui_edit_element_name)
-                        edit_button.instance_attr = deepcopy(key)
-                        edit_button.clicked.connect(self.select_objects)
-
-                    add_new_button_name = f'{key}_new_pushButton'
-                    if not hasattr(self.dialog.ui, add_new_button_name):
-                        print(f'No Gui add new button for {key} found')
-                        logging.error(f'No Gui add new button for {key} found')
+        self.binding_plan = get_binding_plan(self.__class__, self.ui_info, self.dialog.ui, self.editable_attributes)
+        for binding in self.binding_plan:
+            self.connect_gui_element(binding)
+            self.bind_gui_element(binding)
+        self.observe_instance()
+
+    def connect_gui_element(self, binding):
+        """
+        Replays the instance independent part of a compiled AttributeBinding (validators and signal connections)
+        against the gui edit element of this dialog.
+
+        :param binding: AttributeBinding
+        :return:
+        """
+        key = binding.key
+        gui_edit_element = getattr(self.dialog.ui, binding.widget_name)
+        self.key_gui_lookup_dict[key] = gui_edit_element
+        gui_edit_element.instance_attr = key
+
+        if binding.kind in ['line_edit', 'text_edit', 'radio_button', 'label']:
+            if (binding.validator_type is not None) and (gui_edit_element.validator() is None):
+                gui_edit_element.setValidator(binding.create_validator(gui_edit_element))
+
+            if binding.kind in ['line_edit', 'text_edit']:
+                self.connect_signal(gui_edit_element.textChanged, self.update_instance)
+                if binding.commit == 'finished':
+                    if binding.kind == 'line_edit':
+                        self.connect_signal(gui_edit_element.editingFinished, self.finish_editing)
                     else:
-                        add_new_button = getattr(self.dialog.ui, add_new_button_name)
-                        add_new_button.instance_attr = deepcopy(key)
-                        add_new_button.clicked.connect(self.add_new_object)
+                        self.commit_scheduler.watch_focus_out(gui_edit_element)
+            elif binding.kind == 'radio_button':
+                self.connect_signal(gui_edit_element.toggled, self.update_instance)
+
+        elif binding.kind in ['object_single', 'object_multiple']:
+            if binding.kind == 'object_single':
+                # add click event to show instance info when clicked:
+                self.connect_signal(gui_edit_element.clicked, self.object_label_clicked)
+            elif binding.backend == 'model':
+                gui_edit_element.setUniformItemSizes(True)
+                # lay out the rows in batches, so large lists are shown before all rows are laid out
+                gui_edit_element.setLayoutMode(QtWidgets.QListView.Batched)
+                if not isinstance(gui_edit_element.model(), ObjectListModel):
+                    gui_edit_element.setModel(ObjectListModel(parent=gui_edit_element))
+                self.connect_signal(gui_edit_element.doubleClicked, handle_index_double_click)
+            else:
+                self.connect_signal(gui_edit_element.itemDoubleClicked, handle_double_click)
+
+            if binding.edit_button_name is not None:
+                edit_button = getattr(self.dialog.ui, binding.edit_button_name)
+                edit_button.instance_attr = key
+                self.connect_signal(edit_button.clicked, self.select_objects)
+
+            if binding.new_button_name is not None:
+                add_new_button = getattr(self.dialog.ui, binding.new_button_name)
+                add_new_button.instance_attr = key
+                self.connect_signal(add_new_button.clicked, self.add_new_object)
+
+        elif binding.kind == 'choice':
+            if not isinstance(binding.spec['choices'], ChoiceList):
+                # add all choices
+                gui_edit_element.blockSignals(True)
+                gui_edit_element.clear()
+                gui_edit_element.addItems(binding.spec['choices'].keys())
+                gui_edit_element.blockSignals(False)
 
-                elif attr_type == 'choice':
+            # connect to changes
+            self.connect_signal(gui_edit_element.currentIndexChanged, self.update_instance)
 
-                    gui_edit_element = getattr(self.dialog.ui, gui_edit_element_name)
-                    gui_edit_element.instance_attr = deepcopy(key)
-                    gui_edit_element.instance = self.instance
+        elif binding.kind == 'list_choice':
+            if not isinstance(binding.spec['object'], ListViewChoice):
+                # add all choices
+                gui_edit_element.addItems(binding.spec['choices'].keys())
 
-                    self.key_gui_lookup_dict[key] = gui_edit_element
-                    print(gui_edit_element)
+    def bind_gui_element(self, binding):
+        """
+        Replays the instance dependent part of a compiled AttributeBinding: binds the gui edit element to the instance,
+        writes the current value and observes the attribute.
 
-                    # init_gui_element:
-                    # ---------------------------
+        :param binding: AttributeBinding
+        :return:
+        """
+        key = binding.key
+        gui_edit_element = self.key_gui_lookup_dict[key]
 
-                    if isinstance(value['choices'], ChoiceList):
-                        choice_list = value['choices']
-                        choice_list.instance = self.instance
-                        choice_list.attr = key
-                        choice_list.gui_element = gui_edit_element
-                        # choice_list.update_element()
-                    else:
-                        # add all choices
-                        gui_edit_element.addItems(value['choices'].keys())
-
-                    # set current index:
-                    cur_val = getattr(self.instance, key)
-                    if cur_val is not None:
-                        if cur_val in list(value['choices'].choice_values):
-                            cur_index = list(value['choices'].choice_values).index(cur_val)
-                            gui_edit_element.setCurrentIndex(cur_index)
-
-                    # connect to changes
-                    gui_edit_element.currentIndexChanged.connect(self.update_instance)
-
-                elif attr_type == 'list_choice':
-                    gui_edit_element = getattr(self.dialog.ui, gui_edit_element_name)
-                    gui_edit_element.instance_attr = deepcopy(key)
-                    self.key_gui_lookup_dict[key] = gui_edit_element
-                    print(gui_edit_element)
-
-                    if isinstance(value['object'], ListViewChoice):
-                        choice_list = value['object']
-                        choice_list.instance = self.instance
-                        choice_list.update_fcn = self.update_instance
-                        # if 'key' in self.editable_attributes[key].keys():
-                        #     this_key = self.editable_attributes[key]['key']
-                        # else:
-                        #     this_key = key
-                        # choice_list.edit_attr = this_key
-                        choice_list.list_view_widget = gui_edit_element
-                        choice_list.update_element()
-                    else:
-                        # add all choices
-                        gui_edit_element.addItems(value['choices'].keys())
+        if binding.kind in ['line_edit', 'text_edit', 'radio_button', 'label']:
+            gui_edit_element.instance = self.instance
+            self.set_gui_element_value(binding, gui_edit_element)
+
+        elif binding.kind in ['object_single', 'object_multiple']:
+            self.set_gui_element_value(binding, gui_edit_element)
+
+        elif binding.kind == 'choice':
+            gui_edit_element.instance = self.instance
+            choice_list = binding.spec['choices']
+            if isinstance(choice_list, ChoiceList):
+                choice_list.instance = self.instance
+                choice_list.attr = key
+                choice_list.gui_element = gui_edit_element
+            self.set_gui_element_value(binding, gui_edit_element)
+
+        elif binding.kind == 'list_choice':
+            choice_list = binding.spec['object']
+            if isinstance(choice_list, ListViewChoice):
+                choice_list.instance = self.instance
+                choice_list.list_view_widget = gui_edit_element
+                choice_list.update_element()
+
+
+    def connect_signal(self, signal, slot):
+        signal.connect(slot)
+        self._connections.append((signal, slot))
+
+    def disconnect_signals(self):
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError) as e:
+                logging.debug(f'could not disconnect {slot}: {e}')
+        self._connections = []
+
+    def rebind(self, instance):
+        """
+        Rebinds the dialog to another instance: unhooks the observers of the old instance, resets values and
+        initial_values and refreshes the gui edit elements.
+
+        :param instance: the new instance
+        :return:
+        """
+        self.unbind_instance()
+        if self.instance is not None:
+            if hasattr(self.instance, 'selected'):
+                self.instance.selected = False
+            self.instance.info = None
+
+        self.instance = instance
+        if hasattr(self.instance, 'selected'):
+            self.instance.selected = True
+        self.instance.info = self
+
+        self.values = {}
+        for key in self.editable_attributes.keys():
+            self.values[key] = getattr(self.instance, key)
+        self.initial_values = copy(self.values)
+
+        self.dialog.accepted = False
+        self._edited_attr = None
+        for binding in self.binding_plan:
+            self.bind_gui_element(binding)
+        self.observe_instance()
+
+    def observe_instance(self):
+        """
+        Observes the attributes shown in the dialog. The subscription holds this info weakly and is cancelled when the
+        dialog is destroyed.
+        """
+        if self._subscription is not None:
+            self._subscription.cancel()
+        self._subscription = subscribe(self.instance,
+                                       self.update_gui_element,
+                                       attr_dependent=self.binding_plan.observed_keys,
+                                       owner=self.dialog)
+
+    def unbind_instance(self):
+        self.commit_scheduler.flush()
+        if self.refresh_coalescer is not None:
+            self.refresh_coalescer.discard()
+        if self._subscription is not None:
+            self._subscription.cancel()
+            self._subscription = None
+
+    def unbind_gui_elements(self):
+        """
+        Removes the references of the gui edit elements to the instance and its objects, so a pooled dialog does
+        not keep them alive.
+        """
+        for binding in self.binding_plan:
+            gui_edit_element = self.key_gui_lookup_dict.get(binding.key, None)
+            if gui_edit_element is None:
+                continue
+            if hasattr(gui_edit_element, 'instance'):
+                gui_edit_element.instance = None
+            if binding.kind == 'choice':
+                choice_list = binding.spec['choices']
+                if isinstance(choice_list, ChoiceList) and (choice_list.gui_element is gui_edit_element):
+                    choice_list.unbind()
+            elif binding.kind == 'object_multiple':
+                if binding.backend == 'model':
+                    gui_edit_element.model().set_objects(None)
+                else:
+                    update_object_list_widget(gui_edit_element, None)
+
+    def set_gui_element_value(self, binding, gui_edit_element):
+        """
+        Writes the current value of the instance attribute to the gui edit element.
+
+        :param binding: AttributeBinding
+        :param gui_edit_element: the gui edit element of the binding
+        :return:
+        """
+        cur_val = getattr(self.instance, binding.key)
+
+        if binding.kind in ['line_edit', 'label']:
+            text = str(cur_val) if cur_val is not None else ''
+            if gui_edit_element.text() != text:
+                blocked = gui_edit_element.blockSignals(True)
+                gui_edit_element.setText(text)
+                gui_edit_element.blockSignals(blocked)
+        elif binding.kind == 'text_edit':
+            text = str(cur_val) if cur_val is not None else ''
+            if gui_edit_element.toPlainText() != text:
+                blocked = gui_edit_element.blockSignals(True)
+                gui_edit_element.setText(text)
+                gui_edit_element.blockSignals(blocked)
+        elif binding.kind == 'radio_button':
+            checked = bool(cur_val) if cur_val is not None else False
+            if gui_edit_element.isChecked() != checked:
+                blocked = gui_edit_element.blockSignals(True)
+                gui_edit_element.setChecked(checked)
+                gui_edit_element.blockSignals(blocked)
+        elif binding.kind == 'object_single':
+            if cur_val is not None:
+                gui_edit_element.setText(str(resolve(cur_val)))
+            else:
+                gui_edit_element.setText(str(''))
+            gui_edit_element.instance = cur_val
+        elif binding.kind == 'choice':
+            if cur_val is not None:
+                choices = binding.spec['choices']
+                if isinstance(choices, ChoiceList):
+                    cur_index = choices.choice_index(cur_val)
+                else:
+                    cur_index = ValueIndex(list(choices.values())).index(cur_val)
+                if cur_index >= 0:
+                    gui_edit_element.blockSignals(True)
+                    gui_edit_element.setCurrentIndex(cur_index)
+                    gui_edit_element.blockSignals(False)
+        elif binding.kind == 'object_multiple':
+            if binding.backend == 'model':
+                gui_edit_element.model().set_objects(cur_val)
+            else:
+                update_object_list_widget(gui_edit_element, cur_val)
 
     def show_attribute_info(self, *args, **kwargs):
         gui_edit_element = self.dialog.sender()
@@ -981,6 +1619,32 @@ class InfoBaseClass(object):
     def update_instance(self, *args, **kwargs):
         gui_edit_element = self.dialog.sender()
         instance_attr = gui_edit_element.instance_attr
+        if instance_attr == self._echo_attr:
+            return
+
+        binding = self.binding_plan.by_key.get(instance_attr, None)
+        if binding is not None:
+            if binding.commit == 'debounce':
+                self.commit_scheduler.schedule(instance_attr, gui_edit_element, binding.debounce_ms)
+                return
+            elif binding.commit == 'finished':
+                self.commit_scheduler.schedule(instance_attr, gui_edit_element)
+                return
+
+        self.commit_gui_element(gui_edit_element)
+
+    def finish_editing(self, *args, **kwargs):
+        gui_edit_element = self.dialog.sender()
+        self.commit_scheduler.flush(gui_edit_element.instance_attr)
+
+    def commit_gui_element(self, gui_edit_element):
+        """
+        Parses the value of the gui edit element and writes it to the instance.
+
+        :param gui_edit_element: the gui edit element
+        :return:
+        """
+        instance_attr = gui_edit_element.instance_attr
 
         dict_entry = self.editable_attributes[instance_attr]
 
@@ -1027,64 +1691,62 @@ class InfoBaseClass(object):
             print(traceback.format_exc())
             print(sys.exc_info()[2])
 
-        if hasattr(gui_edit_element, 'instance'):
-            if not (getattr(gui_edit_element.instance, instance_attr) == new_value):
-                setattr(gui_edit_element.instance, instance_attr, new_value)
+        instance = getattr(gui_edit_element, 'instance', self.instance)
+        if instance is not self.instance:
+            self.write_instance_attr(instance, instance_attr, new_value)
         else:
             if edit_direct:
-                if not (getattr(self.instance, instance_attr) == new_value):
-                    setattr(self.instance, instance_attr, new_value)
+                self.write_instance_attr(self.instance, instance_attr, new_value)
 
             self.values[instance_attr] = new_value
 
-    def update_gui_element(self, *args, **kwargs):
-        key = kwargs.get('attribute', None)
-        gui_edit_element = self.key_gui_lookup_dict[key]
+    def write_instance_attr(self, instance, attr, value):
+        """
+        Writes a value edited in the gui to the instance. Notifications for attr which arrive while writing are not
+        written back to the gui edit element the value came from.
 
-        if isinstance(self.editable_attributes[key], dict):
-            attr_type = self.editable_attributes[key]['type']
-        else:
-            attr_type = self.editable_attributes[key]
+        :param instance: the edited instance
+        :param attr: the edited attribute
+        :param value: the new value
+        :return:
+        """
+        if getattr(instance, attr) == value:
+            return
 
-        if attr_type in [int, float, str, bool, 'text', 'static']:
+        if instance is not self.instance:
+            setattr(instance, attr, value)
+            return
 
-            if isinstance(gui_edit_element, QtWidgets.QLineEdit) or isinstance(gui_edit_element, QtWidgets.QTextEdit):
-                cur_val = getattr(self.instance, key)
-                if cur_val is not None:
-                    gui_edit_element.setText(str(cur_val))
-                else:
-                    gui_edit_element.setText('')
-            elif isinstance(gui_edit_element, QtWidgets.QRadioButton):
-                cur_val = getattr(self.instance, key)
-                if cur_val is not None:
-                    gui_edit_element.setChecked(cur_val)
-                else:
-                    gui_edit_element.setChecked(False)
-            elif isinstance(gui_edit_element, QtWidgets.QLabel):
-                cur_val = getattr(self.instance, key)
-                if cur_val is not None:
-                    gui_edit_element.setText(str(cur_val))
-                else:
-                    gui_edit_element.setText('')
+        self._echo_attr = attr
+        try:
+            setattr(instance, attr, value)
+        finally:
+            self._echo_attr = None
 
-        elif attr_type == 'object':
-            cur_val = getattr(self.instance, key)
-            if self.editable_attributes[key]['select']['type'] == 'single':
-                if cur_val is not None:
-                    gui_edit_element.setText(str(cur_val.name))
-                else:
-                    gui_edit_element.setText(str(''))
+        if not (getattr(instance, attr) == value):
+            # the instance changed the value while setting it (e.g. clamped it): show the stored value
+            self.refresh_gui_element(attr)
 
-            elif self.editable_attributes[key]['select']['type'] == 'multiple':
-                gui_edit_element.clear()
-                if cur_val is not None:
-                    for instance in cur_val:
-                        item = QListWidgetItem()
-                        item.setText(instance.name)
-                        item.instance = instance
-                        if hasattr(instance, 'ClassIcon'):
-                            item.setIcon(QIcon(instance.ClassIcon))
-                        gui_edit_element.addItem(item)
+    def update_gui_element(self, *args, **kwargs):
+        keys = kwargs.get('attributes', None)           # aggregated notification of a transaction
+        if keys is None:
+            keys = [kwargs.get('attribute', None)]
+
+        for key in keys:
+            if key == self._echo_attr:
+                # the value comes from the gui edit element of key
+                self.echo_suppressed += 1
+                continue
+            if self.refresh_coalescer is not None:
+                self.refresh_coalescer.mark_dirty(key)
+            else:
+                self.refresh_gui_element(key)
+
+    def refresh_gui_element(self, key):
+        binding = self.binding_plan.by_key.get(key, None)
+        if binding is None:
+            return
+        self.set_gui_element_value(binding, self.key_gui_lookup_dict[key])
 
     def object_label_clicked(self, *args, **kwargs):
         gui_element = self.dialog.sender()
@@ -1218,7 +1880,8 @@ class InfoBaseClass(object):
             # style_string = qdarkstyle.load_stylesheet_pyqt5()
             # style_string = style_string.replace('min-width: 80px;', 'min-width: 10px;')
             style_string = config.app.style
-        self.dialog.setStyleSheet(style_string)
+        if self.dialog.styleSheet() != style_string:
+            self.dialog.setStyleSheet(style_string)
 
     def show_edit_dialog(self):
 
@@ -1233,25 +1896,65 @@ class InfoBaseClass(object):
             self.selection_handler.set_selectable_classes([])
             self.selection_handler.max_num_selection = None
         print("X is clicked")
+        self.commit_scheduler.flush()
         if self.instance is not None:
             if hasattr(self.instance, 'selected'):
                 self.instance.selected = False
 
         if not self.keep_when_closed:
             self.instance.info = None
-            self.dialog.close()
+            if self.use_dialog_pool:
+                self.release_dialog()
+            else:
+                # the dialog is not deleted on close: stop observing the instance
+                self.unbind_instance()
+                self.unbind_gui_elements()
+                self.dialog.close()
         else:
             self.dialog.hide()
 
+    def release_dialog(self):
+        """
+        Unhooks the dialog from this info and the instance and returns it to the dialog pool.
+        """
+        self.unbind_instance()
+        self.unbind_gui_elements()
+        self.disconnect_signals()
+        self.commit_scheduler.unwatch_all()
+        if 'closeEvent' in self.dialog.__dict__:
+            # restore CustomDialog.closeEvent
+            del self.dialog.closeEvent
+        dialog_pool.release(self.dialog, self.ui_info, self.dialog_parent)
+
+    def changed_attributes(self):
+        """
+        Returns the keys of the attributes whose value differs from the initial value.
+        """
+        return [key for key in self.editable_attributes.keys()
+                if not values_equal(self.values[key], self.initial_values[key])]
+
     def accept_event(self):
-        for key, value in self.editable_attributes.items():
-            try:
-                setattr(self.instance, key, self.values[key])
-            except Exception as e:
-                logging.error(f'{self.instance.name}: Error setattr {key}: {e}')
-                print(e)
-                print(traceback.format_exc())
-                print(sys.exc_info()[2])
+        self.commit_scheduler.flush()
+
+        # attributes which were edited directly are already set
+        changed_keys = [key for key in self.changed_attributes()
+                        if not values_equal(getattr(self.instance, key), self.values[key])]
+        transaction = bool(changed_keys) and hasattr(self.instance, 'begin_transaction') and \
+            hasattr(self.instance, 'end_transaction')
+        if transaction:
+            self.instance.begin_transaction()
+        try:
+            for key in changed_keys:
+                try:
+                    setattr(self.instance, key, self.values[key])
+                except Exception as e:
+                    logging.error(f'{self.instance.name}: Error setattr {key}: {e}')
+                    print(e)
+                    print(traceback.format_exc())
+                    print(sys.exc_info()[2])
+        finally:
+            if transaction:
+                self.instance.end_transaction()
 
         self.dialog.accepted = True
         self.dialog.close()
@@ -1270,22 +1973,24 @@ class InfoBaseClass(object):
                 print(sys.exc_info()[2])
             self.instance = new_instance
 
+    @property
+    def waiting_dialog(self):
+        return self.dialog.spinner
+
+    def run_task(self, fcn, *args, **kwargs):
+        """
+        Runs fcn(*args, **kwargs) in the executor while the spinner of the dialog is shown.
+
+        :return: TaskHandle
+        """
+        return self.dialog.run_task(fcn, args, kwargs)
+
     def start_waiting_dialog(self):
         self.waiting_dialog.start()
 
     def stop_waiting_dialog(self):
         self.waiting_dialog.stop()
 
-    def __del__(self):
-        try:
-            self.instance.remove_observer(self.update_gui_element)
-        except Exception as e:
-            logging.error(f'{self.instance.name}: Error removing observer: {e}')
-            print(e)
-            print(traceback.format_exc())
-            print(sys.exc_info()[2])
-        print('all observers removed')
-
 
 class ObjectLabel(QtWidgets.QLabel):
     clicked = QtCore.pyqtSignal()
@@ -1323,6 +2028,12 @@ def handle_double_click(item):
             item.instance.double_clicked()
 
 
+def handle_index_double_click(index):
+    instance = index.model().instance_at(index.row())
+    if hasattr(instance, 'double_clicked'):
+        instance.double_clicked()
+
+
 def getChoice(items):
     items_text = []
     for item in items:
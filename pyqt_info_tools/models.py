@@ -0,0 +1,268 @@
+from PyQt5 import QtCore, QtGui
+
+import logging
+
+from .diff import keyed_diff, occurrence_keys
+from .names import resolve
+from . import icon_cache
+from .streaming import is_streaming_source, as_paged_source
+
+
+max_row_operations = 64             # more row changes are signalled as model reset
+
+
+class ValueIndex(object):
+    """
+    Reverse index value -> first row of values. Values are found by identity, then by hash; unhashable values are
+    found by a linear scan with ==.
+    """
+
+    def __init__(self, values):
+        self.values = values
+        self.by_id = {}
+        self.by_hash = {}
+        self.unhashable_rows = []
+        for row, value in enumerate(values):
+            self.by_id.setdefault(id(value), row)
+            try:
+                self.by_hash.setdefault(value, row)
+            except TypeError:
+                self.unhashable_rows.append(row)
+
+    def index(self, value):
+        """
+        Returns the first row of value or -1.
+        """
+        row = self.by_id.get(id(value), None)
+        if row is not None:
+            return row
+        try:
+            row = self.by_hash.get(value, None)
+        except TypeError:
+            # unhashable value
+            for row, other in enumerate(self.values):
+                if values_equal(value, other):
+                    return row
+            return -1
+        if row is not None:
+            return row
+        for row in self.unhashable_rows:
+            if values_equal(value, self.values[row]):
+                return row
+        return -1
+
+
+def values_equal(value, other):
+    if value is other:
+        return True
+    try:
+        return bool(value == other)
+    except Exception as e:
+        logging.debug(f'could not compare {value} and {other}: {e}')
+        return False
+
+
+class ObjectListModel(QtCore.QAbstractListModel):
+    """
+    List model over a sequence (or dict) of objects. Names and icons are computed in data(), so only rows which are
+    shown are evaluated; the objects are looked up by row with instance_at instead of being stored on items.
+
+    Streaming sources (iterators, paged callables, PagedSource) are loaded page by page: the first page is shown
+    immediately, the views request the next pages through canFetchMore / fetchMore when they are scrolled.
+    """
+
+    def __init__(self, objects=None, parent=None, page_size=None):
+        super(ObjectListModel, self).__init__(parent)
+        self._objects = []
+        self._names = None              # dict keys if the objects are given as dict
+        self._display_names = None      # names given to set_objects
+        self._keys = []
+        self._row_count = 0
+        self._value_index = None        # ValueIndex of the rows, built on demand
+        self._source = None             # PagedSource in streaming mode
+        self.page_size = page_size
+        self.set_objects(objects)
+
+    @property
+    def streaming(self):
+        return self._source is not None
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._row_count
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if (row < 0) or (row >= self._row_count):
+            return None
+        instance = self._objects[row]
+        if role == QtCore.Qt.DisplayRole:
+            if self._display_names is not None:
+                return str(self._display_names[row])
+            return resolve(instance, self._names[row] if self._names is not None else None)
+        elif role == QtCore.Qt.DecorationRole:
+            class_icon = getattr(instance, 'ClassIcon', None)
+            if class_icon is not None:
+                return icon_cache.icon(class_icon, callback=self.icon_ready)
+        return None
+
+    def icon_ready(self, class_icon, icon):
+        if self._row_count:
+            self.dataChanged.emit(self.index(0), self.index(self._row_count - 1), [QtCore.Qt.DecorationRole])
+
+    def instance_at(self, row):
+        """
+        Returns the object of row or None.
+        """
+        if (row < 0) or (row >= self._row_count):
+            return None
+        return self._objects[row]
+
+    @property
+    def value_index(self):
+        if self._value_index is None:
+            self._value_index = ValueIndex(self._objects[:self._row_count])
+        return self._value_index
+
+    def row_of(self, instance):
+        """
+        Returns the row of instance in the loaded rows or -1.
+        """
+        return self.value_index.index(instance)
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or (self._source is None):
+            return False
+        return (self._row_count < self._source.__len__()) or (not self._source.exhausted)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or (self._source is None):
+            return
+        self._source.ensure(self._row_count + self._source.page_size)
+        row_count = min(self._source.__len__(), self._row_count + self._source.page_size)
+        if row_count <= self._row_count:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._row_count, row_count - 1)
+        self._row_count = row_count
+        self._value_index = None
+        self.endInsertRows()
+
+    def set_objects(self, objects, names=None):
+        """
+        Sets the objects of the model. The rows are diffed by object identity: inserted, removed and moved objects
+        are signalled as row changes, so views keep the selection and scroll position of unchanged rows.
+
+        :param objects: sequence, dict or streaming source (iterator, paged callable, PagedSource) of the
+            objects
+        :param names: names shown for the objects; if None the names are taken from the objects
+        :return:
+        """
+        if is_streaming_source(objects):
+            self.set_source(objects)
+            return
+
+        display_names = list(names) if names is not None else None
+        self._value_index = None
+
+        if objects is None:
+            dict_keys, new_objects = None, []
+        elif isinstance(objects, dict):
+            dict_keys, new_objects = list(objects.keys()), list(objects.values())
+        else:
+            dict_keys, new_objects = None, list(objects)
+        if (display_names is not None) and (display_names.__len__() != new_objects.__len__()):
+            display_names = None
+        new_keys = occurrence_keys([id(instance) for instance in new_objects])
+
+        operations = None
+        if self._objects and (self._source is None):
+            operations = keyed_diff(self._keys, new_keys, max_operations=max_row_operations)
+        if operations is None:
+            # a reset is cheaper than signalling many single row changes
+            self.beginResetModel()
+            self._objects, self._names, self._keys = new_objects, dict_keys, new_keys
+            self._display_names = display_names
+            self._row_count = new_objects.__len__()
+            self._source = None
+            self.endResetModel()
+            return
+
+        current = self._objects
+        current_keys = self._keys
+        # the names are set with the new objects
+        self._names = None
+        self._display_names = None
+        for operation in operations:
+            if operation[0] == 'remove':
+                row = operation[1]
+                self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+                del current[row]
+                del current_keys[row]
+                self._row_count -= 1
+                self.endRemoveRows()
+            elif operation[0] == 'insert':
+                row = operation[1]
+                self.beginInsertRows(QtCore.QModelIndex(), row, row)
+                current.insert(row, new_objects[row])
+                current_keys.insert(row, new_keys[row])
+                self._row_count += 1
+                self.endInsertRows()
+            elif operation[0] == 'move':
+                from_row, row = operation[1:]
+                # Qt expects the destination in front of which the row is moved before the removal
+                self.beginMoveRows(QtCore.QModelIndex(), from_row, from_row, QtCore.QModelIndex(), row)
+                current.insert(row, current.pop(from_row))
+                current_keys.insert(row, current_keys.pop(from_row))
+                self.endMoveRows()
+
+        self._objects, self._names, self._keys = new_objects, dict_keys, new_keys
+        self._display_names = display_names
+        self._value_index = None
+        if new_objects:
+            # names of unchanged objects may have changed
+            self.dataChanged.emit(self.index(0), self.index(new_objects.__len__() - 1),
+                                  [QtCore.Qt.DisplayRole, QtCore.Qt.DecorationRole])
+
+    def set_source(self, source):
+        """
+        Shows the streaming source; the first page is loaded immediately.
+
+        :param source: iterator, paged callable or PagedSource
+        :return:
+        """
+        source = as_paged_source(source, self._source, page_size=self.page_size)
+        if source is self._source:
+            return
+        self.beginResetModel()
+        self._source = source
+        self._value_index = None
+        self._objects, self._names, self._keys = source.loaded, None, []
+        self._display_names = None
+        source.ensure(source.page_size)
+        self._row_count = min(source.__len__(), source.page_size)
+        self.endResetModel()
+
+
+class FetchingItemModel(QtGui.QStandardItemModel):
+    """
+    QStandardItemModel whose rows are appended on demand: the views call fetch_more_fcn when they are scrolled to
+    the end and can_fetch_more_fcn returns True.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(FetchingItemModel, self).__init__(*args, **kwargs)
+        self.can_fetch_more_fcn = None
+        self.fetch_more_fcn = None
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or (self.can_fetch_more_fcn is None):
+            return False
+        return self.can_fetch_more_fcn()
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or (self.fetch_more_fcn is None):
+            return
+        self.fetch_more_fcn()
@@ -0,0 +1,152 @@
+_resolvers = {}             # type -> resolver registered with register
+_strategies = {}            # type -> strategy chosen for the type
+
+stats = {'strategies': 0,   # strategies chosen (one per type)
+         'resolved': 0}     # names resolved
+
+
+def register(cls, resolver):
+    """
+    Registers the display name resolver of cls and its subclasses.
+
+    :param cls: type
+    :param resolver: function resolver(instance) which returns the display name of instance
+    :return:
+    """
+    _resolvers[cls] = resolver
+    _strategies.clear()
+
+
+def unregister(cls):
+    if _resolvers.pop(cls, None) is not None:
+        _strategies.clear()
+
+
+def _class_name(instance, key=None):
+    return getattr(instance, 'visible_class_name', instance.__name__)
+
+
+def _str_name(instance, key=None):
+    if key is not None:
+        return str(key)
+    return str(instance)
+
+
+def _name_attribute(instance, key=None):
+    try:
+        return instance.name
+    except AttributeError:
+        return _probe(instance, key)
+
+
+_missing = object()
+
+
+def _probe(instance, key=None):
+    name = getattr(instance, 'name', _missing)
+    if name is not _missing:
+        return name
+    if key is not None:
+        return str(key)
+    object_id = getattr(instance, 'id', _missing)
+    if object_id is not _missing:
+        return str(object_id)
+    return str(instance)
+
+
+def _registered(resolver):
+    def strategy(instance, key=None):
+        return resolver(instance)
+    return strategy
+
+
+def strategy_of(cls, instance=_missing):
+    """
+    Returns the name strategy strategy(instance, key=None) of instances of cls. The strategy is chosen once per type:
+
+        registered resolver of cls or of a base class
+        visible_class_name / __name__ for classes
+        .name if the class or the first instance has a name
+        str(key) / str(instance) for instances without attributes (str, int, ...)
+        otherwise the attributes name and id are looked up per instance
+
+    :param cls: type
+    :param instance: first instance of cls, used to choose the strategy
+    """
+    strategy = _strategies.get(cls, None)
+    if strategy is not None:
+        return strategy
+
+    for base in cls.__mro__:
+        if base in _resolvers:
+            strategy = _registered(_resolvers[base])
+            break
+    else:
+        if issubclass(cls, type):
+            strategy = _class_name
+        elif hasattr(cls, 'name') or ('name' in getattr(instance, '__dict__', ())):
+            strategy = _name_attribute
+        elif (not hasattr(cls, 'id')) and (getattr(cls, '__dictoffset__', 1) == 0) and \
+                (not hasattr(cls, '__getattr__')):
+            # the instances can not have a name
+            strategy = _str_name
+        else:
+            strategy = _probe
+
+    _strategies[cls] = strategy
+    stats['strategies'] += 1
+    return strategy
+
+
+def resolve(instance, key=None):
+    """
+    Returns the display name of instance.
+
+    :param instance: object or class
+    :param key: dict key of the instance; used if the instance has no name
+    :return: name
+    """
+    stats['resolved'] += 1
+    return strategy_of(type(instance), instance)(instance, key)
+
+
+def resolve_names(items, keys=None):
+    """
+    Returns the display names of items. The strategy is looked up once per type and not per item.
+
+    :param items: sequence, set or dict (the keys are used for instances without name)
+    :param keys: keys of the items, used for instances without name; default: the keys of the dict
+    :return: list of names
+    """
+    if isinstance(items, dict):
+        values = list(items.values())
+        if keys is None:
+            keys = list(items.keys())
+    else:
+        values = list(items)
+    if not values:
+        return []
+
+    types = set(map(type, values))
+    if types.__len__() == 1:
+        strategy = strategy_of(types.pop(), values[0])
+        if keys is None:
+            names = list(map(strategy, values))
+        else:
+            names = list(map(strategy, values, keys))
+    else:
+        strategies = {}
+        names = []
+        append = names.append
+        for row, value in enumerate(values):
+            strategy = strategies.get(type(value), None)
+            if strategy is None:
+                strategy = strategies[type(value)] = strategy_of(type(value), value)
+            append(strategy(value, keys[row] if keys is not None else None))
+    stats['resolved'] += names.__len__()
+    return names
+
+
+def reset_stats():
+    for key in stats.keys():
+        stats[key] = 0
@@ -0,0 +1,266 @@
+from contextlib import contextmanager
+import weakref
+import logging
+
+
+class ObserverTable(object):
+    """
+    Attribute indexed table of observers. Bound methods are referenced weakly and removed automatically when their
+    instance is garbage collected (bound methods of instances without weak reference support are referenced
+    strongly); a callable is registered only once per attribute.
+    """
+
+    __slots__ = ('by_attr', 'by_key', 'transaction_depth', 'transaction_changes', '__weakref__')
+
+    def __init__(self):
+        self.by_attr = {}           # attr (None: all attributes) -> {observer key: reference}
+        self.by_key = {}            # observer key -> set of attrs
+        self.transaction_depth = 0
+        self.transaction_changes = {}
+
+    def __len__(self):
+        return self.by_key.__len__()
+
+    def add(self, fcn, attr_dependent=None):
+        key = observer_key(fcn)
+        reference = None
+        if hasattr(fcn, '__self__') and hasattr(fcn, '__func__'):
+            table_ref = weakref.ref(self)
+
+            def remove_dead(_, key=key):
+                table = table_ref()
+                if table is not None:
+                    table.remove_key(key)
+
+            try:
+                reference = weakref.WeakMethod(fcn, remove_dead)
+            except TypeError:
+                # the instance does not support weak references (__slots__ without __weakref__)
+                pass
+        if reference is None:
+            reference = StrongReference(fcn)
+
+        if attr_dependent is None:
+            attr_dependent = [None]
+
+        attrs = self.by_key.setdefault(key, set())
+        for attr in attr_dependent:
+            # duplicate subscriptions of the same observer are ignored
+            self.by_attr.setdefault(attr, {}).setdefault(key, reference)
+            attrs.add(attr)
+
+    def remove(self, fcn, attr_dependent=None):
+        self.remove_key(observer_key(fcn), attr_dependent)
+
+    def remove_key(self, key, attr_dependent=None):
+        attrs = self.by_key.get(key, None)
+        if attrs is None:
+            return
+        if attr_dependent is None:
+            attr_dependent = list(attrs)
+        for attr in attr_dependent:
+            observers = self.by_attr.get(attr, None)
+            if observers is not None:
+                observers.pop(key, None)
+                if not observers:
+                    del self.by_attr[attr]
+            attrs.discard(attr)
+        if not attrs:
+            del self.by_key[key]
+
+    def observers(self, attr):
+        """
+        Returns the references of the observers of attr including the observers of all attributes.
+        """
+        observers = self.by_attr.get(attr, None)
+        all_observers = self.by_attr.get(None, None)
+        if observers is None:
+            if all_observers is None:
+                return []
+            return list(all_observers.values())
+        if all_observers is None:
+            return list(observers.values())
+        merged = dict(observers)
+        merged.update(all_observers)
+        return list(merged.values())
+
+    def count(self, attr=None):
+        if attr is None:
+            return self.by_key.__len__()
+        return self.by_attr.get(attr, {}).__len__()
+
+
+class StrongReference(object):
+
+    __slots__ = ('fcn',)
+
+    def __init__(self, fcn):
+        self.fcn = fcn
+
+    def __call__(self):
+        return self.fcn
+
+
+def observer_key(fcn):
+    if hasattr(fcn, '__self__') and hasattr(fcn, '__func__'):
+        return id(fcn.__self__), fcn.__func__
+    return id(fcn), fcn
+
+
+_cls_observer_tables = {}           # cls -> ObserverTable
+_mro_observer_tables = {}           # type -> class ObserverTables of the type and its bases
+
+
+def cls_observer_tables(cls):
+    tables = _mro_observer_tables.get(cls, None)
+    if tables is None:
+        tables = tuple(_cls_observer_tables[base] for base in cls.__mro__ if base in _cls_observer_tables)
+        _mro_observer_tables[cls] = tables
+    return tables
+
+
+class Observable(object):
+    """
+    Reference implementation of the observer protocol used by pyqt_info_tools:
+
+        instance.add_observer(fcn, attr_dependent=['attr'])
+        cls.add_cls_observer(fcn, attr_dependent=['attr'])
+        instance.remove_observer(fcn)
+
+    Setting an attribute calls the observers of this attribute with the keywords instance and attribute. Observers
+    added with attr_dependent=None are called for all attributes. Class observers are called when the attribute
+    changes on any instance of the class or when notify_cls_observers is called.
+
+    Between begin_transaction() and end_transaction() the notifications are collected and every observer is called
+    once with the keyword attributes (tuple of the changed attributes it observes).
+
+    The storage is declared in __slots__, so Observable can be used as base of classes with __slots__.
+    """
+
+    __slots__ = ('_observer_table',)
+
+    def __new__(cls, *args, **kwargs):
+        self = super(Observable, cls).__new__(cls)
+        object.__setattr__(self, '_observer_table', None)
+        return self
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == '_observer_table':
+            return
+        self.notify(name)
+
+    @property
+    def observer_table(self):
+        table = self._observer_table
+        if table is None:
+            table = ObserverTable()
+            object.__setattr__(self, '_observer_table', table)
+        return table
+
+    def add_observer(self, fcn, attr_dependent=None):
+        self.observer_table.add(fcn, attr_dependent)
+
+    def remove_observer(self, fcn, attr_dependent=None):
+        if self._observer_table is not None:
+            self._observer_table.remove(fcn, attr_dependent)
+
+    @classmethod
+    def add_cls_observer(cls, fcn, attr_dependent=None):
+        table = _cls_observer_tables.get(cls, None)
+        if table is None:
+            table = ObserverTable()
+            _cls_observer_tables[cls] = table
+            _mro_observer_tables.clear()
+        table.add(fcn, attr_dependent)
+
+    @classmethod
+    def remove_cls_observer(cls, fcn, attr_dependent=None):
+        table = _cls_observer_tables.get(cls, None)
+        if table is not None:
+            table.remove(fcn, attr_dependent)
+
+    @classmethod
+    def notify_cls_observers(cls, attr):
+        table = _cls_observer_tables.get(cls, None)
+        if table is None:
+            return
+        for reference in table.observers(attr):
+            call_observer(reference, instance=cls, attribute=attr)
+
+    def observer_count(self, attr=None):
+        if self._observer_table is None:
+            return 0
+        return self._observer_table.count(attr)
+
+    def notify(self, attr):
+        """
+        Calls the observers of attr. Inside a transaction the notification is deferred to end_transaction().
+
+        :param attr: the changed attribute
+        :return:
+        """
+        table = self._observer_table
+        if table is not None:
+            if table.transaction_depth:
+                table.transaction_changes[attr] = None
+                return
+            for reference in table.observers(attr):
+                call_observer(reference, instance=self, attribute=attr)
+
+        if _cls_observer_tables:
+            for cls_table in cls_observer_tables(type(self)):
+                for reference in cls_table.observers(attr):
+                    call_observer(reference, instance=self, attribute=attr)
+
+    def begin_transaction(self):
+        self.observer_table.transaction_depth += 1
+
+    def end_transaction(self):
+        table = self.observer_table
+        table.transaction_depth -= 1
+        if table.transaction_depth:
+            return
+        changed = list(table.transaction_changes.keys())
+        table.transaction_changes = {}
+        if not changed:
+            return
+
+        tables = [table]
+        if _cls_observer_tables:
+            tables.extend(cls_observer_tables(type(self)))
+
+        # collect the changed attributes per observer so every observer is called once
+        calls = {}
+        for table in tables:
+            for attr in changed:
+                for observers in (table.by_attr.get(attr, None), table.by_attr.get(None, None)):
+                    if observers is None:
+                        continue
+                    for key, reference in observers.items():
+                        entry = calls.get(key, None)
+                        if entry is None:
+                            entry = calls[key] = (reference, [])
+                        if attr not in entry[1]:
+                            entry[1].append(attr)
+
+        for reference, attrs in calls.values():
+            call_observer(reference, instance=self, attribute=attrs[0], attributes=tuple(attrs))
+
+    @contextmanager
+    def transaction(self):
+        self.begin_transaction()
+        try:
+            yield self
+        finally:
+            self.end_transaction()
+
+
+def call_observer(reference, **kwargs):
+    fcn = reference()
+    if fcn is None:
+        return
+    try:
+        fcn(**kwargs)
+    except Exception as e:
+        logging.error(f'Error calling observer {fcn}: {e}')
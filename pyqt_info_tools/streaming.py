@@ -0,0 +1,89 @@
+from collections.abc import Iterator
+from itertools import islice
+
+
+default_page_size = 200
+
+
+class PagedSource(object):
+    """
+    Source which is loaded page by page. Wraps an iterator (generator, DB cursor, ...) or a paged callable
+    fetch_fcn(offset, count) which returns the items [offset, offset + count); a page shorter than count ends the
+    source. Only pages which were requested are loaded and kept in loaded.
+    """
+
+    def __init__(self, source, page_size=None):
+        """
+
+        :param source: iterator or paged callable fetch_fcn(offset, count)
+        :param page_size: number of items loaded per page
+        """
+        self.source = source
+        self.page_size = page_size if page_size is not None else default_page_size
+        self.loaded = []
+        self.exhausted = False
+
+        if isinstance(source, Iterator):
+            self._iterator = source
+            self._fetch_fcn = None
+        elif callable(source):
+            self._iterator = None
+            self._fetch_fcn = source
+        else:
+            self._iterator = iter(source)
+            self._fetch_fcn = None
+
+    def __len__(self):
+        return self.loaded.__len__()
+
+    def __getitem__(self, row):
+        return self.loaded[row]
+
+    def __iter__(self):
+        return iter(self.loaded)
+
+    def fetch_page(self):
+        """
+        Loads the next page and returns its items.
+        """
+        if self.exhausted:
+            return []
+        if self._iterator is not None:
+            page = list(islice(self._iterator, self.page_size))
+        else:
+            page = list(self._fetch_fcn(self.loaded.__len__(), self.page_size))
+        if page.__len__() < self.page_size:
+            self.exhausted = True
+        self.loaded.extend(page)
+        return page
+
+    def ensure(self, count):
+        """
+        Loads pages until count items are loaded or the source is exhausted.
+        """
+        while (self.loaded.__len__() < count) and (not self.exhausted):
+            self.fetch_page()
+
+
+def is_paged_callable(value):
+    # classes are callable too, but they are not fetch functions
+    return callable(value) and (not isinstance(value, type))
+
+
+def is_streaming_source(value):
+    """
+    Returns True if value is loaded page by page: PagedSource, iterator or paged callable fetch_fcn(offset, count).
+    """
+    return isinstance(value, (PagedSource, Iterator)) or is_paged_callable(value)
+
+
+def as_paged_source(value, previous=None, page_size=None):
+    """
+    Returns value (iterator or paged callable) as PagedSource. An iterator can be consumed only once, so the
+    PagedSource previous is reused if it wraps value.
+    """
+    if isinstance(value, PagedSource):
+        return value
+    if (previous is not None) and (previous.source is value):
+        return previous
+    return PagedSource(value, page_size=page_size)
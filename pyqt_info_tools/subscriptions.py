@@ -0,0 +1,305 @@
+from PyQt5.QtCore import QObject, Qt, pyqtSlot
+from PyQt5 import sip
+
+import weakref
+import logging
+
+
+_live_subscriptions = weakref.WeakSet()
+_registry = {}          # id(subscriber) -> {(id(source), attr): Subscription}
+
+stats = {'redundant_subscriptions_avoided': 0,      # re-observations which did not add a subscription
+         'redundant_refreshes_avoided': 0}          # notifications the avoided subscriptions would have caused
+
+
+class Subscription(object):
+    """
+    Handle of an observer registration. The handle is registered at the source instead of the observer and holds the
+    observer weakly: it cancels itself when the observer is garbage collected or when the owner QObject is destroyed.
+    """
+
+    def __init__(self, source, fcn, attr_dependent=None, owner=None):
+        """
+
+        :param source: the observed instance or class
+        :param fcn: the observer
+        :param attr_dependent: the observed attributes
+        :param owner: QObject; the subscription is cancelled when the owner is destroyed
+        """
+        self.attr_dependent = attr_dependent
+        self.active = True
+        self.owner_id = id(owner) if owner is not None else None
+        self.owner_key = None           # address of the owner, see OwnerWatcher
+        self.registry_key = None        # (id(subscriber), (id(source), attr)) if registered by subscribe_once
+        self.duplicates = 0             # number of re-observations absorbed by this subscription
+
+        self_ref = weakref.ref(self)
+
+        def observer_collected(_):
+            subscription = self_ref()
+            if subscription is not None:
+                subscription.cancel()
+
+        try:
+            self._source_ref = weakref.ref(source, observer_collected)
+        except TypeError:
+            # source does not support weak references
+            self._source_ref = lambda: source
+
+        self._fcn_ref = None
+        if hasattr(fcn, '__self__') and hasattr(fcn, '__func__'):
+            try:
+                self._fcn_ref = weakref.WeakMethod(fcn, observer_collected)
+            except TypeError:
+                # the instance does not support weak references
+                pass
+        if self._fcn_ref is None:
+            self._fcn_ref = lambda: fcn
+
+        if owner is not None:
+            self.owner_key = owner_watcher().watch(owner, self)
+
+    @property
+    def source(self):
+        return self._source_ref()
+
+    @property
+    def fcn(self):
+        return self._fcn_ref()
+
+    def __call__(self, *args, **kwargs):
+        if not self.active:
+            return
+        fcn = self._fcn_ref()
+        if fcn is None:
+            self.cancel()
+            return
+        if self.duplicates:
+            stats['redundant_refreshes_avoided'] += self.duplicates
+        try:
+            return fcn(*args, **kwargs)
+        except RuntimeError as e:
+            if not is_deleted_error(e):
+                raise
+            # the gui element of the observer is already deleted
+            logging.warning(f'cancelled subscription of {fcn}: {e}')
+            self.cancel()
+
+    def cancel(self):
+        if not self.active:
+            return
+        self.active = False
+        _live_subscriptions.discard(self)
+
+        if self.registry_key is not None:
+            subscriber_id, key = self.registry_key
+            subscriptions = _registry.get(subscriber_id, {})
+            if subscriptions.get(key, None) is self:
+                del subscriptions[key]
+                if not subscriptions:
+                    del _registry[subscriber_id]
+
+        if self.owner_key is not None:
+            owner_watcher().unwatch(self.owner_key, self)
+            self.owner_key = None
+
+        source = self._source_ref()
+        if source is None:
+            return
+        try:
+            if isinstance(source, type) and hasattr(source, 'remove_cls_observer'):
+                source.remove_cls_observer(self)
+            else:
+                source.remove_observer(self)
+        except Exception as e:
+            logging.error(f'Error removing observer: {e}')
+
+
+
+class OwnerWatcher(QObject):
+    """
+    Cancels the subscriptions of an owner when the owner is destroyed. Each owner is connected once to a slot of this
+    QObject, so PyQt creates no slot proxy, and the connection is removed when the last subscription of the owner is
+    cancelled. Pooled dialogs which are bound again and again do not collect destroyed connections.
+    """
+
+    def __init__(self, parent=None):
+        super(OwnerWatcher, self).__init__(parent)
+        self._subscriptions = {}        # address of the owner -> set of Subscriptions
+
+    def watch(self, owner, subscription):
+        """
+        Cancels subscription when owner is destroyed.
+
+        :return: the key of owner, used by unwatch
+        """
+        key = sip.unwrapinstance(owner)
+        subscriptions = self._subscriptions.get(key, None)
+        if subscriptions is None:
+            subscriptions = self._subscriptions[key] = set()
+            owner.destroyed.connect(self.owner_destroyed, Qt.DirectConnection)
+        subscriptions.add(subscription)
+        return key
+
+    def unwatch(self, key, subscription):
+        subscriptions = self._subscriptions.get(key, None)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if subscriptions:
+            return
+        del self._subscriptions[key]
+        if sip.isdeleted(self):
+            # deleted on application shutdown, Qt removed the connections
+            return
+        # the owner is alive: its entry is removed when it is destroyed
+        owner = sip.wrapinstance(key, QObject)
+        try:
+            owner.destroyed.disconnect(self.owner_destroyed)
+        except (TypeError, RuntimeError):
+            pass
+
+    def watched_count(self):
+        return self._subscriptions.__len__()
+
+    @pyqtSlot(QObject)
+    def owner_destroyed(self, owner=None):
+        subscriptions = self._subscriptions.pop(sip.unwrapinstance(self.sender()), ())
+        for subscription in list(subscriptions):
+            subscription.owner_key = None
+            subscription.cancel()
+
+
+_owner_watcher = None
+
+
+def owner_watcher():
+    global _owner_watcher
+    if _owner_watcher is None:
+        _owner_watcher = OwnerWatcher()
+    return _owner_watcher
+
+
+def is_deleted_error(error):
+    """
+    Returns True if error is the RuntimeError PyQt raises when a deleted C++ object is accessed.
+    """
+    return 'has been deleted' in str(error)
+
+
+def subscribe(source, fcn, attr_dependent=None, owner=None):
+    """
+    Observes attr_dependent of source with fcn through a Subscription.
+
+    :param source: the observed instance or class (uses add_cls_observer)
+    :param fcn: the observer
+    :param attr_dependent: the observed attributes
+    :param owner: QObject; the subscription is cancelled when the owner is destroyed
+    :return: Subscription
+    """
+    subscription = Subscription(source, fcn, attr_dependent=attr_dependent, owner=owner)
+    if isinstance(source, type):
+        source.add_cls_observer(subscription, attr_dependent=attr_dependent)
+    else:
+        source.add_observer(subscription, attr_dependent=attr_dependent)
+    _live_subscriptions.add(subscription)
+    logging.debug(f'added observer {fcn} to {source}, attr_dependent={attr_dependent}')
+    return subscription
+
+
+def subscribe_once(subscriber, source, fcn, attr, owner=None):
+    """
+    Observes attr of source with fcn. The subscription is registered by (subscriber, source, attr): observing the
+    same (subscriber, source, attr) again keeps the existing subscription instead of adding another one.
+
+    :param subscriber: the object the subscription belongs to
+    :param source: the observed instance or class
+    :param fcn: the observer
+    :param attr: the observed attribute
+    :param owner: QObject; the subscription is cancelled when the owner is destroyed
+    :return: Subscription
+    """
+    key = (id(source), attr)
+    subscriptions = _registry.setdefault(id(subscriber), {})
+    subscription = subscriptions.get(key, None)
+    if subscription is not None:
+        if subscription.active and (subscription.source is source) and (subscription.fcn == fcn) and \
+                (subscription.owner_id == (id(owner) if owner is not None else None)):
+            subscription.duplicates += 1
+            stats['redundant_subscriptions_avoided'] += 1
+            return subscription
+        subscription.cancel()
+        subscriptions = _registry.setdefault(id(subscriber), {})
+
+    subscription = subscribe(source, fcn, attr_dependent=[attr], owner=owner)
+    subscription.registry_key = (id(subscriber), key)
+    subscriptions[key] = subscription
+    return subscription
+
+
+def set_subscriptions(subscriber, fcn, sources, owner=None):
+    """
+    Makes (source, attr) in sources the only subscriptions of subscriber: subscriptions which are not in sources are
+    cancelled, existing ones are kept, missing ones are added.
+
+    :param subscriber: the object the subscriptions belong to
+    :param fcn: the observer
+    :param sources: list of (source, attr)
+    :param owner: QObject; the subscriptions are cancelled when the owner is destroyed
+    :return:
+    """
+    wanted = {(id(source), attr) for source, attr in sources}
+    for key, subscription in list(_registry.get(id(subscriber), {}).items()):
+        if key not in wanted:
+            subscription.cancel()
+    for source, attr in sources:
+        subscribe_once(subscriber, source, fcn, attr, owner=owner)
+
+
+def unsubscribe(subscriber, source=None):
+    """
+    Cancels the subscriptions of subscriber to source (or all subscriptions of subscriber).
+    """
+    for subscription in list(_registry.get(id(subscriber), {}).values()):
+        if (source is None) or (subscription.source is source):
+            subscription.cancel()
+
+
+def subscriptions_of(subscriber):
+    return list(_registry.get(id(subscriber), {}).values())
+
+
+def reset_stats():
+    for key in stats.keys():
+        stats[key] = 0
+
+
+def live_subscriptions(source=None):
+    """
+    Returns the active subscriptions of source (or all active subscriptions).
+    """
+    if source is None:
+        return [subscription for subscription in _live_subscriptions if subscription.active]
+    return [subscription for subscription in _live_subscriptions
+            if subscription.active and (subscription.source is source)]
+
+
+def subscription_count(source):
+    """
+    Returns the number of live subscriptions of source.
+    """
+    return live_subscriptions(source).__len__()
+
+
+def subscription_counts():
+    """
+    Returns the number of live subscriptions per observed source as list of (source, count) tuples.
+    """
+    counts = {}
+    for subscription in live_subscriptions():
+        source = subscription.source
+        if source is None:
+            continue
+        entry = counts.setdefault(id(source), [source, 0])
+        entry[1] += 1
+    return [tuple(entry) for entry in counts.values()]
@@ -0,0 +1,161 @@
+from PyQt5.QtCore import QObject, QRunnable, Qt, pyqtSignal
+
+import threading
+import traceback
+import logging
+
+from . import executor
+
+
+_active = set()                 # started TaskHandles, kept alive until their result was delivered
+
+
+class TaskRunnable(QRunnable):
+
+    def __init__(self, handle):
+        super(TaskRunnable, self).__init__()
+        self.handle = handle
+
+    def run(self):
+        self.handle.run()
+
+    def on_cancelled(self):
+        # removed from the queue by the shutdown of the executor
+        self.handle.cancelled_by_executor()
+
+
+class TaskHandle(QObject):
+    """
+    Future-like handle of a function running in the executor. result() and exception() can be called from any
+    thread; the done callbacks are called on the GUI thread after the function finished or was cancelled. They are
+    always delivered through the queued _finished signal, so they never run inside run_task or cancel.
+    """
+
+    _finished = pyqtSignal()
+
+    def __init__(self, fcn, args=(), kwargs=None, parent=None, priority=executor.bulk_priority):
+        super(TaskHandle, self).__init__(parent)
+        self.fcn = fcn
+        self.args = args
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.priority = priority
+        self._result = None
+        self._error = None
+        self._traceback = None
+        self._state = 'pending'             # pending, running, finished, cancelled
+        self._done = threading.Event()      # set in the worker when the result is available
+        self._delivered = False             # True after the done callbacks were called
+        self._callbacks = []
+        self._runnable = None
+        self._finished.connect(self._deliver, Qt.QueuedConnection)
+
+    def start(self):
+        _active.add(self)
+        self._runnable = TaskRunnable(self)
+        self._runnable.setAutoDelete(False)
+        if not executor.submit(self._runnable, self.priority):
+            # the executor was shut down
+            self._state = 'cancelled'
+            self._done.set()
+            self._finished.emit()
+        return self
+
+    def run(self):
+        if self._state != 'pending':
+            return
+        self._state = 'running'
+        try:
+            self._result = self.fcn(*self.args, **self.kwargs)
+        except Exception as e:
+            self._error = e
+            self._traceback = traceback.format_exc()
+        self._state = 'finished'
+        self._done.set()
+        try:
+            self._finished.emit()
+        except RuntimeError:
+            # the handle was deleted
+            pass
+
+    def cancel(self):
+        """
+        Cancels the task if it did not start yet.
+
+        :return: True if the task was cancelled
+        """
+        if self._state != 'pending':
+            return self._state == 'cancelled'
+        if (self._runnable is not None) and (not executor.try_take(self._runnable)):
+            return False
+        self._state = 'cancelled'
+        self._done.set()
+        self._finished.emit()
+        return True
+
+    def cancelled_by_executor(self):
+        """
+        Marks the task cancelled after the executor removed it from its queue.
+        """
+        if self._state != 'pending':
+            return
+        self._state = 'cancelled'
+        self._done.set()
+        self._deliver()
+
+    def cancelled(self):
+        return self._state == 'cancelled'
+
+    def running(self):
+        return self._state == 'running'
+
+    def done(self):
+        return self._state in ('finished', 'cancelled')
+
+    def result(self, timeout=None):
+        """
+        Returns the result of the function; raises its exception. Waits until the function finished.
+
+        :param timeout: maximum time in s to wait; a TimeoutError is raised if the function did not finish
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError(f'{self.fcn} did not finish within {timeout} s')
+        if self._state == 'cancelled':
+            raise RuntimeError(f'{self.fcn} was cancelled')
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def exception(self, timeout=None):
+        if not self._done.wait(timeout):
+            raise TimeoutError(f'{self.fcn} did not finish within {timeout} s')
+        return self._error
+
+    def add_done_callback(self, fcn):
+        """
+        Calls fcn(handle) on the GUI thread when the task is done; immediately if it is already done.
+        """
+        if self._delivered:
+            fcn(self)
+        else:
+            self._callbacks.append(fcn)
+
+    def _deliver(self):
+        if self._delivered:
+            return
+        self._delivered = True
+        _active.discard(self)
+        if self._error is not None:
+            logging.error(f'Error in background task {self.fcn}: {self._error}\n{self._traceback}')
+        callbacks, self._callbacks = self._callbacks, []
+        for fcn in callbacks:
+            try:
+                fcn(self)
+            except Exception as e:
+                logging.error(f'Error in done callback of {self.fcn}: {e}\n{traceback.format_exc()}')
+
+
+def run_task(fcn, *args, **kwargs):
+    """
+    Runs fcn(*args, **kwargs) in the executor with bulk priority and returns its TaskHandle.
+    """
+    return TaskHandle(fcn, args, kwargs).start()
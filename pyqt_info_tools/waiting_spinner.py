@@ -1,9 +1,11 @@
 from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel
 from PyQt5.QtGui import QColor, QFont, QPainter, QBrush
-from PyQt5.QtCore import QMetaObject, Qt, QRunnable, QTimer, QRect, QPoint
+from PyQt5.QtCore import Qt, QRect, QPoint
 from functools import wraps
 import math
 
+from .animation_clock import AnimationClock
+
 
 class QtWaitingSpinner(QWidget):
 
@@ -29,8 +31,15 @@ class QtWaitingSpinner(QWidget):
         self.i = 0
         self.n = 10
 
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self.rotate)
+        # brushes and geometry are created once and not per frame
+        self._backdropBrush = QBrush(QColor(50, 50, 50, 200))
+        self._dotBrush = QBrush(QColor(230, 230, 230))
+        self._activeDotBrush = QBrush(QColor(100, 100, 255))
+        self._backdropRect = QRect()
+        self._dotRects = []
+        self._parentPosition = None
+
+        self._interval = 0
         self.updateSize()
         self.updateTimer()
         self.hide()
@@ -65,28 +74,40 @@ class QtWaitingSpinner(QWidget):
         self._text = value
         self.label.setText(self._text)
 
-    def paintEvent(self, QPaintEvent):
-        self.updatePosition()
+    def paintEvent(self, event):
+        # only the dirty region is painted: rotate invalidates the two dots which change
+        region = event.region()
         painter = QPainter(self)
-        rect = QRect(0, 0, self.parent().width(), self.parent().height())
-        painter.fillRect(rect, QBrush(QColor(50, 50, 50, 200)))
+        for rect in region.rects():
+            painter.fillRect(rect & self._backdropRect, self._backdropBrush)
         painter.setRenderHint(QPainter.Antialiasing, True)
-
         painter.setPen(Qt.NoPen)
 
-        for i in range(self.n):
-            if self.i == i:
-                painter.setBrush(QBrush(QColor(100, 100, 255)))
-            else:
-                painter.setBrush(QBrush(QColor(230, 230, 230)))
-            painter.drawEllipse(
-                int(self.parent().width() / 2 + 30 * math.cos(2 * math.pi * i / self.n)) - 8,
-                int(self.parent().height() / 2 + 30 * math.sin(2 * math.pi * i / self.n)) - 8,
-                10, 10)
+        for i, rect in enumerate(self._dotRects):
+            if region.intersects(rect):
+                painter.setBrush(self._activeDotBrush if self.i == i else self._dotBrush)
+                painter.drawEllipse(rect)
 
         painter.end()
 
+    def resizeEvent(self, event):
+        self.updateGeometryCache()
+        super().resizeEvent(event)
+
+    def updateGeometryCache(self):
+        """
+        Computes the backdrop and the dot rectangles for the size of the parent.
+        """
+        width, height = self.parentWidget().width(), self.parentWidget().height()
+        self._backdropRect = QRect(0, 0, width, height)
+        self._dotRects = [QRect(int(width / 2 + 30 * math.cos(2 * math.pi * i / self.n)) - 8,
+                                int(height / 2 + 30 * math.sin(2 * math.pi * i / self.n)) - 8,
+                                10, 10)
+                          for i in range(self.n)]
+
     def start(self):
+        # the size is updated on start, resizes of the parent are ignored while the spinner is hidden
+        self.updateSize()
         self.updatePosition()
         self._isSpinning = True
         self.show()
@@ -94,9 +115,9 @@ class QtWaitingSpinner(QWidget):
         if self.parentWidget and self._disableParentWhenSpinning:
             self.parentWidget().setEnabled(False)
 
-        if not self._timer.isActive():
-            self._timer.start()
-            self._currentCounter = 0
+        # all spinners are animated by the application wide AnimationClock
+        AnimationClock.instance().register(self, self.rotate, self._interval)
+        self._currentCounter = 0
 
     def stop(self):
         self._isSpinning = False
@@ -105,9 +126,8 @@ class QtWaitingSpinner(QWidget):
         if self.parentWidget() and self._disableParentWhenSpinning:
             self.parentWidget().setEnabled(True)
 
-        if self._timer.isActive():
-            self._timer.stop()
-            self._currentCounter = 0
+        AnimationClock.instance().unregister(self)
+        self._currentCounter = 0
 
     def color(self):
         return self._color
@@ -123,76 +143,46 @@ class QtWaitingSpinner(QWidget):
         self.updateTimer()
 
     def rotate(self):
+        previous = self.i
         self.i += 1
         if self.i > (self.n - 1):
             self.i = 0
-        self.update()
+        if self.parentWidget() and (self.parentWidget().mapToGlobal(QPoint(0, 0)) != self._parentPosition):
+            self.updatePosition()
+        if self._dotRects.__len__() != self.n:
+            self.updateGeometryCache()
+        if self._dotRects:
+            # the antialiased edges may exceed the rectangles by a pixel
+            self.update(self._dotRects[previous].adjusted(-1, -1, 1, 1))
+            self.update(self._dotRects[self.i].adjusted(-1, -1, 1, 1))
+        else:
+            self.update()
 
     def updateSize(self):
         # size = (self._innerRadius + self._lineLength) * 2
         # self.setFixedSize(size, size)
         self.setFixedSize(self.parentWidget().size())
+        self.updateGeometryCache()
 
     def updateTimer(self):
-        self._timer.setInterval(int(1000 / (self.n * self._revolutionsPerSecond)))
+        self._interval = int(1000 / (self.n * self._revolutionsPerSecond))
+        if self._isSpinning:
+            AnimationClock.instance().register(self, self.rotate, self._interval)
 
     def updatePosition(self):
         if self.parentWidget() and self._centerOnParent:
             parentRect = QRect(self.parentWidget().mapToGlobal(QPoint(0, 0)), self.parentWidget().size())
+            self._parentPosition = parentRect.topLeft()
             # self.move(QtWidgets.QStyle.alignedRect(QtCore.Qt.LeftToRight, QtCore.Qt.AlignCenter, self.size(), parentRect).topLeft())
             self.move(parentRect.x(), parentRect.y())
 
 
-class RequestRunnable(QRunnable):
-
-    def __init__(self, fcn, dialog, *args, **kwargs):
-        super(RequestRunnable, self).__init__()
-        self.args = args
-        self.kwargs = kwargs
-        self.dialog = dialog
-        self.fcn = fcn
-
-    def run(self):
-        QMetaObject.invokeMethod(self.dialog, "start_process", Qt.QueuedConnection)
-        self.fcn(*self.args, **self.kwargs)
-        QMetaObject.invokeMethod(self.dialog, "finished_process", Qt.QueuedConnection)
-
-
-class StartRunnable(QRunnable):
-
-    def __init__(self, dialog, fcn=None, args=(), kwargs={}):
-        super(StartRunnable, self).__init__()
-        self.w = dialog
-        self.fcn = fcn
-        self.args = args
-        self.kwargs = kwargs
-
-    def run(self):
-        print('running start_process')
-        QMetaObject.invokeMethod(self.w, "start_process", Qt.QueuedConnection)
-
-        if self.fcn is not None:
-            self.fcn(*self.args, **self.kwargs)
-            QMetaObject.invokeMethod(self.w, "finished_process", Qt.QueuedConnection)
-
-
-class StopRunnable(QRunnable):
-
-    def __init__(self, dialog):
-        super(StopRunnable, self).__init__()
-        self.w = dialog
-
-    def run(self):
-        print('running finished_process')
-        QMetaObject.invokeMethod(self.w, "finished_process", Qt.QueuedConnection)
-
-
 def show_waiting(method):
+    """
+    Runs the decorated method in the executor (see CustomDialog.run_task) while the spinner of self.dialog is shown.
+    The decorated method returns a TaskHandle; results, exceptions and done callbacks are delivered on the GUI thread.
+    """
     @wraps(method)
     def _impl(self, *args, **kwargs):
-        # QMetaObject.invokeMethod(self.dialog, "start_process", Qt.QueuedConnection)
-        self.dialog.start_waiting(fcn=method, args=(self, *args), kwargs=kwargs)
-        # method_output = method(self, *args, **kwargs)
-        QMetaObject.invokeMethod(self.dialog, "finished_process", Qt.QueuedConnection)
-        # return method_output
+        return self.dialog.run_task(method, args=(self, *args), kwargs=kwargs)
     return _impl
@@ -0,0 +1,74 @@
+"""
+conftest.py
+~~~~~~~~~~~
+
+Runs the tests against an offscreen QApplication with the app attributes pyqt_info_tools expects (style,
+selection_handler, MainWindow). Tests marked benchmark assert on timings and run only with --benchmark.
+"""
+
+import os
+import types
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import pytest
+from PyQt5 import QtWidgets
+
+import pyqt_info_tools.info_base_class as info_base_class
+from pyqt_info_tools import executor
+
+
+def pytest_addoption(parser):
+    parser.addoption('--benchmark', action='store_true', default=False,
+                     help='run the tests marked benchmark, which assert on wall-clock or CPU time')
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'benchmark: asserts on wall-clock or CPU time, skipped without --benchmark')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--benchmark'):
+        return
+    skip = pytest.mark.skip(reason='timing benchmark, run with --benchmark')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
+
+
+class SelectionHandler(object):
+
+    max_num_selection = None
+
+    def set_selectable_classes(self, classes):
+        pass
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    app.style = ''
+    app.selection_handler = SelectionHandler()
+    return app
+
+
+@pytest.fixture
+def app(qapp, monkeypatch):
+    monkeypatch.setattr(info_base_class, 'config', types.SimpleNamespace(app=qapp))
+    yield qapp
+    info_base_class.dialog_pool.clear()
+
+
+@pytest.fixture
+def main_window(app):
+    app.MainWindow = QtWidgets.QMainWindow()
+    yield app.MainWindow
+    del app.MainWindow
+
+
+@pytest.fixture
+def single_thread_executor(app, monkeypatch):
+    pool_executor = executor.Executor(max_thread_count=1)
+    monkeypatch.setattr(executor, '_executor', pool_executor)
+    yield pool_executor
+    pool_executor.shutdown()
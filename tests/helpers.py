@@ -0,0 +1,169 @@
+"""
+helpers.py
+~~~~~~~~~~
+
+Models and ui classes shared by the tests.
+"""
+
+import time
+
+from PyQt5 import QtWidgets
+
+from pyqt_info_tools.info_base_class import InfoBaseClass, ChoiceList
+from pyqt_info_tools.observable import Observable
+from pyqt_info_tools.promoted_widgets import ObjectLabel
+
+
+class CountingModel(Observable):
+    """
+    Observable which counts the setattr calls and the observer calls.
+    """
+
+    def __init__(self, **kwargs):
+        object.__setattr__(self, 'setattr_count', 0)
+        object.__setattr__(self, 'notify_count', 0)
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self.info = None
+        self.selected = False
+        self.reset_counts()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, 'setattr_count', self.setattr_count + 1)
+        super(CountingModel, self).__setattr__(name, value)
+
+    def notify(self, attr):
+        table = self._observer_table
+        if (table is not None) and (not table.transaction_depth):
+            object.__setattr__(self, 'notify_count', self.notify_count + table.observers(attr).__len__())
+        super(CountingModel, self).notify(attr)
+
+    def reset_counts(self):
+        object.__setattr__(self, 'setattr_count', 0)
+        object.__setattr__(self, 'notify_count', 0)
+
+
+class PlainModel(object):
+    """
+    Model with the usual hand written observer list: an observer is called if the attribute is in its attr_dependent.
+    """
+
+    def __init__(self, **kwargs):
+        object.__setattr__(self, 'observers', [])
+        for key, value in kwargs.items():
+            object.__setattr__(self, key, value)
+        self.info = None
+        self.selected = False
+
+    def add_observer(self, fcn, attr_dependent=None):
+        self.observers.append((fcn, attr_dependent))
+
+    def remove_observer(self, fcn):
+        self.observers[:] = [observer for observer in self.observers if observer[0] != fcn]
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        for fcn, attr_dependent in list(self.observers):
+            if name in attr_dependent:
+                fcn(instance=self, attribute=name)
+
+
+class Child(object):
+
+    def __init__(self, name):
+        self.name = name
+
+
+class FieldsUi(object):
+    """
+    Ui with one gui edit element per supported attribute type.
+    """
+
+    def setupUi(self, dialog):
+        layout = QtWidgets.QVBoxLayout(dialog)
+        self.name_lineEdit = QtWidgets.QLineEdit(dialog)
+        self.value_lineEdit = QtWidgets.QLineEdit(dialog)
+        self.count_lineEdit = QtWidgets.QLineEdit(dialog)
+        self.flag_radioButton = QtWidgets.QRadioButton(dialog)
+        self.notes_textEdit = QtWidgets.QTextEdit(dialog)
+        self.id_label = QtWidgets.QLabel(dialog)
+        self.parent_label = ObjectLabel(dialog)
+        self.children_listWidget = QtWidgets.QListWidget(dialog)
+        self.children_edit_pushButton = QtWidgets.QPushButton(dialog)
+        self.mode_comboBox = QtWidgets.QComboBox(dialog)
+        self.buttonBox = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok |
+                                                    QtWidgets.QDialogButtonBox.Cancel, parent=dialog)
+        for widget in [self.name_lineEdit, self.value_lineEdit, self.count_lineEdit, self.flag_radioButton,
+                       self.notes_textEdit, self.id_label, self.parent_label, self.children_listWidget,
+                       self.children_edit_pushButton, self.mode_comboBox, self.buttonBox]:
+            layout.addWidget(widget)
+
+
+def make_fields_info_cls(modes):
+    """
+    Returns an InfoBaseClass subclass for FieldsUi; the choices of mode are modes.modes.
+    """
+
+    class FieldsInfo(InfoBaseClass):
+        editable_attributes = {'name': InfoBaseClass.str_type,
+                               'value': {'type': float, 'bottom': 0.0, 'top': 10.0, 'direct_edit': True},
+                               'count': int,
+                               'flag': InfoBaseClass.bool_type,
+                               'notes': InfoBaseClass.text_type,
+                               'id': InfoBaseClass.static_str,
+                               'parent': {'type': 'object', 'select': {'type': 'single',
+                                                                       'selectable_objects': None}},
+                               'children': {'type': 'object', 'select': {'type': 'multiple',
+                                                                         'selectable_objects': None}},
+                               'mode': {'type': 'choice',
+                                        'choices': ChoiceList(source_instance=modes, source_attr='modes')}}
+
+    return FieldsInfo
+
+
+def make_fields_model(model_cls=CountingModel, children=5):
+    return model_cls(name='m', value=1.5, count=3, flag=True, notes='hello', id='x1', parent=Child('p'),
+                     children=[Child(f'c{i}') for i in range(children)], mode='b')
+
+
+def line_edit_ui_cls(keys):
+    """
+    Returns a ui class with one line edit {key}_lineEdit per key.
+    """
+
+    class LineEditUi(object):
+
+        def setupUi(self, dialog):
+            layout = QtWidgets.QVBoxLayout(dialog)
+            for key in keys:
+                line_edit = QtWidgets.QLineEdit(dialog)
+                setattr(self, f'{key}_lineEdit', line_edit)
+                layout.addWidget(line_edit)
+            self.buttonBox = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok |
+                                                        QtWidgets.QDialogButtonBox.Cancel, parent=dialog)
+            layout.addWidget(self.buttonBox)
+
+    return LineEditUi
+
+
+def best_time(fcn, repeat=5, number=1):
+    """
+    Returns the best time in s of repeat runs of number calls of fcn.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fcn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def process_events_until(app, condition, timeout=5):
+    """
+    Processes events until condition() is True or timeout s passed; returns condition().
+    """
+    end = time.perf_counter() + timeout
+    while (not condition()) and (time.perf_counter() < end):
+        app.processEvents()
+    return condition()
@@ -0,0 +1,41 @@
+from PyQt5.QtTest import QTest
+
+from pyqt_info_tools.info_base_class import InfoBaseClass
+
+from .helpers import CountingModel, PlainModel, line_edit_ui_cls
+
+
+keys = ['a', 'b', 'c', 'd']
+LineEditUi = line_edit_ui_cls(keys)
+
+
+class DeferredInfo(InfoBaseClass):
+    editable_attributes = {key: {'type': str, 'direct_edit': False} for key in keys}
+
+
+def edit_and_accept(instance):
+    info = DeferredInfo(instance=instance, ui_info=LineEditUi)
+    QTest.keyClicks(info.dialog.ui.a_lineEdit, '1')
+    QTest.keyClicks(info.dialog.ui.c_lineEdit, '3')
+    assert (instance.a, instance.c) == ('a', 'c')
+    info.accept_event()
+
+
+def test_accept_writes_changed_attributes_in_one_transaction(app):
+    instance = CountingModel(**{key: key for key in keys})
+    calls = []
+    instance.add_observer(lambda **kwargs: calls.append(kwargs.get('attributes', (kwargs['attribute'],))))
+
+    edit_and_accept(instance)
+    assert [getattr(instance, key) for key in keys] == ['a1', 'b', 'c3', 'd']
+    assert [attributes for attributes in calls if set(attributes) & set(keys)] == [('a', 'c')]
+
+
+def test_accept_without_transaction_protocol(app):
+    instance = PlainModel(**{key: key for key in keys})
+    calls = []
+    instance.add_observer(lambda **kwargs: calls.append(kwargs['attribute']), attr_dependent=keys)
+
+    edit_and_accept(instance)
+    assert [getattr(instance, key) for key in keys] == ['a1', 'b', 'c3', 'd']
+    assert calls == ['a', 'c']
@@ -0,0 +1,51 @@
+import threading
+
+from PyQt5 import QtWidgets
+
+from pyqt_info_tools import async_sources, tasks
+from pyqt_info_tools.async_sources import AsyncSource, placeholder_text
+from pyqt_info_tools.info_base_class import ChoiceList
+
+from .helpers import PlainModel, process_events_until
+
+
+def test_only_the_latest_result_is_applied(single_thread_executor, app):
+    async_sources.reset_stats()
+    results = []
+    source = AsyncSource(lambda result, error: results.append(result))
+    started, release = threading.Event(), threading.Event()
+
+    def slow(value):
+        started.set()
+        release.wait(5)
+        return value
+
+    source.request(slow, 'running')
+    assert started.wait(5)
+    # queued requests are taken back from the executor when they are superseded
+    for value in ('queued 1', 'queued 2', 'latest'):
+        source.request(lambda value=value: value)
+    assert source.pending
+    release.set()
+
+    assert process_events_until(app, lambda: not source.pending)
+    assert process_events_until(app, lambda: async_sources.stats['dropped'] == 3)
+    assert results == ['latest']
+    assert async_sources.stats['applied'] == 1
+
+
+def test_async_choices_show_a_placeholder(single_thread_executor, app):
+    release = threading.Event()
+    blocker = tasks.run_task(release.wait, 5)
+    source = PlainModel(modes=['a', 'b'])
+    combobox = QtWidgets.QComboBox()
+    choice_list = ChoiceList(instance=PlainModel(mode='b'), attr='mode', gui_element=combobox,
+                             source_instance=source, source_attr='modes', async_source=True)
+    assert choice_list.choice_model.loading
+    assert (combobox.count(), combobox.placeholderText()) == (0, placeholder_text)
+
+    release.set()
+    assert blocker.result(timeout=5)
+    assert process_events_until(app, lambda: not choice_list.choice_model.loading)
+    assert [combobox.itemText(row) for row in range(combobox.count())] == ['a', 'b']
+    assert (combobox.currentText(), combobox.placeholderText()) == ('b', '')
@@ -0,0 +1,71 @@
+from pyqt_info_tools import binding_plan
+from pyqt_info_tools.binding_plan import get_binding_plan, compile_binding_plan, clear_binding_plans
+from pyqt_info_tools.info_base_class import InfoBaseClass, create_dialog
+
+from .helpers import CountingModel, line_edit_ui_cls, best_time
+
+
+keys = [f'field{i}' for i in range(60)]
+LineEditUi = line_edit_ui_cls(keys)
+
+
+class WideInfo(InfoBaseClass):
+    editable_attributes = {key: InfoBaseClass.str_type for key in keys}
+
+
+def make_model():
+    return CountingModel(**{key: f'value {i}' for i, key in enumerate(keys)})
+
+
+def test_plan_is_compiled_once_per_class(app):
+    clear_binding_plans()
+    first = WideInfo(instance=make_model(), ui_info=LineEditUi)
+    second = WideInfo(instance=make_model(), ui_info=LineEditUi)
+    assert first.binding_plan is second.binding_plan
+    assert first.binding_plan.__len__() == keys.__len__()
+    assert second.dialog.ui.field59_lineEdit.text() == 'value 59'
+
+
+def test_instance_editable_attributes_get_their_own_plan(app):
+
+    class NarrowInfo(WideInfo):
+
+        def __init__(self, *args, **kwargs):
+            self.editable_attributes = {key: InfoBaseClass.str_type for key in keys[:3]}
+            super(NarrowInfo, self).__init__(*args, **kwargs)
+
+    clear_binding_plans()
+    wide = WideInfo(instance=make_model(), ui_info=LineEditUi)
+    narrow = NarrowInfo(instance=make_model(), ui_info=LineEditUi)
+    assert wide.binding_plan.__len__() == 60
+    assert [binding.key for binding in narrow.binding_plan] == keys[:3]
+    assert narrow.binding_plan.observed_keys == keys[:3]
+
+
+def test_cache_is_bounded(app, monkeypatch):
+    monkeypatch.setattr(binding_plan, 'max_binding_plans', 2)
+    clear_binding_plans()
+    ui = create_dialog(LineEditUi).ui
+    for _ in range(5):
+        get_binding_plan(WideInfo, LineEditUi, ui, {keys[0]: InfoBaseClass.str_type})
+    assert binding_plan._binding_plans.__len__() == 2
+
+
+def test_benchmark_binding_plan(app):
+    # before: every dialog compiled the bindings of its 60 fields; after: the cached plan is replayed
+    ui = create_dialog(LineEditUi).ui
+    clear_binding_plans()
+    compile_time = best_time(lambda: compile_binding_plan(WideInfo.editable_attributes, ui), number=20) / 20
+    get_binding_plan(WideInfo, LineEditUi, ui)
+    cached_time = best_time(lambda: get_binding_plan(WideInfo, LineEditUi, ui), number=20) / 20
+
+    def open_dialog(compile_plan):
+        if compile_plan:
+            clear_binding_plans()
+        WideInfo(instance=make_model(), ui_info=LineEditUi).dialog.deleteLater()
+
+    uncached_dialog_time = best_time(lambda: open_dialog(True))
+    cached_dialog_time = best_time(lambda: open_dialog(False))
+    print(f'\n60 fields: compile {compile_time * 1e3:.3f} ms, cached plan {cached_time * 1e3:.4f} ms; '
+          f'dialog {uncached_dialog_time * 1e3:.2f} ms -> {cached_dialog_time * 1e3:.2f} ms')
+    assert cached_time < compile_time
@@ -0,0 +1,215 @@
+import time
+
+import pytest
+from PyQt5 import QtCore, QtWidgets
+
+from pyqt_info_tools.choice_models import choice_model_counts
+from pyqt_info_tools.info_base_class import ChoiceList
+
+from .helpers import Child, PlainModel
+
+
+def make_choice_list(instance, **kwargs):
+    combobox = QtWidgets.QComboBox()
+    choice_list = ChoiceList(**kwargs)
+    choice_list.instance = instance
+    choice_list.attr = 'mode'
+    choice_list.gui_element = combobox
+    return choice_list, combobox
+
+
+def items(combobox):
+    return [combobox.itemText(row) for row in range(combobox.count())]
+
+
+def test_observed_source_attr_is_memoized(app):
+    source = PlainModel(modes=['a', 'b'])
+    instance = PlainModel(mode='b')
+    choice_list, combobox = make_choice_list(instance, source_instance=source, source_attr='modes')
+    misses = choice_list.choice_model.misses
+
+    choice_list.update_element()
+    choice_list.update_element()
+    assert choice_list.choice_model.misses == misses
+
+    source.modes = ['a', 'b', 'c']
+    assert items(combobox) == ['a', 'b', 'c']
+    assert combobox.currentText() == 'b'
+
+
+def test_value_source_without_source_attr_is_recomputed(app):
+    modes = ['a', 'b']
+    instance = PlainModel(mode='b')
+
+    def names():
+        return list(modes)
+
+    def values():
+        return list(modes)
+
+    choice_list, combobox = make_choice_list(instance, name_source_fcn=names, value_source=values)
+    assert items(combobox) == ['a', 'b']
+    assert not choice_list.choice_model.observed
+
+    modes.append('c')
+    choice_list.update_element()
+    assert items(combobox) == ['a', 'b', 'c']
+    assert combobox.currentText() == 'b'
+
+
+def test_version_stamp_memoizes_value_source(app):
+    instance = PlainModel(mode='b', modes=['a', 'b'], __version__=1)
+    calls = []
+
+    def names_and_values(source):
+        calls.append(source)
+        return list(source.modes), list(source.modes)
+
+    choice_list, combobox = make_choice_list(instance, name_source_fcn=names_and_values,
+                                             value_source=names_and_values)
+    choice_list.update_element()
+    assert calls.__len__() == 1
+
+    instance.modes = ['a', 'b', 'c']
+    object.__setattr__(instance, '__version__', 2)
+    choice_list.update_element()
+    assert calls.__len__() == 2
+    assert items(combobox) == ['a', 'b', 'c']
+
+
+def test_source_changes_keep_the_current_value(app):
+    choices = [Child(f'm{i}') for i in range(10)]
+    source = PlainModel(modes=choices)
+    instance = PlainModel(mode=choices[5])
+    choice_list, combobox = make_choice_list(instance, source_instance=source, source_attr='modes')
+    changes = []
+    combobox.currentIndexChanged.connect(changes.append)
+
+    source.modes = [Child('new')] + choices[:3] + choices[4:]
+    choices[5].name = 'renamed'
+    source.modes = list(source.modes)
+    assert items(combobox) == ['new', 'm0', 'm1', 'm2', 'm4', 'renamed', 'm6', 'm7', 'm8', 'm9']
+    assert combobox.currentText() == 'renamed'
+    assert changes == []
+
+
+def test_3000_choices_are_diffed(app):
+    # single changes are row operations; only a full replace resets the model
+    choices = [Child(f'm{i}') for i in range(3000)]
+    source = PlainModel(modes=list(choices))
+    instance = PlainModel(mode=choices[1500])
+    choice_list, combobox = make_choice_list(instance, source_instance=source, source_attr='modes')
+    model = choice_list.choice_model
+    counts = {'reset': 0, 'inserted': 0, 'removed': 0}
+    model.modelReset.connect(lambda: counts.__setitem__('reset', counts['reset'] + 1))
+    model.rowsInserted.connect(lambda *args: counts.__setitem__('inserted', counts['inserted'] + 1))
+    model.rowsRemoved.connect(lambda *args: counts.__setitem__('removed', counts['removed'] + 1))
+
+    source.modes = choices + [Child('extra')]
+    source.modes = choices[:1000] + choices[1001:]
+    choices[2000].name = 'renamed'
+    source.modes = list(choices)
+    assert counts == {'reset': 0, 'inserted': 2, 'removed': 2}
+    assert combobox.itemText(2000) == 'renamed'
+
+    source.modes = [choice if choice is instance.mode else Child(choice.name) for choice in choices]
+    assert counts['reset'] == 1
+    assert combobox.count() == 3000
+    assert combobox.currentText() == 'm1500'
+
+
+@pytest.mark.benchmark
+def test_benchmark_3000_choices(app):
+    # the choices of a source are diffed by ChoiceModel.set_objects; only a full replace resets the model
+    choices = [Child(f'm{i}') for i in range(3000)]
+    source = PlainModel(modes=list(choices))
+    instance = PlainModel(mode=choices[1500])
+    choice_list, combobox = make_choice_list(instance, source_instance=source, source_attr='modes')
+    times = {'append': [], 'remove': [], 'rename': [], 'reset': [], 'clear/add': []}
+
+    def timed(operation, modes):
+        start = time.perf_counter()
+        source.modes = modes
+        times[operation].append(time.perf_counter() - start)
+
+    def clear_and_add():
+        # what update_gui_element_choices did for every change before the choices were diffed
+        start = time.perf_counter()
+        old_combobox.clear()
+        for choice in choices:
+            old_combobox.addItem(choice.name)
+        times['clear/add'].append(time.perf_counter() - start)
+
+    old_combobox = QtWidgets.QComboBox()
+    for _ in range(5):
+        timed('append', choices + [Child('extra')])
+        timed('remove', choices[:1000] + choices[1001:])
+        choices[2000].name = 'renamed'
+        timed('rename', list(choices))
+        choices[2000].name = 'm2000'
+        timed('reset', [choice if choice is instance.mode else Child(choice.name) for choice in choices])
+        source.modes = list(choices)
+        clear_and_add()
+
+    print('\n3000 choices: ' + ', '.join(f'{operation} {min(values) * 1e3:.2f} ms'
+                                         for operation, values in times.items()))
+    assert combobox.count() == 3000
+    assert combobox.currentText() == 'm1500'
+    for operation in ('append', 'remove', 'rename'):
+        assert min(times[operation]) < min(times['clear/add'])
+
+
+def test_paged_callable_source_is_streamed(app):
+    choices = [Child(f'm{i}') for i in range(30)]
+    source = PlainModel(modes=lambda offset, count: choices[offset:offset + count])
+    instance = PlainModel(mode=choices[3])
+    choice_list, combobox = make_choice_list(instance, source_instance=source, source_attr='modes', page_size=10)
+    model = choice_list.choice_model
+    assert model.streaming
+    assert items(combobox) == [f'm{i}' for i in range(10)]
+    assert combobox.currentText() == 'm3'
+
+    model.fetchMore()
+    assert combobox.count() == 20
+
+
+def test_static_choices_are_diffed(app):
+    instance = PlainModel(mode=2)
+    combobox = QtWidgets.QComboBox()
+    choice_list = ChoiceList(instance=instance, attr='mode', gui_element=combobox, choice_names=['a', 'b', 'c'],
+                             choice_values=[1, 2, 3])
+    assert (items(combobox), combobox.currentText()) == (['a', 'b', 'c'], 'b')
+
+    model = combobox.model()
+    resets, changes = [], []
+    model.modelReset.connect(lambda: resets.append(1))
+    combobox.currentIndexChanged.connect(changes.append)
+    for _ in range(3):
+        choice_list.update_element()
+    choice_list.choice_names, choice_list.choice_values = ['z', 'a', 'b', 'c'], [0, 1, 2, 3]
+    assert combobox.model() is model
+    assert (items(combobox), combobox.currentText()) == (['z', 'a', 'b', 'c'], 'b')
+    assert (resets, changes) == ([], [])
+
+
+def test_comboboxes_share_one_reference_counted_model(app):
+    source = PlainModel(modes=['a', 'b'])
+    choice_lists = [make_choice_list(PlainModel(mode='a'), source_instance=source, source_attr='modes')
+                    for _ in range(3)]
+    model = choice_lists[0][0].choice_model
+    assert all(combobox.model() is model for _, combobox in choice_lists)
+    assert (model.ref_count, source.observers.__len__()) == (3, 1)
+
+    misses = model.misses
+    source.modes = ['a', 'b', 'c']
+    assert model.misses == misses + 1
+    assert all(items(combobox) == ['a', 'b', 'c'] for _, combobox in choice_lists)
+
+    choice_lists[0][0].release_choice_model()
+    assert model.ref_count == 2
+    for _, combobox in choice_lists[1:]:
+        combobox.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    assert model.ref_count == 0
+    assert source.observers == []
+    assert model not in [shared for shared, _ in choice_model_counts()]
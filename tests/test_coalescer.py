@@ -0,0 +1,45 @@
+import threading
+import time
+
+from pyqt_info_tools.coalescer import RefreshCoalescer
+
+
+def make_coalescer(**kwargs):
+    refreshed = []
+    return RefreshCoalescer(refreshed.append, **kwargs), refreshed
+
+
+def test_notifications_are_coalesced_to_one_refresh_per_key(app):
+    coalescer, refreshed = make_coalescer()
+    for _ in range(100):
+        coalescer.mark_dirty()
+    coalescer.mark_dirty('name')
+    assert refreshed == []
+    assert sorted(coalescer.pending, key=str) == [None, 'name']
+
+    app.processEvents()
+    assert refreshed == [None, 'name']
+    assert coalescer.stats() == {'notifications': 101, 'refreshes': 2, 'pending': 0}
+
+    coalescer.reset_stats()
+    coalescer.mark_dirty('name')
+    coalescer.discard()
+    app.processEvents()
+    assert refreshed == [None, 'name']
+    assert coalescer.stats() == {'notifications': 1, 'refreshes': 0, 'pending': 0}
+
+
+def test_mark_dirty_from_threads(app):
+    coalescer, refreshed = make_coalescer()
+    threads = [threading.Thread(target=lambda i=i: [coalescer.mark_dirty(i % 4) for _ in range(1000)])
+               for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # the queued flush requests start the timer, the flush runs in a later event loop iteration
+    end = time.perf_counter() + 5
+    while coalescer.pending and (time.perf_counter() < end):
+        app.processEvents()
+    assert sorted(refreshed) == [0, 1, 2, 3]
+    assert coalescer.stats() == {'notifications': 8000, 'refreshes': 4, 'pending': 0}
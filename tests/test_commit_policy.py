@@ -0,0 +1,54 @@
+import time
+
+from PyQt5.QtTest import QTest
+
+from pyqt_info_tools.info_base_class import InfoBaseClass
+
+from .helpers import CountingModel, line_edit_ui_cls
+
+
+keys = ['name', 'title', 'notes']
+LineEditUi = line_edit_ui_cls(keys)
+
+
+class PolicyInfo(InfoBaseClass):
+    editable_attributes = {'name': {'type': str, 'direct_edit': True, 'commit': 'keystroke'},
+                           'title': {'type': str, 'direct_edit': True, 'commit': 'debounce', 'debounce_ms': 20},
+                           'notes': {'type': str, 'direct_edit': True, 'commit': 'finished'}}
+
+
+def make_info():
+    instance = CountingModel(name='', title='', notes='')
+    info = PolicyInfo(instance=instance, ui_info=LineEditUi)
+    instance.reset_counts()
+    return info, instance
+
+
+def test_keystroke_commits_every_change(app):
+    info, instance = make_info()
+    QTest.keyClicks(info.dialog.ui.name_lineEdit, 'word')
+    assert (instance.name, instance.setattr_count) == ('word', 4)
+
+
+def test_debounce_commits_once_after_the_last_keystroke(app):
+    info, instance = make_info()
+    QTest.keyClicks(info.dialog.ui.title_lineEdit, 'word')
+    assert (instance.title, instance.setattr_count) == ('', 0)
+    assert info.commit_scheduler.pending == ['title']
+
+    end = time.perf_counter() + 5
+    while info.commit_scheduler.pending and (time.perf_counter() < end):
+        app.processEvents()
+    assert (instance.title, instance.setattr_count) == ('word', 1)
+
+
+def test_finished_commits_on_editing_finished(app):
+    info, instance = make_info()
+    line_edit = info.dialog.ui.notes_lineEdit
+    QTest.keyClicks(line_edit, 'word')
+    app.processEvents()
+    assert (instance.notes, instance.setattr_count) == ('', 0)
+
+    line_edit.editingFinished.emit()
+    assert (instance.notes, instance.setattr_count) == ('word', 1)
+    assert info.commit_scheduler.pending == []
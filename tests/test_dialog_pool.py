@@ -0,0 +1,70 @@
+import gc
+import weakref
+
+from PyQt5 import QtWidgets
+
+from pyqt_info_tools.dialog_pool import DialogPool
+from pyqt_info_tools.info_base_class import dialog_pool
+
+from .helpers import CountingModel, FieldsUi, make_fields_info_cls, make_fields_model
+
+
+modes = CountingModel(modes=['a', 'b', 'c'])
+FieldsInfo = make_fields_info_cls(modes)
+
+
+def test_released_dialog_does_not_keep_info_and_instance_alive(app):
+    dialog_pool.clear()
+    instance = make_fields_model()
+    info = FieldsInfo(instance=instance, ui_info=FieldsUi, use_dialog_pool=True)
+    dialog = info.dialog
+    info.close_event()
+    assert dialog_pool.idle_count(FieldsUi) == 1
+    assert 'closeEvent' not in dialog.__dict__
+    assert dialog.ui.name_lineEdit.instance is None
+    assert dialog.ui.children_listWidget.count() == 0
+
+    info_ref, instance_ref = weakref.ref(info), weakref.ref(instance)
+    del info, instance
+    gc.collect()
+    assert info_ref() is None
+    assert instance_ref() is None
+
+    reused = FieldsInfo(instance=make_fields_model(), ui_info=FieldsUi, use_dialog_pool=True)
+    assert reused.dialog is dialog
+    assert dialog.ui.children_listWidget.count() == 5
+
+
+def test_rebind_releases_old_instance(app):
+    old, new = make_fields_model(), make_fields_model()
+    new.name = 'new'
+    info = FieldsInfo(instance=old, ui_info=FieldsUi)
+    assert old.selected and (old.info is info)
+    info.rebind(new)
+    assert (old.info is None) and (not old.selected)
+    assert (new.info is info) and new.selected
+    assert info.dialog.ui.name_lineEdit.text() == 'new'
+    old.name = 'changed'
+    assert info.dialog.ui.name_lineEdit.text() == 'new'
+
+
+def test_prewarm_counts_queued_dialogs(app):
+    built = []
+
+    def build(ui_info, parent):
+        built.append(ui_info)
+        return QtWidgets.QDialog()
+
+    pool = DialogPool(build_fcn=build, max_per_class=4)
+    for _ in range(3):
+        pool.prewarm(FieldsUi, count=2)
+    for _ in range(10):
+        app.processEvents()
+    assert pool.idle_count(FieldsUi) == 2
+    assert built.__len__() == 2
+
+    pool.prewarm(FieldsUi, count=3)
+    for _ in range(10):
+        app.processEvents()
+    assert (pool.idle_count(FieldsUi), built.__len__()) == (3, 3)
+    pool.clear()
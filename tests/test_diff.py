@@ -0,0 +1,47 @@
+import random
+
+from pyqt_info_tools.diff import keyed_diff, occurrence_keys
+
+
+def apply(old_keys, new_keys, operations):
+    current = list(old_keys)
+    for operation in operations:
+        if operation[0] == 'remove':
+            del current[operation[1]]
+        elif operation[0] == 'insert':
+            current.insert(operation[1], new_keys[operation[1]])
+        else:
+            current.insert(operation[2], current.pop(operation[1]))
+    return current
+
+
+def test_single_changes_produce_one_operation():
+    keys = list(range(3000))
+    assert keyed_diff(keys, keys + ['new']) == [('insert', 3000)]
+    assert keyed_diff(keys, keys[:1000] + keys[1001:]) == [('remove', 1000)]
+    assert keyed_diff(keys, keys[:5] + ['new'] + keys[5:]) == [('insert', 5)]
+    assert keyed_diff(keys, keys) == []
+
+
+def test_operations_transform_old_into_new():
+    rng = random.Random(0)
+    for _ in range(2000):
+        old_keys = rng.sample(range(20), rng.randint(0, 12))
+        new_keys = list(old_keys)
+        if rng.random() < 0.3:
+            rng.shuffle(new_keys)
+        if new_keys and rng.random() < 0.5:
+            new_keys.pop(rng.randrange(new_keys.__len__()))
+        if rng.random() < 0.5:
+            new_keys.insert(rng.randint(0, new_keys.__len__()), 'new')
+        assert apply(old_keys, new_keys, keyed_diff(old_keys, new_keys)) == new_keys
+
+
+def test_max_operations():
+    keys = list(range(100))
+    assert keyed_diff(keys, keys[::-1], max_operations=10) is None
+    assert keyed_diff(keys, keys[::-1]) is not None
+
+
+def test_occurrence_keys():
+    assert occurrence_keys(['a', 'b', 'a', 'a']) == ['a', 'b', ('a', 1), ('a', 2)]
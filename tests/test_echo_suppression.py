@@ -0,0 +1,53 @@
+from PyQt5.QtTest import QTest
+
+from .helpers import CountingModel, FieldsUi, make_fields_info_cls, make_fields_model
+
+
+modes = CountingModel(modes=['a', 'b', 'c'])
+FieldsInfo = make_fields_info_cls(modes)
+
+
+def test_one_setattr_per_keystroke(app):
+    instance = make_fields_model()
+    info = FieldsInfo(instance=instance, ui_info=FieldsUi)
+    line_edit = info.dialog.ui.name_lineEdit
+    line_edit.setFocus()
+    instance.reset_counts()
+
+    QTest.keyClicks(line_edit, 'abc')
+
+    assert instance.name == 'mabc'
+    assert instance.setattr_count == 3
+    # the dialog is the only observer; its notifications are echoes of its own edits
+    assert instance.notify_count == 3
+    assert info.echo_suppressed == 3
+    assert line_edit.text() == 'mabc'
+    assert line_edit.cursorPosition() == 4
+
+
+def test_echo_suppression_keeps_other_observers(app):
+    instance = make_fields_model()
+    info = FieldsInfo(instance=instance, ui_info=FieldsUi)
+    other = FieldsInfo(instance=instance, ui_info=FieldsUi)
+    instance.reset_counts()
+
+    QTest.keyClicks(info.dialog.ui.count_lineEdit, '4')
+
+    assert instance.count == 34
+    assert instance.setattr_count == 1
+    assert instance.notify_count == 2
+    assert info.echo_suppressed == 1
+    assert other.echo_suppressed == 0
+    assert other.dialog.ui.count_lineEdit.text() == '34'
+
+
+def test_external_change_is_written_to_the_gui(app):
+    instance = make_fields_model()
+    info = FieldsInfo(instance=instance, ui_info=FieldsUi)
+    instance.reset_counts()
+
+    instance.name = 'external'
+
+    assert info.dialog.ui.name_lineEdit.text() == 'external'
+    assert instance.setattr_count == 1
+    assert info.echo_suppressed == 0
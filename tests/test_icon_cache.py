@@ -0,0 +1,53 @@
+from PyQt5.QtGui import QColor, QImage
+
+from pyqt_info_tools import icon_cache
+
+from .helpers import process_events_until
+
+
+def make_images(tmp_path, count):
+    paths = []
+    for i in range(count):
+        image = QImage(8, 8, QImage.Format_RGB32)
+        image.fill(QColor(i * 40, 0, 0))
+        path = str(tmp_path / f'icon{i}.png')
+        assert image.save(path)
+        paths.append(path)
+    return paths
+
+
+def test_icons_are_decoded_once_in_the_background(single_thread_executor, app, tmp_path):
+    icon_cache.clear()
+    icon_cache.reset_stats()
+    path = make_images(tmp_path, 1)[0]
+    ready = []
+
+    def callback(class_icon, icon):
+        ready.append((class_icon, icon))
+
+    assert icon_cache.icon(path, callback=callback) is None
+    assert icon_cache.icon(path, callback=callback) is None
+    assert process_events_until(app, lambda: ready)
+    assert ready.__len__() == 1
+    assert ready[0][0] == path
+    assert not ready[0][1].isNull()
+
+    assert icon_cache.icon(path) is ready[0][1]
+    assert (icon_cache.stats['hits'], icon_cache.stats['misses']) == (1, 2)
+    assert icon_cache.hit_rate() == 1 / 3
+
+
+def test_cache_evicts_least_recently_used(single_thread_executor, app, tmp_path, monkeypatch):
+    monkeypatch.setattr(icon_cache, 'max_icons', 2)
+    icon_cache.clear()
+    icon_cache.reset_stats()
+    paths = make_images(tmp_path, 3)
+    for path in paths[:2]:
+        icon_cache.icon(path)
+    assert process_events_until(app, lambda: all(path in icon_cache._icons for path in paths[:2]))
+
+    assert icon_cache.icon(paths[0]) is not None
+    icon_cache.icon(paths[2])
+    assert process_events_until(app, lambda: paths[2] in icon_cache._icons)
+    assert list(icon_cache._icons.keys()) == [paths[0], paths[2]]
+    assert icon_cache.stats['evictions'] == 1
@@ -0,0 +1,75 @@
+from PyQt5 import QtCore, QtWidgets
+from PyQt5.QtTest import QTest
+
+from pyqt_info_tools import subscriptions
+from pyqt_info_tools.info_base_class import ListViewChoice
+
+from .helpers import CountingModel
+
+
+def make_list_view_choice(**kwargs):
+    options = CountingModel(options=['a', 'b', 'c'])
+    rows = [CountingModel(name=f'r{i}', option='a') for i in range(20)]
+    owner = CountingModel(rows=rows)
+    list_view = QtWidgets.QListView()
+    list_view.resize(400, 300)
+    list_view_choice = ListViewChoice(instance=owner, items_attr='rows', list_source_attr='rows', edit_attr='option',
+                                      choice_source_instance=options, choice_source_attr='options', **kwargs)
+    list_view_choice.list_view_widget = list_view
+    list_view_choice.update_element()
+    return list_view_choice, list_view, rows
+
+
+def test_choice_is_edited_through_the_delegate(app):
+    calls = []
+    list_view_choice, list_view, rows = make_list_view_choice(
+        update_fcn=lambda *args, **kwargs: calls.append((args, kwargs)))
+    list_view.show()
+    app.processEvents()
+
+    rect = list_view.visualRect(list_view_choice.model.index(2, 0))
+    QTest.mouseClick(list_view.viewport(), QtCore.Qt.LeftButton, pos=QtCore.QPoint(rect.right() - 10,
+                                                                                  rect.center().y()))
+    editors = list_view.findChildren(QtWidgets.QComboBox)
+    assert editors.__len__() == 1
+    editors[0].setCurrentIndex(1)
+    editors[0].activated.emit(1)
+    app.processEvents()
+
+    assert rows[2].option == 'b'
+    assert calls == [((1,), {'instance': rows[2], 'attribute': 'option'})]
+    assert list_view_choice.current_choice_name(2) == 'b'
+
+
+def test_unchanged_choice_does_not_call_update_fcn(app):
+    calls = []
+    list_view_choice, list_view, rows = make_list_view_choice(update_fcn=lambda *args, **kwargs: calls.append(args))
+    list_view_choice.set_choice(3, 0)
+    assert calls == []
+    list_view_choice.set_choice(3, 2)
+    assert (rows[3].option == 'c') and (calls == [(2,)])
+
+
+def test_fetched_rows_are_subscribed_incrementally(app):
+    subscriptions.reset_stats()
+    options = CountingModel(options=['a', 'b', 'c'])
+    rows = [CountingModel(name=f'r{i}', option='a') for i in range(50)]
+    owner = CountingModel(rows=iter(rows))
+    list_view = QtWidgets.QListView()
+    list_view_choice = ListViewChoice(instance=owner, items_attr='rows', list_source_attr='rows', edit_attr='option',
+                                      choice_source_instance=options, choice_source_attr='options', page_size=10)
+    list_view_choice.list_view_widget = list_view
+    list_view_choice.update_element()
+    assert subscriptions.subscriptions_of(list_view_choice.delegate).__len__() == 10
+
+    while list_view_choice.can_fetch_more():
+        list_view_choice.fetch_more()
+    assert list_view_choice.model.rowCount() == 50
+    assert subscriptions.subscriptions_of(list_view_choice.delegate).__len__() == 50
+    # the rows of the previous pages are not subscribed again
+    assert subscriptions.stats['redundant_subscriptions_avoided'] == 0
+
+    changed = []
+    list_view_choice.model.dataChanged.connect(lambda top_left, *args: changed.append(top_left.row()))
+    rows[45].option = 'b'
+    assert changed == [45]
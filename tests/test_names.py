@@ -0,0 +1,68 @@
+import pytest
+
+from pyqt_info_tools import names
+
+from .helpers import Child, best_time
+
+
+class Unnamed(object):
+
+    def __init__(self, object_id):
+        self.id = object_id
+
+
+class Labelled(object):
+    pass
+
+
+def probe_name(value, key=None):
+    # the per-item hasattr chain compute_choices and object_list_item_text used before names.py
+    if isinstance(value, type):
+        if hasattr(value, 'visible_class_name'):
+            return value.visible_class_name
+        return value.__name__
+    if hasattr(value, 'name'):
+        return value.name
+    if key is not None:
+        return str(key)
+    if hasattr(value, 'id'):
+        return str(value.id)
+    return str(value)
+
+
+def test_precedence():
+    assert names.resolve_names([Child('a'), Unnamed(7), 3]) == ['a', '7', '3']
+    assert names.resolve_names({'k': Unnamed(7), 'n': Child('a')}) == ['k', 'a']
+    assert names.resolve_names([Child, int]) == ['Child', 'int']
+
+
+def test_registered_resolver_is_used_for_subclasses():
+    class Sub(Labelled):
+        pass
+
+    names.register(Labelled, lambda instance: 'label')
+    try:
+        assert names.resolve_names([Sub(), Labelled()]) == ['label', 'label']
+    finally:
+        names.unregister(Labelled)
+    assert names.resolve(Sub()).startswith('<')
+
+
+def test_strategy_is_chosen_once_per_type():
+    for values in (list(range(50000)), [Child(f'c{i}') for i in range(50000)]):
+        names.reset_stats()
+        resolved = names.resolve_names(values)
+        assert names.stats['strategies'] <= 1
+        assert names.stats['resolved'] == 50000
+        assert resolved == [probe_name(value) for value in values]
+
+
+@pytest.mark.benchmark
+def test_benchmark_50k_names():
+    # the strategy is chosen once per type instead of probing every item
+    for label, values in (('ints', list(range(50000))),
+                          ('named objects', [Child(f'c{i}') for i in range(50000)])):
+        probe_time = best_time(lambda: [probe_name(value) for value in values])
+        resolve_time = best_time(lambda: names.resolve_names(values))
+        print(f'\n50k {label}: per-item probing {probe_time * 1e3:.1f} ms, resolve_names {resolve_time * 1e3:.1f} ms')
+        assert resolve_time < probe_time
@@ -0,0 +1,94 @@
+import time
+
+from PyQt5 import QtCore, QtWidgets
+
+from pyqt_info_tools import names
+from pyqt_info_tools.models import ObjectListModel
+
+from .helpers import Child, CountingModel, FieldsUi, make_fields_info_cls, make_fields_model
+
+
+modes = CountingModel(modes=['a', 'b', 'c'])
+FieldsInfo = make_fields_info_cls(modes)
+
+
+class ModelFieldsUi(FieldsUi):
+
+    def setupUi(self, dialog):
+        super(ModelFieldsUi, self).setupUi(dialog)
+        self.children_listView = QtWidgets.QListView(dialog)
+        dialog.layout().addWidget(self.children_listView)
+
+
+class ModelFieldsInfo(FieldsInfo):
+    editable_attributes = dict(FieldsInfo.editable_attributes)
+    editable_attributes['children'] = {'type': 'object', 'select': {'type': 'multiple', 'backend': 'model',
+                                                                    'selectable_objects': None}}
+
+
+class ClickableChild(Child):
+
+    def __init__(self, name):
+        super(ClickableChild, self).__init__(name)
+        self.clicks = 0
+
+    def double_clicked(self):
+        self.clicks += 1
+
+
+def test_rows_are_looked_up_by_row(app):
+    instance = make_fields_model()
+    instance.children = [ClickableChild(f'c{i}') for i in range(10)]
+    info = ModelFieldsInfo(instance=instance, ui_info=ModelFieldsUi)
+    view = info.dialog.ui.children_listView
+    model = view.model()
+    assert isinstance(model, ObjectListModel)
+    assert model.rowCount() == 10
+    assert model.data(model.index(3)) == 'c3'
+
+    view.doubleClicked.emit(model.index(2))
+    assert instance.children[2].clicks == 1
+
+    view.selectionModel().select(model.index(4), QtCore.QItemSelectionModel.Select)
+    instance.children = instance.children[1:] + [ClickableChild('new')]
+    assert model.rowCount() == 10
+    assert model.instance_at(9).name == 'new'
+    assert [index.row() for index in view.selectionModel().selectedIndexes()] == [3]
+
+
+def test_benchmark_open_100k(app):
+    # target: a dialog with a 100k-element list opens in under 100 ms; names are resolved for visible rows only
+    instance = make_fields_model()
+    instance.children = [Child(f'c{i}') for i in range(100000)]
+    names.reset_stats()
+
+    start = time.perf_counter()
+    info = ModelFieldsInfo(instance=instance, ui_info=ModelFieldsUi)
+    info.dialog.show()
+    app.processEvents()
+    open_time = time.perf_counter() - start
+
+    print(f'\nopen dialog with 100k objects: {open_time * 1e3:.1f} ms, {names.stats["resolved"]} names resolved')
+    assert info.dialog.ui.children_listView.model().rowCount() == 100000
+    assert names.stats['resolved'] < 1000
+    info.dialog.close()
+
+
+def test_paged_callable_is_streamed(app):
+    children = [Child(f'c{i}') for i in range(25)]
+    requests = []
+
+    def fetch(offset, count):
+        requests.append((offset, count))
+        return children[offset:offset + count]
+
+    model = ObjectListModel(fetch, page_size=10)
+    assert model.streaming
+    assert (model.rowCount(), requests) == (10, [(0, 10)])
+    assert model.data(model.index(9)) == 'c9'
+
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == 25
+    assert requests == [(0, 10), (10, 10), (20, 10)]
+    assert model.instance_at(24) is children[24]
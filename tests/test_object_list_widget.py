@@ -0,0 +1,72 @@
+from PyQt5 import QtWidgets
+
+from pyqt_info_tools.info_base_class import update_object_list_widget
+
+from .helpers import Child, best_time
+
+
+def texts(list_widget):
+    return [list_widget.item(row).text() for row in range(list_widget.count())]
+
+
+def test_diff_keeps_items_and_selection(app):
+    list_widget = QtWidgets.QListWidget()
+    list_widget.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+    children = [Child(f'c{i}') for i in range(10)]
+    update_object_list_widget(list_widget, children)
+    first_item = list_widget.item(0)
+    list_widget.item(3).setSelected(True)
+
+    update_object_list_widget(list_widget, children[1:] + [children[0], Child('new')])
+
+    assert texts(list_widget) == [f'c{i}' for i in range(1, 10)] + ['c0', 'new']
+    assert list_widget.item(9) is first_item
+    assert [item.text() for item in list_widget.selectedItems()] == ['c3']
+
+
+def test_many_changes_rebuild_and_keep_selection(app):
+    list_widget = QtWidgets.QListWidget()
+    children = [Child(f'c{i}') for i in range(1000)]
+    update_object_list_widget(list_widget, children)
+    list_widget.item(10).setSelected(True)
+
+    update_object_list_widget(list_widget, children[::-1])
+
+    assert texts(list_widget) == [f'c{i}' for i in range(999, -1, -1)]
+    assert [item.text() for item in list_widget.selectedItems()] == ['c10']
+    assert list_widget.item(989).instance is children[10]
+
+
+def test_benchmark_10k_items(app):
+    list_widget = QtWidgets.QListWidget()
+    children = [Child(f'c{i}') for i in range(10000)]
+    appended = children + [Child('appended')]
+    removed = children[:5000] + children[5001:]
+    moved = children[1:] + children[:1]
+
+    def rebuild():
+        list_widget.clear()
+        list_widget.item_keys = None
+        update_object_list_widget(list_widget, children)
+
+    def change(new_children):
+        def run():
+            update_object_list_widget(list_widget, children)
+            update_object_list_widget(list_widget, new_children)
+        return run
+
+    rebuild_time = best_time(rebuild, repeat=3)
+    times = {'append': best_time(change(appended), repeat=3),
+             'remove': best_time(change(removed), repeat=3),
+             'move first to end': best_time(change(moved), repeat=3),
+             'reverse': best_time(change(children[::-1]), repeat=3)}
+
+    print(f'\n10k items: rebuild {rebuild_time * 1e3:.1f} ms', end='')
+    for name, change_time in times.items():
+        # each run changes the list and changes it back
+        print(f', {name} {change_time / 2 * 1e3:.1f} ms', end='')
+    print()
+    assert times['append'] / 2 < rebuild_time
+    assert times['remove'] / 2 < rebuild_time
+    assert times['reverse'] / 2 < 2 * rebuild_time
+    assert texts(list_widget)[0] == 'c9999'
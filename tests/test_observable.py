@@ -0,0 +1,109 @@
+import gc
+
+from pyqt_info_tools.observable import Observable
+
+from .helpers import best_time
+
+
+class Point(Observable):
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+
+
+class SlotsPoint(Observable):
+
+    __slots__ = ('x', 'y')
+
+
+class Recorder(object):
+
+    def __init__(self):
+        self.calls = []
+
+    def changed(self, **kwargs):
+        self.calls.append(kwargs.get('attributes', kwargs['attribute']))
+
+
+class SlotsRecorder(object):
+
+    __slots__ = ('calls',)
+
+    def __init__(self):
+        self.calls = []
+
+    def changed(self, **kwargs):
+        self.calls.append(kwargs['attribute'])
+
+
+def test_observers_are_called_per_attribute():
+    point, recorder, all_recorder = Point(), Recorder(), Recorder()
+    point.add_observer(recorder.changed, attr_dependent=['x'])
+    point.add_observer(recorder.changed, attr_dependent=['x'])
+    point.add_observer(all_recorder.changed)
+    point.x = 1
+    point.y = 2
+    assert recorder.calls == ['x']
+    assert all_recorder.calls == ['x', 'y']
+    assert point.observer_count('x') == 1
+
+
+def test_bound_method_observers_are_weak():
+    point, recorder = Point(), Recorder()
+    point.add_observer(recorder.changed, attr_dependent=['x'])
+    del recorder
+    gc.collect()
+    assert point.observer_count() == 0
+    point.x = 1
+
+
+def test_slots_observer_without_weakref():
+    point, recorder = SlotsPoint(), SlotsRecorder()
+    point.add_observer(recorder.changed, attr_dependent=['x'])
+    point.x = 1
+    assert recorder.calls == ['x']
+    point.remove_observer(recorder.changed)
+    point.x = 2
+    assert recorder.calls == ['x']
+
+
+def test_class_observers_and_transactions():
+    recorder, instance_recorder = Recorder(), Recorder()
+    Point.add_cls_observer(recorder.changed, attr_dependent=['x'])
+    try:
+        point = Point()
+        point.add_observer(instance_recorder.changed, attr_dependent=['x', 'y'])
+        with point.transaction():
+            point.x = 1
+            point.y = 1
+            point.x = 2
+        assert instance_recorder.calls == [('x', 'y')]
+        assert recorder.calls == ['x', ('x',)]
+    finally:
+        Point.remove_cls_observer(recorder.changed)
+
+
+def test_benchmark_notify():
+    # notify cost with 1, 100 and 10,000 subscribers of x; changes of y must not touch the subscribers of x
+    results = {}
+    for count in [1, 100, 10000]:
+        point = Point()
+        recorders = [Recorder() for _ in range(count)]
+        for recorder in recorders:
+            point.add_observer(recorder.changed, attr_dependent=['x'])
+        number = max(10000 // count, 1)
+
+        def set_x():
+            point.x = 1
+
+        def set_y():
+            point.y = 1
+
+        results[count] = (best_time(set_x, number=number) / number, best_time(set_y, number=1000) / 1000)
+        assert recorders[0].calls.__len__() == 5 * number
+
+    for count, (x_time, y_time) in results.items():
+        print(f'\n{count:>5} subscribers: notify x {x_time * 1e6:9.2f} us, notify y {y_time * 1e6:6.2f} us', end='')
+    print()
+    assert results[10000][1] < results[10000][0] / 100
@@ -0,0 +1,137 @@
+import pytest
+from PyQt5 import QtCore, QtWidgets
+
+from pyqt_info_tools import subscriptions
+from pyqt_info_tools.info_base_class import ChoiceList, ListViewChoice
+from pyqt_info_tools.subscriptions import subscribe, subscription_count
+
+from .helpers import CountingModel, PlainModel, FieldsUi, make_fields_info_cls, make_fields_model
+
+
+modes = CountingModel(modes=['a', 'b', 'c'])
+FieldsInfo = make_fields_info_cls(modes)
+
+
+@pytest.mark.parametrize('model_cls', [CountingModel, PlainModel])
+def test_closed_dialogs_stop_observing(main_window, model_cls):
+    instance = make_fields_model(model_cls)
+    infos = [FieldsInfo(instance=instance, ui_info=FieldsUi) for _ in range(5)]
+    assert all(info.dialog.parent() is main_window for info in infos)
+    # one subscription per dialog and one of the mode ChoiceList, which is bound to the last dialog
+    assert subscription_count(instance) == 6
+
+    for info in infos:
+        info.close_event()
+    assert subscription_count(instance) == 0
+
+    instance.name = 'changed'
+    assert all(info.dialog.ui.name_lineEdit.text() == 'm' for info in infos)
+
+
+def test_kept_dialog_keeps_observing(main_window):
+    instance = make_fields_model()
+    info = FieldsInfo(instance=instance, ui_info=FieldsUi, keep_when_closed=True)
+    info.close_event()
+    instance.name = 'changed'
+    assert info.dialog.ui.name_lineEdit.text() == 'changed'
+
+
+class Observer(object):
+
+    def __init__(self, error):
+        self.error = error
+        self.calls = 0
+
+    def changed(self, **kwargs):
+        self.calls += 1
+        raise self.error
+
+
+def test_deleted_widget_cancels_subscription(app):
+    instance = PlainModel(name='m')
+    observer = Observer(RuntimeError('wrapped C/C++ object of type QLabel has been deleted'))
+    subscription = subscribe(instance, observer.changed, attr_dependent=['name'])
+    instance.name = 'a'
+    instance.name = 'b'
+    assert observer.calls == 1
+    assert not subscription.active
+
+
+def test_other_runtime_errors_are_raised(app):
+    instance = PlainModel(name='m')
+    observer = Observer(RuntimeError('observer failed'))
+    subscription = subscribe(instance, observer.changed, attr_dependent=['name'])
+    with pytest.raises(RuntimeError):
+        instance.name = 'a'
+    assert subscription.active
+
+
+def run_event_loop():
+    # PyQt deletes the slot proxies of disconnected signals with deleteLater
+    loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(0, loop.quit)
+    loop.exec_()
+
+
+def test_pooled_dialog_does_not_accumulate_destroyed_connections(app):
+    def cycle():
+        info = FieldsInfo(instance=make_fields_model(), ui_info=FieldsUi, use_dialog_pool=True)
+        dialog = info.dialog
+        info.close_event()
+        run_event_loop()
+        return dialog
+
+    dialog = cycle()
+    combobox = dialog.ui.mode_comboBox
+    receivers = (dialog.receivers(dialog.destroyed), combobox.receivers(combobox.destroyed))
+    for _ in range(20):
+        assert cycle() is dialog
+    assert (dialog.receivers(dialog.destroyed), combobox.receivers(combobox.destroyed)) == receivers
+
+
+def test_destroyed_owner_cancels_subscriptions(app):
+    instance = PlainModel(name='m')
+    owner = QtCore.QObject()
+    observer = Observer(None)
+    subscriptions = [subscribe(instance, observer.changed, attr_dependent=['name'], owner=owner) for _ in range(3)]
+    assert owner.receivers(owner.destroyed) == 1
+    subscriptions[0].cancel()
+    assert owner.receivers(owner.destroyed) == 1
+    owner.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    assert not any(subscription.active for subscription in subscriptions)
+    assert instance.observers == []
+
+
+def test_reobserving_keeps_one_subscription(app):
+    subscriptions.reset_stats()
+    source, other_source = PlainModel(modes=['a', 'b']), PlainModel(modes=['a', 'b'])
+    instance = PlainModel(mode='b')
+    combobox = QtWidgets.QComboBox()
+    choice_list = ChoiceList(instance=instance, attr='mode', gui_element=combobox, source_instance=source,
+                             source_attr='modes')
+    for _ in range(5):
+        choice_list.observe()
+    assert subscription_count(instance) == 1
+    assert subscriptions.stats['redundant_subscriptions_avoided'] == 5
+
+    updates = []
+    update_element = choice_list.update_element
+    choice_list.update_element = lambda *args, **kwargs: updates.append(update_element())
+    instance.mode = 'a'
+    assert updates.__len__() == 1
+
+    choice_list.source_instance = other_source
+    choice_list.source_attr = 'modes'
+    assert subscription_count(instance) == 1
+    # the shared choice model of the old source was released with the combobox
+    assert subscription_count(source) == 0
+
+
+def test_list_view_choice_reobserves_its_list_source(app):
+    owner = PlainModel(rows=[PlainModel(option='a')])
+    list_view_choice = ListViewChoice(instance=owner, items_attr='rows', list_source_attr='rows', edit_attr='option')
+    list_view_choice.list_view_widget = QtWidgets.QListView()
+    for _ in range(5):
+        list_view_choice.list_source_attr = 'rows'
+    assert subscription_count(owner) == 1
@@ -0,0 +1,82 @@
+import threading
+
+import pytest
+
+from pyqt_info_tools import tasks
+from pyqt_info_tools.info_base_class import CustomDialog
+
+from .helpers import process_events_until
+
+
+def test_result_and_done_callback(single_thread_executor, app):
+    done = []
+    handle = tasks.run_task(lambda a, b: a + b, 1, 2)
+    handle.add_done_callback(done.append)
+    assert handle.result(timeout=5) == 3
+    assert process_events_until(app, lambda: done == [handle])
+    assert handle not in tasks._active
+
+
+def test_shutdown_cancels_queued_tasks(single_thread_executor, app):
+    release = threading.Event()
+    running = tasks.run_task(release.wait, 5)
+    assert process_events_until(app, running.running)
+    queued = [tasks.run_task(lambda: 'never') for _ in range(3)]
+    done = []
+    for handle in queued:
+        handle.add_done_callback(done.append)
+
+    assert not single_thread_executor.shutdown(timeout_ms=0)
+    assert all(handle.done() and handle.cancelled() for handle in queued)
+    assert done == queued
+    assert not tasks._active.intersection(queued)
+    with pytest.raises(RuntimeError):
+        queued[0].result(timeout=0)
+    assert single_thread_executor.stats()['queued'] == 0
+
+    release.set()
+    assert running.result(timeout=5)
+    assert process_events_until(app, lambda: running not in tasks._active)
+    assert tasks.run_task(lambda: 'late').cancelled()
+
+
+def test_cancel_delivers_callbacks_through_the_event_loop(single_thread_executor, app):
+    release = threading.Event()
+    running = tasks.run_task(release.wait, 5)
+    assert process_events_until(app, running.running)
+    queued = tasks.run_task(lambda: 'never')
+    done = []
+    queued.add_done_callback(done.append)
+
+    assert queued.cancel()
+    assert queued.cancelled() and (done == [])
+    assert process_events_until(app, lambda: done == [queued])
+    release.set()
+    assert running.result(timeout=5)
+
+
+def test_errors_are_logged(single_thread_executor, app, caplog):
+    def fail():
+        raise ValueError('failed')
+
+    handle = tasks.run_task(fail)
+    handle.add_done_callback(lambda handle: 1 / 0)
+    assert isinstance(handle.exception(timeout=5), ValueError)
+    assert process_events_until(app, lambda: handle not in tasks._active)
+    assert 'Error in background task' in caplog.text
+    assert 'ValueError: failed' in caplog.text
+    assert 'Error in done callback' in caplog.text
+
+
+def test_dialog_spinner_is_started_on_the_gui_thread(single_thread_executor, app):
+    dialog = CustomDialog()
+    release = threading.Event()
+    handle = dialog.run_task(release.wait, (5,))
+    # start_process is queued like start_waiting
+    assert dialog._running_tasks == 0
+    assert process_events_until(app, lambda: dialog._running_tasks == 1)
+    assert dialog.spinner.isSpinning()
+    release.set()
+    assert handle.result(timeout=5)
+    assert process_events_until(app, lambda: dialog._running_tasks == 0)
+    assert not dialog.spinner.isSpinning()
@@ -0,0 +1,61 @@
+from pyqt_info_tools.info_base_class import ChoiceList
+from pyqt_info_tools.models import ValueIndex
+
+from .helpers import best_time
+
+
+class Item(object):
+    """
+    Model object with an expensive __eq__ and without __hash__.
+    """
+
+    __hash__ = None
+
+    def __init__(self, number):
+        self.number = number
+
+    def __eq__(self, other):
+        return isinstance(other, Item) and (self.number == other.number)
+
+
+def test_lookup_by_identity_hash_and_equality():
+    items = [Item(i) for i in range(5)]
+    values = ['a', 'b', items[0], items[1], 'a', [1, 2]]
+    index = ValueIndex(values)
+    assert index.index('a') == 0
+    assert index.index('b') == 1
+    assert index.index(items[1]) == 3
+    assert index.index(Item(0)) == 2
+    assert index.index([1, 2]) == 5
+    assert index.index('missing') == -1
+    assert index.index(Item(9)) == -1
+
+
+def test_choice_list_index_is_rebuilt_on_change(app):
+    choice_list = ChoiceList(choice_names=['a', 'b'], choice_values=['a', 'b'])
+    assert choice_list.choice_index('b') == 1
+    choice_list.choice_values = ['c', 'b', 'a']
+    assert choice_list.choice_index('a') == 2
+
+
+def test_benchmark_5k_choices(app):
+    # before: `cur_val in list(choice_values)` and `list(choice_values).index(cur_val)` per selection sync
+    items = [Item(i) for i in range(5000)]
+    names = [f'item {i}' for i in range(5000)]
+    choice_list = ChoiceList(choice_names=names, choice_values=items)
+    lookups = items[::50]
+
+    def scan():
+        for value in lookups:
+            if value in list(choice_list.choice_values):
+                list(choice_list.choice_values).index(value)
+
+    def indexed():
+        for value in lookups:
+            choice_list.choice_index(value)
+
+    scan_time = best_time(scan, repeat=3) / lookups.__len__()
+    index_time = best_time(indexed, repeat=3) / lookups.__len__()
+    print(f'\n5k choices: scan {scan_time * 1e6:.1f} us, index {index_time * 1e6:.2f} us per lookup')
+    assert all(choice_list.choice_index(value) == row * 50 for row, value in enumerate(lookups))
+    assert index_time * 10 < scan_time
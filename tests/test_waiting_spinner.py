@@ -0,0 +1,158 @@
+import time
+
+import pytest
+from PyQt5 import QtCore, QtWidgets
+
+from pyqt_info_tools.animation_clock import AnimationClock
+from pyqt_info_tools.info_base_class import CustomDialog
+from pyqt_info_tools.waiting_spinner import QtWaitingSpinner
+
+
+class RecordingSpinner(QtWaitingSpinner):
+    """
+    Spinner which records the painted regions.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.painted = []
+        super(RecordingSpinner, self).__init__(*args, **kwargs)
+
+    def paintEvent(self, event):
+        self.painted.append(event.region())
+        super(RecordingSpinner, self).paintEvent(event)
+
+
+def make_spinner(app, width=400, height=300, spinner_cls=QtWaitingSpinner):
+    parent = QtWidgets.QWidget()
+    parent.resize(width, height)
+    parent.show()
+    spinner = spinner_cls(parent)
+    spinner.start()
+    app.processEvents()
+    return parent, spinner
+
+
+def test_rotate_repaints_the_two_changed_dots(app):
+    parent, spinner = make_spinner(app, spinner_cls=RecordingSpinner)
+    try:
+        for _ in range(3):
+            spinner.painted.clear()
+            previous = spinner.i
+            spinner.rotate()
+            app.processEvents()
+            dirty = spinner._dotRects[previous].adjusted(-1, -1, 1, 1).united(
+                spinner._dotRects[spinner.i].adjusted(-1, -1, 1, 1))
+            assert spinner.painted
+            for region in spinner.painted:
+                assert dirty.contains(region.boundingRect())
+    finally:
+        spinner.stop()
+
+
+@pytest.mark.benchmark
+def test_benchmark_cpu_per_second(app):
+    # before: every frame filled the parent-sized backdrop and recomputed the dots; 20 frames per second
+    parent, spinner = make_spinner(app, 3840, 2160)
+    AnimationClock.instance().unregister(spinner)
+    frames = 40
+
+    def cpu_per_frame(step):
+        start = time.process_time()
+        for _ in range(frames):
+            step()
+            app.processEvents()
+        return (time.process_time() - start) / frames
+
+    def full_frame():
+        spinner.i = (spinner.i + 1) % spinner.n
+        spinner.update()
+
+    try:
+        cpu_per_frame(spinner.rotate)
+        full_time = cpu_per_frame(full_frame)
+        dirty_time = cpu_per_frame(spinner.rotate)
+    finally:
+        spinner.stop()
+    fps = 1000 / spinner._interval
+    print(f'\nspinner on 3840x2160: full repaint {full_time * fps:.3f}, dirty dots {dirty_time * fps:.3f} '
+          f'CPU s per wall s')
+    assert dirty_time < full_time
+
+
+def test_clock_skips_hidden_and_minimized_windows(app):
+    clock = AnimationClock.instance()
+    spinners = [make_spinner(app) for _ in range(5)]
+    try:
+        assert clock.active == 5
+        app.processEvents()
+        positions = [spinner.i for _, spinner in spinners]
+        time.sleep(spinners[0][1]._interval / 1000)
+        clock.tick()
+        assert clock.stats()['exposed'] == 5
+        assert [spinner.i for _, spinner in spinners] == [(i + 1) % 10 for i in positions]
+
+        spinners[0][1].hide()
+        spinners[1][0].showMinimized()
+        app.processEvents()
+        clock.reset_stats()
+        clock.tick()
+        stats = clock.stats()
+        assert (stats['active'], stats['exposed'], stats['ticks'], stats['skipped']) == (5, 3, 1, 2)
+    finally:
+        for _, spinner in spinners:
+            spinner.stop()
+    assert clock.active == 0
+    assert not clock._timer.isActive()
+
+
+def test_one_timer_for_five_spinners(app):
+    clock = AnimationClock.instance()
+    spinners = [make_spinner(app) for _ in range(5)]
+    try:
+        assert all(not spinner.findChildren(QtCore.QTimer) for _, spinner in spinners)
+        assert clock._timer.isActive()
+        time.sleep(spinners[0][1]._interval / 1000)
+        clock.reset_stats()
+        clock.tick()
+        stats = clock.stats()
+        assert (stats['ticks'], stats['animation_ticks']) == (1, 5)
+    finally:
+        for _, spinner in spinners:
+            spinner.stop()
+
+
+@pytest.mark.benchmark
+def test_benchmark_one_timer_for_five_spinners(app):
+    # before: every spinner had its own QTimer, so five spinners took five timer callbacks per frame
+    clock = AnimationClock.instance()
+    spinners = [make_spinner(app) for _ in range(5)]
+    clock.reset_stats()
+    start = time.perf_counter()
+    while time.perf_counter() - start < 0.5:
+        app.processEvents(QtCore.QEventLoop.AllEvents, 10)
+    stats = clock.stats()
+    for _, spinner in spinners:
+        spinner.stop()
+    print(f'\n5 spinners for 0.5 s: {stats["ticks"]} timer ticks, {stats["animation_ticks"]} animation steps')
+    assert stats['ticks'] > 0
+    assert stats['animation_ticks'] >= 4 * stats['ticks']
+
+
+def test_dialog_creates_the_spinner_on_first_use(app):
+    dialog = CustomDialog()
+    dialog.show()
+    dialog.resize(300, 200)
+    app.processEvents()
+    assert dialog.findChildren(QtWaitingSpinner) == []
+
+    dialog.start_process()
+    spinners = dialog.findChildren(QtWaitingSpinner)
+    assert (spinners, dialog.spinner.isSpinning()) == ([dialog.spinner], True)
+    dialog.resize(400, 300)
+    app.processEvents()
+    # the visible spinner follows the size of the dialog
+    assert dialog.spinner.size() == dialog.size()
+    dialog.finished_process()
+    assert not dialog.spinner.isSpinning()
+    assert dialog.findChildren(QtWaitingSpinner) == spinners
+    dialog.close()